@@ -0,0 +1,174 @@
+"""Approximate nearest-neighbour search over job vectors, on the CPU with NumPy.
+
+Used as the first stage of job matching on large catalogs: sparse job
+vectors are reduced with a random projection and grouped into an inverted
+file (IVF) of k-means clusters. A query probes the closest clusters and
+returns a few thousand candidate positions, which the caller rescores
+exactly. Vectors can be added after training without rebuilding.
+"""
+import copy
+from typing import List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+
+class SparseProjection:
+    """Random projection from a growing sparse feature space to ``dim`` dense dims.
+
+    Each input feature contributes +-1/sqrt(nnz) to ``nnz`` random output
+    dimensions, which preserves inner products in expectation. Rows are
+    generated in seeded blocks, so the projection of a feature never changes
+    when new features are added later.
+    """
+
+    BLOCK = 1024
+
+    def __init__(self, dim: int = 256, nnz: int = 8, seed: int = 0):
+        self.dim = dim
+        self.nnz = nnz
+        self.seed = seed
+        self._blocks: List[sparse.csr_matrix] = []
+        self._matrix = sparse.csr_matrix((0, dim), dtype=np.float32)
+
+    def copy(self) -> "SparseProjection":
+        """A projection with the same rows that grows independently of this one"""
+        projection = copy.copy(self)
+        projection._blocks = list(self._blocks)
+        return projection
+
+    def _block(self, number: int) -> sparse.csr_matrix:
+        rng = np.random.default_rng([self.seed, number])
+        columns = rng.integers(0, self.dim, size=(self.BLOCK, self.nnz))
+        signs = rng.choice(np.array([-1.0, 1.0], dtype=np.float32), size=(self.BLOCK, self.nnz))
+        indptr = np.arange(0, self.BLOCK * self.nnz + 1, self.nnz)
+        return sparse.csr_matrix(
+            (signs.ravel() / np.sqrt(self.nnz), columns.ravel(), indptr), shape=(self.BLOCK, self.dim)
+        )
+
+    def matrix(self, n_features: int) -> sparse.csr_matrix:
+        """The ``n_features x dim`` projection matrix"""
+        if self._matrix.shape[0] < n_features:
+            while len(self._blocks) * self.BLOCK < n_features:
+                self._blocks.append(self._block(len(self._blocks)))
+            self._matrix = sparse.vstack(self._blocks, format='csr')
+        return self._matrix[:n_features]
+
+    def project(self, vectors) -> np.ndarray:
+        """Project a sparse or dense ``n x n_features`` matrix"""
+        projected = vectors @ self.matrix(vectors.shape[1])
+        return np.asarray(projected.todense() if sparse.issparse(projected) else projected, dtype=np.float32)
+
+
+class IVFIndex:
+    """Inverted file of spherical k-means clusters for maximum inner product search"""
+
+    def __init__(self, n_lists: int, seed: int = 0, train_size: int = 50_000, iterations: int = 10):
+        self.n_lists = max(1, n_lists)
+        self.seed = seed
+        self.train_size = train_size
+        self.iterations = iterations
+        self.centroids: Optional[np.ndarray] = None
+        self._size = 0
+        # Ids and vectors of each cluster, in chunks until the next search
+        self._lists: List[List[Tuple[np.ndarray, np.ndarray]]] = []
+
+    def __len__(self) -> int:
+        return self._size
+
+    def copy(self) -> "IVFIndex":
+        """An index with the same centroids and vectors that grows independently of this one"""
+        index = copy.copy(self)
+        index._lists = [list(chunks) for chunks in self._lists]
+        return index
+
+    @staticmethod
+    def _normalize(vectors: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+    def _assign(self, vectors: np.ndarray, batch: int = 4096) -> np.ndarray:
+        normalized = self._normalize(vectors)
+        return np.concatenate([
+            np.argmax(normalized[start:start + batch] @ self.centroids.T, axis=1)
+            for start in range(0, len(normalized), batch)
+        ]) if len(normalized) else np.zeros(0, dtype=np.int64)
+
+    def train(self, vectors: np.ndarray) -> None:
+        """Fit the cluster centroids on (a sample of) ``vectors``, emptying the index"""
+        if not len(vectors):
+            raise ValueError("Cannot train an IVF index without vectors")
+        rng = np.random.default_rng(self.seed)
+        sample = vectors
+        if len(sample) > self.train_size:
+            sample = vectors[rng.choice(len(vectors), self.train_size, replace=False)]
+        sample = self._normalize(sample)
+        n_lists = min(self.n_lists, len(sample))
+        self.centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+
+        for _ in range(self.iterations):
+            labels = self._assign(sample)
+            members = sparse.csr_matrix(
+                (np.ones(len(sample), dtype=np.float32), (labels, np.arange(len(sample)))),
+                shape=(len(self.centroids), len(sample)),
+            )
+            sums = np.asarray(members @ sample)
+            empty = np.flatnonzero(~sums.any(axis=1))
+            # Re-seed empty clusters with random points
+            sums[empty] = sample[rng.choice(len(sample), len(empty))]
+            self.centroids = self._normalize(sums)
+        self.n_lists = len(self.centroids)
+        self._lists = [[] for _ in range(self.n_lists)]
+        self._size = 0
+
+    def add(self, vectors: np.ndarray) -> np.ndarray:
+        """Append vectors, returning their ids (consecutive from ``len(self)``)"""
+        if self.centroids is None:
+            raise RuntimeError("IVFIndex must be trained before vectors are added")
+        vectors = np.asarray(vectors, dtype=np.float32)
+        ids = np.arange(self._size, self._size + len(vectors))
+        self._size += len(vectors)
+
+        labels = self._assign(vectors)
+        order = np.argsort(labels, kind='stable')
+        boundaries = np.flatnonzero(np.diff(labels[order])) + 1
+        for group in np.split(order, boundaries):
+            if len(group):
+                self._lists[labels[group[0]]].append((ids[group], vectors[group]))
+        return ids
+
+    def _list(self, number: int) -> Tuple[np.ndarray, np.ndarray]:
+        chunks = self._lists[number]
+        if len(chunks) > 1:
+            # Compact incremental additions so each list is scored with one product
+            chunks[:] = [(np.concatenate([ids for ids, _ in chunks]), np.concatenate([block for _, block in chunks]))]
+        return chunks[0] if chunks else (np.zeros(0, dtype=np.int64), np.zeros((0, self.centroids.shape[1]), np.float32))
+
+    def search(
+        self, query: np.ndarray, n_candidates: int, n_probe: Optional[int] = None, probe_factor: int = 8
+    ) -> np.ndarray:
+        """Ids of up to ``n_candidates`` vectors with the largest inner product.
+
+        Without ``n_probe``, clusters are probed best first until they hold
+        at least ``probe_factor`` times ``n_candidates`` vectors.
+        """
+        if self.centroids is None or not self._size:
+            return np.zeros(0, dtype=np.int64)
+        order = np.argsort(-(self.centroids @ query))
+        if n_probe is not None:
+            order = order[:n_probe]
+
+        probed_ids, probed_scores = [], []
+        collected = 0
+        for number in order:
+            ids, block = self._list(number)
+            probed_ids.append(ids)
+            probed_scores.append(block @ query)
+            collected += len(ids)
+            if n_probe is None and collected >= probe_factor * n_candidates:
+                break
+        ids = np.concatenate(probed_ids)
+        if len(ids) > n_candidates:
+            scores = np.concatenate(probed_scores)
+            ids = ids[np.argpartition(-scores, n_candidates - 1)[:n_candidates]]
+        return ids
@@ -0,0 +1,156 @@
+"""Helpers for bulk resume ingestion: expanding uploads and ZIP archives into
+individual files, and running their parses with bounded concurrency.
+"""
+import asyncio
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+from datetime import date
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, List, NamedTuple
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from file_formats import (
+    SUPPORTED_EXTENSIONS, UNKNOWN_CONTENT_DETAIL, UNSUPPORTED_FORMAT_DETAIL, sniff_format
+)
+from parse_cache import read_upload
+
+# Caps that keep a single bulk request (and any ZIP bomb in it) bounded
+BULK_MAX_FILES = int(os.environ.get('BULK_MAX_FILES', 5000))
+BULK_MAX_FILE_BYTES = int(os.environ.get('BULK_MAX_FILE_BYTES', 20 * 1024 * 1024))
+
+
+class BulkFile(NamedTuple):
+    filename: str
+    content: bytes = b""
+    content_hash: str = ""
+    error: str = ""
+
+
+def _is_zip(filename: str, content: bytes) -> bool:
+    # DOCX files are ZIP packages too
+    if filename.lower().endswith('.zip'):
+        return True
+    return content[:4] == b"PK\x03\x04" and sniff_format(filename, content) is None
+
+
+def _check_file(filename: str, content: bytes, content_hash: str = "") -> BulkFile:
+    if len(content) > BULK_MAX_FILE_BYTES:
+        return BulkFile(filename, error="File is too large")
+    if sniff_format(filename, content) is None:
+        return BulkFile(filename, error=UNKNOWN_CONTENT_DETAIL)
+    return BulkFile(filename, content, content_hash or hashlib.sha256(content).hexdigest())
+
+
+def expand_zip(archive_name: str, content: bytes) -> Iterable[BulkFile]:
+    """Yield the supported resume files inside a ZIP archive, one at a time"""
+    try:
+        archive = zipfile.ZipFile(io.BytesIO(content))
+    except zipfile.BadZipFile:
+        yield BulkFile(archive_name, error="Invalid ZIP archive")
+        return
+
+    with archive:
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            name = f"{archive_name}/{info.filename}"
+            if not info.filename.lower().endswith(SUPPORTED_EXTENSIONS):
+                yield BulkFile(name, error=UNSUPPORTED_FORMAT_DETAIL)
+                continue
+            if info.file_size > BULK_MAX_FILE_BYTES:
+                yield BulkFile(name, error="File is too large")
+                continue
+            yield _check_file(name, archive.read(info))
+
+
+async def spool_uploads(files: List[UploadFile]) -> List[UploadFile]:
+    """Copy uploads into files owned by the caller.
+
+    FastAPI closes request uploads as soon as the endpoint returns, which is
+    before a streaming response has read them.
+    """
+    spooled = []
+    for upload in files:
+        spool = tempfile.SpooledTemporaryFile(max_size=1024 * 1024)
+        await run_in_threadpool(shutil.copyfileobj, upload.file, spool)
+        spool.seek(0)
+        spooled.append(UploadFile(file=spool, filename=upload.filename))
+    return spooled
+
+
+async def iter_bulk_files(files: List[UploadFile]) -> AsyncIterator[BulkFile]:
+    """Yield every resume file in a bulk upload, expanding ZIP archives.
+
+    At most BULK_MAX_FILES files are yielded; the rest are reported as errors.
+    """
+    count = 0
+    for upload in files:
+        content, content_hash = await read_upload(upload)
+        if _is_zip(upload.filename, content):
+            entries: Iterable[BulkFile] = expand_zip(upload.filename, content)
+        elif not upload.filename.lower().endswith(SUPPORTED_EXTENSIONS):
+            entries = [BulkFile(upload.filename, error=UNSUPPORTED_FORMAT_DETAIL)]
+        else:
+            entries = [_check_file(upload.filename, content, content_hash)]
+
+        for entry in entries:
+            if not entry.error:
+                count += 1
+                if count > BULK_MAX_FILES:
+                    entry = BulkFile(entry.filename, error=f"Bulk upload is limited to {BULK_MAX_FILES} files")
+            yield entry
+
+
+async def bounded_map(
+    func: Callable[[Any], Awaitable[Any]],
+    items: AsyncIterator[Any],
+    concurrency: int,
+) -> AsyncIterator[Any]:
+    """Apply ``func`` to items with at most ``concurrency`` calls in flight.
+
+    Results are yielded in completion order. Items are pulled from the
+    iterator only when a slot frees up, so memory stays bounded by the
+    concurrency rather than by the number of items.
+    """
+    concurrency = max(1, concurrency)
+    in_flight: set = set()
+    exhausted = False
+    iterator = items.__aiter__()
+
+    try:
+        while in_flight or not exhausted:
+            while not exhausted and len(in_flight) < concurrency:
+                try:
+                    item = await iterator.__anext__()
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                in_flight.add(asyncio.ensure_future(func(item)))
+
+            if not in_flight:
+                break
+            done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        # The consumer stopped early (e.g. the client disconnected)
+        for task in in_flight:
+            task.cancel()
+
+
+def _json_value(value: Any) -> Any:
+    # ISO 8601 as FastAPI encodes responses, so exports match the listing
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+def ndjson_line(payload: Any) -> bytes:
+    """Encode one NDJSON record; datetimes become ISO 8601, other values str()"""
+    return (json.dumps(payload, default=_json_value) + "\n").encode("utf-8")
@@ -0,0 +1,79 @@
+"""Scoring every stored resume against the whole job catalog.
+
+Resumes are read through one Mongo cursor in batches, projected to the
+fields scoring reads. Each batch is ranked with a single
+``JobIndex.rank_batch`` call in a worker thread while the next batch is
+fetched, and the top matches are yielded one resume at a time. At most two
+batches of resumes and one jobs x batch score matrix are held at once,
+however many resumes are stored.
+"""
+import asyncio
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from starlette.concurrency import run_in_threadpool
+
+from job_index import JobIndex
+from models import ResumeData
+from resume_repository import MATCH_FIELDS, ResumeRepository
+
+
+async def iter_resume_batches(
+    resumes: ResumeRepository, batch_size: int, query=None
+) -> AsyncIterator[List[ResumeData]]:
+    """Stored resumes in lists of up to ``batch_size``, from one cursor"""
+    batch: List[ResumeData] = []
+    async for doc in resumes.find(query, MATCH_FIELDS, batch_size=batch_size):
+        batch.append(ResumeData(**doc))
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def batch_top_matches(
+    index: JobIndex, resumes: List[ResumeData], top_k: int, min_score: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """One record per resume with its ``top_k`` best jobs, best first"""
+    records = []
+    for resume, (positions, scores) in zip(resumes, index.rank_batch(resumes, top_k, min_score)):
+        records.append({
+            "resume_id": resume.id,
+            "name": resume.name,
+            "matches": [
+                {
+                    "job_id": index.jobs[position].id,
+                    "title": index.jobs[position].title,
+                    "company": index.jobs[position].company,
+                    "match_score": float(score),
+                }
+                for position, score in zip(positions, scores)
+            ],
+        })
+    return records
+
+
+async def stream_bulk_matches(
+    index: JobIndex, resumes: ResumeRepository, top_k: int, min_score: Optional[float] = None, batch_size: int = 256
+) -> AsyncIterator[Dict[str, Any]]:
+    """Top matches of every stored resume, then a summary record"""
+    start = time.perf_counter()
+    scored = 0
+    batches = iter_resume_batches(resumes, batch_size).__aiter__()
+    fetching = asyncio.ensure_future(batches.__anext__())
+    try:
+        while True:
+            try:
+                batch = await fetching
+            except StopAsyncIteration:
+                break
+            # Fetch the next batch while this one is scored
+            fetching = asyncio.ensure_future(batches.__anext__())
+            for record in await run_in_threadpool(batch_top_matches, index, batch, top_k, min_score):
+                yield record
+            scored += len(batch)
+    finally:
+        # The consumer stopped early (e.g. the client disconnected)
+        fetching.cancel()
+    yield {"summary": {"resumes": scored, "jobs": len(index), "seconds": round(time.perf_counter() - start, 3)}}
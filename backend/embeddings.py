@@ -0,0 +1,221 @@
+"""Sentence embeddings of job descriptions, an optional semantic score.
+
+With ``EMBEDDING_MODEL`` set, the semantic half of the match score is the
+cosine similarity between a resume's embedding and each job's, instead of
+their TF-IDF cosine. Job embeddings are encoded on CPU in batches and kept
+in a float32 file that every worker memory-maps read-only, so the catalog is
+held once in the page cache and a restart does not encode it again. Rows are
+keyed by job ID and a digest of the job's text: only new or changed jobs are
+encoded, and their rows are appended. Stale rows are dropped by rewriting
+the file once they outnumber the live ones.
+
+``hashing`` selects a small hashed n-gram encoder that needs no model files,
+for tests and offline development.
+"""
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from job_index import job_text
+from models import JobListing
+
+logger = logging.getLogger(__name__)
+
+
+class HashingEncoder:
+    """Stand-in model: hashed word unigrams and bigrams, L2-normalized"""
+
+    def __init__(self, dim: int = 256):
+        self.dim = dim
+        self.name = f"hashing-{dim}"
+        self._vectorizer = HashingVectorizer(n_features=dim, ngram_range=(1, 2), alternate_sign=False)
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        return self._vectorizer.transform(list(texts)).toarray().astype(np.float32)
+
+
+class SentenceTransformerEncoder:
+    """A sentence-transformers model loaded from a local directory, run on CPU"""
+
+    def __init__(self, path: str, batch_size: int = 64):
+        # Optional dependency, only needed when a model path is configured
+        from sentence_transformers import SentenceTransformer
+
+        self.model = SentenceTransformer(path, device='cpu')
+        self.dim = self.model.get_sentence_embedding_dimension()
+        self.name = Path(path).name
+        self.batch_size = batch_size
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        return self.model.encode(
+            list(texts),
+            batch_size=self.batch_size,
+            convert_to_numpy=True,
+            normalize_embeddings=True,
+            show_progress_bar=False,
+        ).astype(np.float32)
+
+
+def load_encoder(spec: str, batch_size: int = 64):
+    """``hashing`` or ``hashing:<dim>`` for the stand-in, else a model directory"""
+    if spec == 'hashing' or spec.startswith('hashing:'):
+        _, _, dim = spec.partition(':')
+        return HashingEncoder(int(dim) if dim else 256)
+    return SentenceTransformerEncoder(spec, batch_size)
+
+
+def text_digest(text: str) -> str:
+    return hashlib.sha256(text.encode()).hexdigest()[:16]
+
+
+class JobEmbeddings:
+    """Embeddings of one job catalog, rows in a shared memory-mapped file"""
+
+    def __init__(self, encoder, vectors: np.ndarray, rows: np.ndarray, store: Optional["EmbeddingStore"] = None):
+        self.encoder = encoder
+        # Store the embeddings were synced from, to sync added jobs
+        self.store = store
+        # Every row of the file, including stale ones
+        self.vectors = vectors
+        # Row of each job, in catalog order
+        self.rows = rows
+        self._contiguous = np.array_equal(rows, np.arange(len(rows)))
+
+    @property
+    def name(self) -> str:
+        return self.encoder.name
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        return self.encoder.encode(texts)
+
+    def row(self, position: int) -> np.ndarray:
+        return np.asarray(self.vectors[self.rows[position]])
+
+    def scores(self, queries: np.ndarray, positions: Optional[np.ndarray] = None) -> np.ndarray:
+        """Cosine similarity of each job with one query, or with each row of a queries matrix"""
+        if positions is not None:
+            products = self.vectors[self.rows[positions]] @ queries.T
+        elif self._contiguous:
+            products = self.vectors[:len(self.rows)] @ queries.T
+        else:
+            # Scanning the stale rows too is cheaper than gathering the live ones
+            products = (self.vectors @ queries.T)[self.rows]
+        return products.astype(np.float64)
+
+
+class EmbeddingStore:
+    """Job embeddings of one encoder, persisted under ``directory``.
+
+    ``sync`` is safe to call from several processes at once; they take turns
+    under a file lock and the later ones find the catalog already encoded.
+    """
+
+    def __init__(self, directory, encoder, batch_size: int = 256):
+        self.encoder = encoder
+        self.directory = Path(directory) / re.sub(r'[^\w.-]+', '_', encoder.name)
+        self.batch_size = batch_size
+        self._vectors_path = self.directory / 'embeddings.f32'
+        self._index_path = self.directory / 'index.json'
+        self.encoded = 0
+
+    @classmethod
+    def from_env(cls, directory) -> Optional["EmbeddingStore"]:
+        """Store for EMBEDDING_MODEL and EMBEDDING_BATCH_SIZE, None when no model is configured"""
+        spec = os.environ.get('EMBEDDING_MODEL')
+        if not spec:
+            return None
+        batch_size = int(os.environ.get('EMBEDDING_BATCH_SIZE', 64))
+        return cls(os.environ.get('EMBEDDING_STORE_DIR', directory), load_encoder(spec, batch_size))
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        with open(self.directory / '.lock', 'w') as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read_index(self) -> Dict:
+        empty = {"dim": self.encoder.dim, "rows": 0, "jobs": {}}
+        try:
+            with open(self._index_path) as f:
+                index = json.load(f)
+            size = self._vectors_path.stat().st_size
+        except FileNotFoundError:
+            return empty
+        if size != index["rows"] * index["dim"] * 4:
+            # An interrupted write; start over rather than map misaligned rows
+            logger.warning(f"Embedding store {self.directory} is inconsistent, re-encoding")
+            return empty
+        return index
+
+    def _write_index(self, index: Dict) -> None:
+        temporary = self._index_path.with_suffix('.tmp')
+        with open(temporary, 'w') as f:
+            json.dump(index, f)
+        os.replace(temporary, self._index_path)
+
+    def _append(self, texts: List[str], start: int) -> None:
+        mode = 'ab' if start else 'wb'
+        with open(self._vectors_path, mode) as f:
+            for batch in range(0, len(texts), self.batch_size):
+                vectors = self.encoder.encode(texts[batch:batch + self.batch_size])
+                f.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+        self.encoded += len(texts)
+
+    def _compact(self, index: Dict, jobs: Sequence[JobListing]) -> Dict:
+        """Rewrite the file with only the rows of ``jobs``, in catalog order"""
+        old = np.memmap(self._vectors_path, dtype=np.float32, mode='r', shape=(index["rows"], index["dim"]))
+        temporary = self._vectors_path.with_suffix('.tmp')
+        entries = {}
+        with open(temporary, 'wb') as f:
+            for start in range(0, len(jobs), 4096):
+                batch = jobs[start:start + 4096]
+                f.write(np.ascontiguousarray(old[[index["jobs"][job.id][0] for job in batch]]).tobytes())
+                for row, job in enumerate(batch, start):
+                    entries[job.id] = [row, index["jobs"][job.id][1]]
+        del old
+        # Workers still mapping the old file keep reading it until their next sync
+        os.replace(temporary, self._vectors_path)
+        return {"dim": index["dim"], "rows": len(jobs), "jobs": entries}
+
+    def sync(self, jobs: Sequence[JobListing]) -> JobEmbeddings:
+        """Embeddings of ``jobs``, encoding the ones not stored with their current text"""
+        jobs = list(jobs)
+        digests = [text_digest(job_text(job)) for job in jobs]
+        with self._lock():
+            index = self._read_index()
+            stale = [
+                position for position, (job, digest) in enumerate(zip(jobs, digests))
+                if index["jobs"].get(job.id, [None, None])[1] != digest
+            ]
+            if stale:
+                logger.info(f"Encoding {len(stale)} of {len(jobs)} jobs with {self.encoder.name}")
+                self._append([job_text(jobs[position]) for position in stale], index["rows"])
+                for row, position in enumerate(stale, index["rows"]):
+                    index["jobs"][jobs[position].id] = [row, digests[position]]
+                index["rows"] += len(stale)
+            if index["rows"] > 2 * max(len(jobs), 1024):
+                index = self._compact(index, jobs)
+                self._write_index(index)
+            elif stale:
+                self._write_index(index)
+            rows = np.asarray([index["jobs"][job.id][0] for job in jobs], dtype=np.int64)
+            vectors = self._map(index)
+        return JobEmbeddings(self.encoder, vectors, rows, self)
+
+    def _map(self, index: Dict) -> np.ndarray:
+        if not index["rows"]:
+            return np.zeros((0, index["dim"]), dtype=np.float32)
+        return np.memmap(self._vectors_path, dtype=np.float32, mode='r', shape=(index["rows"], index["dim"]))
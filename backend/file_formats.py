@@ -0,0 +1,251 @@
+"""Upload format detection and the lightweight text extractors.
+
+Uploads are routed on their leading bytes rather than on the filename alone,
+so an unreadable file is rejected before pdfplumber or any other extractor runs.
+Plain text, Markdown, HTML and RTF resumes are converted with the standard
+library only.
+"""
+import re
+from html.parser import HTMLParser
+from typing import List, Optional, Tuple
+
+PDF = 'pdf'
+DOCX = 'docx'
+RTF = 'rtf'
+HTML = 'html'
+MARKDOWN = 'markdown'
+TEXT = 'text'
+
+SUPPORTED_EXTENSIONS = ('.pdf', '.docx', '.txt', '.md', '.markdown', '.html', '.htm', '.rtf')
+UNSUPPORTED_FORMAT_DETAIL = "Only PDF, DOCX, TXT, Markdown, HTML and RTF files are supported"
+UNKNOWN_CONTENT_DETAIL = "File content is not a supported document format"
+
+# Bytes inspected when sniffing; enough for every signature below
+SNIFF_BYTES = 4096
+
+# Signatures of common non-resume files, rejected without further checks
+_BINARY_SIGNATURES = (
+    b"\xd0\xcf\x11\xe0",  # OLE2: legacy .doc, .xls
+    b"\x89PNG", b"\xff\xd8\xff", b"GIF8", b"BM", b"\x1f\x8b", b"7z\xbc\xaf",
+    b"Rar!", b"MZ", b"\x7fELF",
+)
+# Control characters that never appear in text documents
+_BINARY_BYTES = bytes(set(range(32)) - {9, 10, 12, 13})
+
+
+def _extension(filename: str) -> str:
+    dot = filename.rfind('.')
+    return filename[dot:].lower() if dot >= 0 else ""
+
+
+def is_text(head: bytes) -> bool:
+    """True when ``head`` looks like UTF-8 or single-byte encoded text"""
+    if head.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return True  # UTF-16 with a byte order mark
+    if not head.strip():
+        return False
+    control = len(head) - len(head.translate(None, _BINARY_BYTES))
+    return control * 100 <= len(head)
+
+
+def sniff_format(filename: str, content: bytes) -> Optional[str]:
+    """Return the format of an upload, or None when it cannot be parsed.
+
+    The content decides between PDF, DOCX, RTF and text; the extension only
+    tells Markdown and HTML apart from plain text. Text uploaded under a
+    .pdf or .docx name is accepted as text.
+    """
+    head = content[:SNIFF_BYTES]
+    if b"%PDF-" in head[:1024]:
+        return PDF
+    if head.startswith(b"PK\x03\x04"):
+        # Word packages always contain this part name, stored uncompressed
+        return DOCX if b"word/document.xml" in content else None
+    if head.startswith(b"{\\rtf"):
+        return RTF
+    if head.startswith(_BINARY_SIGNATURES) or not is_text(head):
+        return None
+
+    extension = _extension(filename)
+    if extension in ('.html', '.htm'):
+        return HTML
+    if extension in ('.md', '.markdown'):
+        return MARKDOWN
+    start = head[:1024].lstrip().lower()
+    if start.startswith((b"<!doctype html", b"<html")) or b"<body" in start:
+        return HTML
+    return TEXT
+
+
+def decode_text(content: bytes) -> str:
+    """Decode text bytes: UTF-16 with a BOM, UTF-8, else Windows-1252"""
+    if content.startswith((b"\xff\xfe", b"\xfe\xff")):
+        return content.decode('utf-16', errors='replace')
+    try:
+        return content.decode('utf-8-sig')
+    except UnicodeDecodeError:
+        return content.decode('cp1252', errors='replace')
+
+
+def extract_text_from_plain(content: bytes) -> str:
+    return decode_text(content).strip()
+
+
+_MD_FENCE = re.compile(r'^[ \t]*(```|~~~).*$', re.MULTILINE)
+_MD_HEADING = re.compile(r'^[ \t]{0,3}#{1,6}[ \t]+(.*?)[ \t]*#*[ \t]*$', re.MULTILINE)
+_MD_RULE = re.compile(r'^[ \t]{0,3}([-*_=])([ \t]*\1){2,}[ \t]*$', re.MULTILINE)
+_MD_QUOTE = re.compile(r'^[ \t]{0,3}>[ \t]?', re.MULTILINE)
+_MD_BULLET = re.compile(r'^([ \t]*)[-*+][ \t]+', re.MULTILINE)
+# Inline patterns stop at the next opening marker or line break and within a
+# bounded length, so unclosed markers cost a bounded scan each rather than a
+# rescan of the rest of the text
+_MD_IMAGE = re.compile(r'!\[([^\[\]\n]{0,500})\]\([^()\n]{0,2000}\)')
+_MD_LINK = re.compile(r'\[([^\[\]\n]{1,500})\]\([^()\n]{0,2000}\)')
+_MD_EMPHASIS = re.compile(r'(\*\*|__|\*|`)(?=\S)([^*`\n]{1,200}?)(?<=\S)\1')
+
+
+def extract_text_from_markdown(content: bytes) -> str:
+    """Strip Markdown syntax, keeping headings on lines of their own"""
+    return strip_markdown(decode_text(content))
+
+
+def strip_markdown(text: str) -> str:
+    text = _MD_FENCE.sub('', text)
+    text = _MD_RULE.sub('', text)
+    text = _MD_HEADING.sub(r'\1', text)
+    text = _MD_QUOTE.sub('', text)
+    text = _MD_BULLET.sub(r'\1', text)
+    text = _MD_IMAGE.sub(r'\1', text)
+    text = _MD_LINK.sub(r'\1', text)
+    text = _MD_EMPHASIS.sub(r'\2', text)
+    return text.strip()
+
+
+class _HTMLTextParser(HTMLParser):
+    """Collects visible text, breaking lines at block-level elements"""
+
+    BLOCK_TAGS = {
+        'address', 'article', 'aside', 'blockquote', 'br', 'dd', 'div', 'dl', 'dt',
+        'footer', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'header', 'hr', 'li', 'main',
+        'nav', 'ol', 'p', 'pre', 'section', 'table', 'tr', 'ul',
+    }
+    CELL_TAGS = {'td', 'th'}
+    HIDDEN_TAGS = {'head', 'script', 'style', 'noscript', 'template', 'svg'}
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.parts: List[str] = []
+        self.hidden = 0
+
+    def handle_starttag(self, tag, attrs):
+        if tag in self.HIDDEN_TAGS:
+            self.hidden += 1
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append('\n')
+        elif tag in self.CELL_TAGS:
+            self.parts.append(' ')
+
+    def handle_endtag(self, tag):
+        if tag in self.HIDDEN_TAGS:
+            self.hidden = max(self.hidden - 1, 0)
+        elif tag in self.BLOCK_TAGS:
+            self.parts.append('\n')
+
+    def handle_data(self, data):
+        if not self.hidden:
+            # Source line breaks inside an element are just whitespace
+            self.parts.append(' '.join(data.split()) if data.strip() else ' ')
+
+
+def extract_text_from_html(content: bytes) -> str:
+    parser = _HTMLTextParser()
+    parser.feed(decode_text(content))
+    parser.close()
+    text = ''.join(parser.parts)
+    return re.sub(r'[ \t]*\n\s*', '\n', text).strip()
+
+
+# Groups whose content is metadata rather than document text
+_RTF_DESTINATIONS = {
+    'fonttbl', 'colortbl', 'stylesheet', 'info', 'pict', 'object', 'header', 'footer',
+    'headerl', 'headerr', 'headerf', 'footerl', 'footerr', 'footerf', 'listtable',
+    'listoverridetable', 'revtbl', 'rsidtbl', 'generator', 'xmlnstbl', 'themedata',
+    'colorschememapping', 'datastore', 'latentstyles', 'filetbl', 'fldinst', 'nonshppict',
+}
+_RTF_SPECIAL = {
+    'par': '\n', 'line': '\n', 'sect': '\n', 'page': '\n', 'row': '\n',
+    'tab': '\t', 'cell': ' ', 'emdash': '\u2014', 'endash': '\u2013', 'bullet': '\u2022',
+    'lquote': '\u2018', 'rquote': '\u2019', 'ldblquote': '\u201c', 'rdblquote': '\u201d',
+    'emspace': ' ', 'enspace': ' ', 'qmspace': ' ',
+}
+_RTF_TOKEN = re.compile(
+    r"\\([a-z]{1,32})(-?\d{1,10})? ?"  # control word with optional parameter
+    r"|\\'([0-9a-fA-F]{2})"           # hex-escaped byte
+    r"|\\([^a-z])"                     # control symbol
+    r"|([{}])"
+    r"|[\r\n]+"
+    r"|([^\\{}\r\n]+)"
+)
+
+
+def extract_text_from_rtf(content: bytes) -> str:
+    """Convert RTF to plain text, skipping font tables, pictures and other metadata"""
+    source = content.decode('latin-1')
+    out: List[str] = []
+    stack: List[Tuple[bool, int]] = []
+    ignorable = False
+    unicode_skip = 1  # Fallback characters that follow each \uN
+    skip = 0
+    group_start = False  # The previous token opened a group
+
+    for match in _RTF_TOKEN.finditer(source):
+        word, arg, hex_byte, symbol, brace, text = match.groups()
+        opened = False
+        if brace == '{':
+            stack.append((ignorable, unicode_skip))
+            opened = True
+            skip = 0
+        elif brace == '}':
+            if stack:
+                ignorable, unicode_skip = stack.pop()
+            skip = 0
+        elif symbol is not None:
+            if symbol == '*':
+                ignorable = True
+            elif not ignorable:
+                if symbol in '\\{}':
+                    out.append(symbol)
+                elif symbol == '~':
+                    out.append('\u00a0')
+                elif symbol == '_':
+                    out.append('-')
+                elif symbol in '\r\n':
+                    out.append('\n')
+        elif word is not None:
+            if group_start and word in _RTF_DESTINATIONS:
+                ignorable = True
+            elif word == 'uc':
+                unicode_skip = int(arg or 1)
+            elif ignorable:
+                pass
+            elif word == 'u':
+                codepoint = int(arg or 0)
+                out.append(chr(codepoint + 0x10000 if codepoint < 0 else codepoint))
+                skip = unicode_skip
+            elif word in _RTF_SPECIAL:
+                out.append(_RTF_SPECIAL[word])
+        elif hex_byte is not None:
+            if skip:
+                skip -= 1
+            elif not ignorable:
+                out.append(bytes([int(hex_byte, 16)]).decode('cp1252', errors='replace'))
+        elif text is not None:
+            if skip:
+                consumed = min(skip, len(text))
+                text = text[consumed:]
+                skip -= consumed
+            if text and not ignorable:
+                out.append(text)
+        group_start = opened
+
+    return ''.join(out).strip()
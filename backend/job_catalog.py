@@ -0,0 +1,220 @@
+"""Job catalog stored in Mongo, with an in-memory snapshot per worker.
+
+Jobs are written by importers outside the API. Every write takes the next
+value of the ``jobs`` counter document and stores it on the job as ``seq``,
+with ``deleted: false``; deleted jobs are kept as tombstones (``deleted:
+true``) so that the deletion has a ``seq`` too. A worker's snapshot is at
+the highest ``seq`` it has applied, and ``refresh`` reads the counter and,
+only when it moved, the jobs written since. Matching therefore never
+queries the jobs collection per request, and callers learn whether the
+change was a pure append (which a JobIndex can take incrementally) or
+replaced or removed jobs (which needs a rebuild).
+
+A write can land after writes that took later sequence numbers. Refreshes
+re-read the last ``REFRESH_LOOKBACK`` sequence numbers below the version,
+so a write is applied as long as fewer than that many later numbers were
+taken before it landed. Past that bound, added and deleted jobs are still
+caught: after every read, the numbers of stored and of live jobs are
+compared with the snapshot, and a mismatch reloads the whole catalog. A replacement of an
+existing job that lands later than the bound is only applied by the next
+full load, so importers must write each job right after taking its number.
+
+``/api/jobs`` listing queries the collection directly, on the indexed
+filter fields.
+"""
+import asyncio
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+from pymongo import ReturnDocument
+
+from models import JobListing
+
+logger = logging.getLogger(__name__)
+
+# Fields /api/jobs filters on, each with its own index
+FILTER_FIELDS = ("location", "experience_level", "company")
+
+# Newest first; id breaks ties between jobs created in the same instant
+LIST_ORDER = [("created_at", -1), ("id", 1)]
+
+# Sequence numbers re-read below the snapshot's version on every refresh, so
+# that a write which took its number before another writer's but landed
+# after it is not missed (see the module docstring for the bound)
+REFRESH_LOOKBACK = 256
+
+
+class CatalogChanges(NamedTuple):
+    """What a refresh applied to the snapshot"""
+    # New jobs, appended to the end of the snapshot in this order
+    added: List[JobListing]
+    # True when existing jobs were replaced or removed
+    rebuild: bool
+
+
+class JobCatalog:
+    """The jobs collection and this worker's snapshot of it"""
+
+    def __init__(self, collection, counters, check_interval: float = 5.0):
+        self.collection = collection
+        self.counters = counters
+        # Seconds between counter reads by ``run``
+        self.check_interval = check_interval
+        self.jobs: List[JobListing] = []
+        self._positions: Dict[str, int] = {}
+        # IDs of every stored job applied, tombstones included
+        self._known: Set[str] = set()
+        # Highest seq applied to the snapshot, 0 before the first load
+        self.version = 0
+        self._wakeup = asyncio.Event()
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    async def ensure_indexes(self) -> None:
+        await self.collection.create_index("id", unique=True)
+        await self.collection.create_index("seq")
+        await self.collection.create_index("created_at")
+        for field in FILTER_FIELDS:
+            await self.collection.create_index(field)
+
+    async def _next_seq(self, count: int = 1) -> int:
+        """Reserve ``count`` sequence numbers and return the last one"""
+        counter = await self.counters.find_one_and_update(
+            {"_id": "jobs"}, {"$inc": {"seq": count}}, upsert=True, return_document=ReturnDocument.AFTER
+        )
+        return counter["seq"]
+
+    async def seed(self, jobs: Sequence[JobListing]) -> bool:
+        """Store ``jobs`` if the catalog is empty; True when they were stored.
+
+        Jobs are inserted by ID, so workers seeding at the same time store
+        each job once.
+        """
+        if await self.collection.count_documents({}, limit=1):
+            return False
+        last = await self._next_seq(len(jobs))
+        for seq, job in enumerate(jobs, last - len(jobs) + 1):
+            await self.collection.update_one(
+                {"id": job.id}, {"$setOnInsert": {**job.dict(), "seq": seq, "deleted": False}}, upsert=True
+            )
+        return True
+
+    async def refresh(self) -> Optional[CatalogChanges]:
+        """Apply the jobs written since the snapshot's version; None when nothing changed"""
+        counter = await self.counters.find_one({"_id": "jobs"})
+        if not counter or counter["seq"] <= self.version:
+            return None
+
+        added: List[JobListing] = []
+        rebuild = False
+        version = self.version
+        query = {"seq": {"$gt": max(self.version - REFRESH_LOOKBACK, 0)}}
+        async for doc in self.collection.find(query, {"_id": 0}, sort=[("seq", 1)]):
+            version = max(version, doc.pop("seq"))
+            deleted = doc.pop("deleted", False)
+            self._known.add(doc["id"])
+            position = self._positions.get(doc["id"])
+            if position is not None:
+                job = JobListing(**doc)
+                if not deleted and job == self.jobs[position]:
+                    # Applied by an earlier refresh
+                    continue
+                rebuild = True
+                if deleted:
+                    del self._positions[doc["id"]]
+                    self.jobs[position] = None
+                else:
+                    self.jobs[position] = job
+            elif not deleted:
+                self._positions[doc["id"]] = len(self.jobs)
+                job = JobListing(**doc)
+                self.jobs.append(job)
+                added.append(job)
+        if rebuild:
+            self.jobs = [job for job in self.jobs if job is not None]
+            self._positions = {job.id: position for position, job in enumerate(self.jobs)}
+        self.version = version
+        if (
+            await self.collection.count_documents({}) != len(self._known)
+            or await self.collection.count_documents({"deleted": False}) != len(self.jobs)
+        ):
+            # A job added or deleted too late for the look-back window (or right now)
+            reloaded, replaced = await self._reconcile()
+            added += reloaded
+            rebuild = rebuild or replaced
+        if not added and not rebuild:
+            # Only jobs already applied, or the counter moved ahead of jobs not written yet
+            return None
+        return CatalogChanges(added, rebuild)
+
+    async def _reconcile(self) -> Tuple[List[JobListing], bool]:
+        """Bring the snapshot up to every stored job; returns the jobs added and whether others changed"""
+        stored: Dict[str, JobListing] = {}
+        self._known = set()
+        async for doc in self.collection.find({}, {"_id": 0, "seq": 0}, sort=[("seq", 1)]):
+            self._known.add(doc["id"])
+            if not doc.pop("deleted", False):
+                stored[doc["id"]] = JobListing(**doc)
+        replaced = any(stored.get(job.id) != job for job in self.jobs)
+        if replaced:
+            self.jobs = [stored[job.id] for job in self.jobs if job.id in stored]
+        added = [job for job_id, job in stored.items() if job_id not in self._positions]
+        self.jobs.extend(added)
+        self._positions = {job.id: position for position, job in enumerate(self.jobs)}
+        logger.warning(f"Reloaded the job catalog after a late write: {len(added)} jobs added, replaced={replaced}")
+        return added, replaced
+
+    async def run(self, on_change) -> None:
+        """Refresh forever, calling ``on_change(changes)`` after every change.
+
+        Checks the counter every ``check_interval`` seconds, or right away
+        after a ``notify``.
+        """
+        while True:
+            try:
+                changes = await self.refresh()
+                if changes is not None:
+                    await on_change(changes)
+            except Exception as e:
+                logger.warning(f"Could not refresh job catalog: {e}")
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), self.check_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wakeup.clear()
+
+    def notify(self) -> None:
+        self._wakeup.set()
+
+    async def watch(self) -> None:
+        """Refresh as soon as any worker writes, from a change stream.
+
+        Change streams need a replica set; without one this raises and
+        ``run`` keeps polling.
+        """
+        async with self.collection.watch() as stream:
+            async for _ in stream:
+                self.notify()
+
+    async def query(
+        self,
+        filters: Dict[str, Any],
+        offset: int,
+        limit: int,
+        created_after: Optional[datetime] = None,
+    ) -> Tuple[List[JobListing], int]:
+        """One page of stored jobs matching ``filters`` exactly, newest first, and the number of matches"""
+        query: Dict[str, Any] = {"deleted": False}
+        query.update({field: value for field, value in filters.items() if field in FILTER_FIELDS and value})
+        if created_after is not None:
+            query["created_at"] = {"$gte": created_after}
+        total = await self.collection.count_documents(query)
+        jobs = [
+            JobListing(**doc)
+            async for doc in self.collection.find(
+                query, {"_id": 0, "seq": 0, "deleted": 0}, sort=LIST_ORDER, skip=offset, limit=limit
+            )
+        ]
+        return jobs, total
@@ -0,0 +1,672 @@
+"""Precomputed job index used to score resumes against the whole catalog.
+
+The TF-IDF vocabulary and IDF weights are fitted once over every job, and the
+L2-normalized job vectors are kept as one sparse matrix. Job requirements are
+mapped to canonical skill keys and stored as a jobs x skills incidence matrix.
+Scoring a resume is then one transform and two matrix-vector products,
+instead of fitting a vectorizer and comparing skill strings per job.
+
+The combined score is an inner product between the resume and each job's
+concatenated TF-IDF and normalized skill rows. For large catalogs,
+``build_ann`` indexes a random projection of those rows so that only a few
+thousand candidates are rescored exactly per query.
+
+Given ``JobEmbeddings`` (see embeddings.py), the semantic similarity is the
+cosine between sentence embeddings instead. The TF-IDF vectors are still
+fitted, for reverse matching and for the fingerprint's vocabulary.
+"""
+import copy
+import hashlib
+import json
+import logging
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from ann_index import IVFIndex, SparseProjection
+from models import JobListing, JobMatch, ResumeData, SkillGain
+from skill_taxonomy import SkillTaxonomy
+
+logger = logging.getLogger(__name__)
+
+# Similarity used when the catalog has no usable vocabulary
+FALLBACK_SIMILARITY = 0.5
+
+# Weights of the TF-IDF similarity and the share of requirements covered
+SEMANTIC_WEIGHT = 0.6
+SKILL_WEIGHT = 0.4
+
+# Match scores above which a job is a "Great fit" or a "Good potential match"
+GREAT_FIT_SCORE = 70
+GOOD_FIT_SCORE = 50
+
+# Per-job digests (128 bits) are summed modulo this into the catalog version
+DIGEST_MODULUS = 2 ** 128
+
+Score = Union[float, np.ndarray]
+
+
+def combine_scores(semantic_similarity: Score, skill_match_ratio: Score) -> Score:
+    """Overall match score in [0, 100]; works on scalars and arrays alike"""
+    return (semantic_similarity * SEMANTIC_WEIGHT + skill_match_ratio * SKILL_WEIGHT) * 100
+
+
+def build_job_match(
+    job: JobListing, match_score: float, matching_skills: List[str], missing_skills: List[str]
+) -> JobMatch:
+    # Generate recommendations
+    recommendations = []
+    if missing_skills:
+        recommendations.append(f"Consider learning: {', '.join(missing_skills[:3])}")
+    if match_score > GREAT_FIT_SCORE:
+        recommendations.append("Great fit! Consider applying.")
+    elif match_score > GOOD_FIT_SCORE:
+        recommendations.append("Good potential match with some skill development.")
+    else:
+        recommendations.append("Focus on building relevant skills for this role.")
+    
+    return JobMatch(
+        job=job,
+        match_score=float(match_score),
+        matching_skills=matching_skills,
+        missing_skills=missing_skills[:5],
+        recommendations=recommendations
+    )
+
+
+def job_text(job: JobListing) -> str:
+    return job.description + " " + " ".join(job.requirements)
+
+
+def resume_text(resume: ResumeData) -> str:
+    """Resume skills and experience descriptions, the text matched against jobs"""
+    return " ".join(resume.skills) + " " + " ".join([exp.get("description", "") for exp in resume.experience])
+
+
+def top_positions(scores: np.ndarray, k: int, min_score: Optional[float] = None) -> np.ndarray:
+    """Positions of the ``k`` highest scores, best first.
+
+    Uses a linear-time partial selection rather than sorting every score.
+    Ties are broken by position, which is what a stable sort of the whole
+    list would give.
+    """
+    positions = np.arange(len(scores)) if min_score is None else np.flatnonzero(scores >= min_score)
+    k = max(k, 0)
+    if k < len(positions):
+        values = scores[positions]
+        kth = np.partition(values, len(values) - k)[len(values) - k] if k else np.inf
+        above = positions[values > kth]
+        ties = positions[values == kth][:k - len(above)]
+        positions = np.concatenate([above, ties])
+    return positions[np.lexsort((positions, -scores[positions]))]
+
+
+class ResumeSkills(NamedTuple):
+    """A resume's skills expressed in a JobIndex's skill key space"""
+    skills: List[str]
+    # Key id of each skill, -1 when no job in the index requires it
+    key_ids: List[int]
+    # 1.0 for every key the resume has
+    vector: np.ndarray
+
+
+class JobScores(NamedTuple):
+    """Per-job scores for one resume, in catalog order"""
+    semantic: np.ndarray
+    # Number of each job's requirements the resume covers
+    matched: np.ndarray
+    skill_ratio: np.ndarray
+    match_score: np.ndarray
+
+
+class WhatIfScores(NamedTuple):
+    """Scores of a resume before and after adding skills to it"""
+    before: JobScores
+    after: JobScores
+    before_skills: ResumeSkills
+    after_skills: ResumeSkills
+
+
+class JobIndex:
+    """TF-IDF vectors and skill incidence for a fixed list of jobs"""
+
+    def __init__(self, jobs: Sequence[JobListing], taxonomy: SkillTaxonomy, embeddings=None):
+        self.jobs: List[JobListing] = list(jobs)
+        self.taxonomy = taxonomy
+        # Sentence embeddings replacing the TF-IDF similarity, None for TF-IDF
+        self.embeddings = embeddings
+        self._positions: Dict[str, int] = {job.id: position for position, job in enumerate(self.jobs)}
+        # Canonical skill ID, or normalized text for requirements outside the
+        # taxonomy, mapped to a column of the incidence matrix
+        self._key_ids: Dict[str, int] = {}
+        # Display name of each key: the canonical name, or the first requirement seen
+        self._key_names: List[str] = []
+        # One entry per requirement, in each job's original order
+        self._requirement_keys = np.zeros(0, dtype=np.int32)
+        self._requirement_indptr = np.zeros(1, dtype=np.int64)
+        self._add_skills(self.jobs)
+        model = f":{embeddings.name}" if embeddings is not None else ""
+        self._version_base = taxonomy.checksum + model
+        self._jobs_digest = sum(map(self._job_digest, self.jobs)) % DIGEST_MODULUS
+        # Column-major copies of the TF-IDF and incidence matrices, see what_if
+        self._columns: Optional[Tuple[Optional[sparse.csc_matrix], sparse.csc_matrix]] = None
+        self._fit_text()
+        self.version = self._catalog_version()
+        # Stage one of two-stage matching, see build_ann
+        self.ann: Optional[IVFIndex] = None
+        self.ann_candidates = 0
+
+    def _fit_text(self) -> None:
+        # Digest of the jobs the vocabulary and IDF were fitted on
+        self._fit_digest = self._jobs_digest
+        self.vectorizer = TfidfVectorizer(dtype=np.float32)
+        try:
+            # Rows are L2-normalized, so a dot product is the cosine similarity
+            self.matrix = self.vectorizer.fit_transform([job_text(job) for job in self.jobs]).tocsr()
+        except ValueError as e:
+            # No jobs, or no terms in any of them
+            logger.warning(f"Job index has no vocabulary: {e}")
+            self.matrix = None
+
+    def _add_skills(self, jobs: Sequence[JobListing]) -> None:
+        requirement_keys: List[int] = []
+        indptr: List[int] = []
+        for job in jobs:
+            for requirement in job.requirements:
+                key = self.taxonomy.skill_key(requirement)
+                if key not in self._key_ids:
+                    self._key_ids[key] = len(self._key_ids)
+                    self._key_names.append(self.taxonomy.canonical_name(requirement))
+                requirement_keys.append(self._key_ids[key])
+            indptr.append(len(self._requirement_keys) + len(requirement_keys))
+
+        self._requirement_keys = np.concatenate([self._requirement_keys, np.asarray(requirement_keys, dtype=np.int32)])
+        self._requirement_indptr = np.concatenate([self._requirement_indptr, np.asarray(indptr, dtype=np.int64)])
+        self.requirement_counts = np.diff(self._requirement_indptr).astype(np.float64)
+        # Jobs x skill keys; duplicate requirements within a job are summed
+        self.incidence = sparse.csr_matrix(
+            (np.ones(len(self._requirement_keys), dtype=np.float32), self._requirement_keys, self._requirement_indptr),
+            shape=(len(self.jobs), len(self._key_ids)),
+        )
+
+    @staticmethod
+    def _job_digest(job: JobListing) -> int:
+        digest = hashlib.sha256(json.dumps([job.id, job.description, job.requirements]).encode())
+        return int.from_bytes(digest.digest()[:16], "big")
+
+    def _catalog_version(self) -> str:
+        """Catalog version: a digest of everything that affects scores.
+
+        Job digests are summed, so the version depends only on the set of
+        jobs, the taxonomy, the model and, for TF-IDF scoring, the set of
+        jobs the vectorizer was fitted on, not on the order the jobs were
+        indexed in; every worker holding the same catalog and fit shares the
+        persisted match cache. Jobs appended without a refit keep the old
+        vocabulary and IDF, so their version differs from a rebuild's.
+        """
+        fit = f":{self._fit_digest:032x}" if self.embeddings is None else ""
+        digest = hashlib.sha256(f"{self._version_base}:{self._jobs_digest:032x}{fit}".encode())
+        return digest.hexdigest()[:16]
+
+    def add_jobs(self, jobs: Iterable[JobListing]) -> None:
+        """Append jobs without refitting the vocabulary.
+
+        Terms first seen in the new jobs are ignored until the index is
+        rebuilt; new skills get columns of their own straight away.
+        """
+        jobs = list(jobs)
+        for job in jobs:
+            if job.id in self._positions:
+                raise ValueError(f"Job {job.id} is already indexed")
+            self._positions[job.id] = len(self.jobs)
+            self.jobs.append(job)
+        start = len(self.jobs) - len(jobs)
+        self._add_skills(jobs)
+        self._columns = None
+        if jobs:
+            self._jobs_digest = (self._jobs_digest + sum(map(self._job_digest, jobs))) % DIGEST_MODULUS
+        if self.matrix is None:
+            self._fit_text()
+        elif jobs:
+            rows = self.vectorizer.transform([job_text(job) for job in jobs])
+            self.matrix = sparse.vstack([self.matrix, rows], format='csr')
+        self.version = self._catalog_version()
+        if self.embeddings is not None and jobs:
+            self.embeddings = self.embeddings.store.sync(self.jobs)
+        if self.ann is not None and jobs:
+            self.ann.add(self._ann_vectors(start))
+
+    def appended(self, jobs: Iterable[JobListing]) -> "JobIndex":
+        """A copy of the index with ``jobs`` added as by ``add_jobs``.
+
+        This index is left as it was, so scoring against it in other threads
+        can go on while the copy is built.
+        """
+        index = copy.copy(self)
+        index.jobs = list(self.jobs)
+        index._positions = dict(self._positions)
+        index._key_ids = dict(self._key_ids)
+        index._key_names = list(self._key_names)
+        if self.ann is not None:
+            index.ann = self.ann.copy()
+            index._text_projection = self._text_projection.copy()
+            index._skill_projection = self._skill_projection.copy()
+        index.add_jobs(jobs)
+        return index
+
+    def build_ann(self, n_candidates: int = 2000, n_lists: Optional[int] = None, seed: int = 0) -> None:
+        """Rank only ``n_candidates`` approximate neighbours per query from now on.
+
+        Jobs are clustered into ``n_lists`` inverted lists (4 * sqrt(jobs) by
+        default). Candidates are rescored exactly, so the scores returned are
+        the same as without the ANN index; only recall is approximate.
+        """
+        if not self.jobs:
+            raise ValueError("Cannot build an ANN index over an empty catalog")
+        if self.embeddings is not None:
+            raise ValueError("ANN candidates are drawn from TF-IDF rows, not embeddings")
+        self._text_projection = SparseProjection(seed=seed)
+        self._skill_projection = SparseProjection(seed=seed + 1)
+        vectors = self._ann_vectors(0)
+        ann = IVFIndex(n_lists or int(4 * np.sqrt(len(self.jobs))), seed=seed)
+        ann.train(vectors)
+        ann.add(vectors)
+        self.ann, self.ann_candidates = ann, n_candidates
+
+    def _ann_vectors(self, start: int) -> np.ndarray:
+        """Projected text and skill rows of the jobs from ``start`` on"""
+        counts = np.maximum(self.requirement_counts[start:], 1)
+        vectors = self._skill_projection.project(sparse.diags(1 / counts) @ self.incidence[start:])
+        if self.matrix is not None:
+            vectors += self._text_projection.project(self.matrix[start:])
+        return vectors
+
+    def candidates(self, vector: Optional[np.ndarray], profile: ResumeSkills, count: int) -> np.ndarray:
+        """Positions of approximately the ``count`` best jobs, in catalog order"""
+        query = SKILL_WEIGHT * self._skill_projection.project(profile.vector[np.newaxis])[0]
+        if vector is not None:
+            query += SEMANTIC_WEIGHT * self._text_projection.project(vector[np.newaxis])[0]
+        return np.sort(self.ann.search(query, count))
+
+    def __len__(self) -> int:
+        return len(self.jobs)
+
+    def position(self, job_id: str) -> Optional[int]:
+        return self._positions.get(job_id)
+
+    def resume_vector(self, resume: ResumeData) -> Optional[np.ndarray]:
+        """Sentence embedding of a resume, or its dense TF-IDF vector in the catalog's vocabulary"""
+        if self.embeddings is not None:
+            return self.embeddings.encode([resume_text(resume)])[0]
+        if self.matrix is None:
+            return None
+        return self.vectorizer.transform([resume_text(resume)]).toarray().ravel()
+
+    def _semantic(self, vector: Optional[np.ndarray], positions: Optional[np.ndarray] = None) -> np.ndarray:
+        """Similarity of a resume_vector with every job, or with the jobs at ``positions``"""
+        if vector is None:
+            return np.full(len(self.jobs) if positions is None else len(positions), FALLBACK_SIMILARITY)
+        if self.embeddings is not None:
+            return self.embeddings.scores(vector, positions)
+        matrix = self.matrix if positions is None else self.matrix[positions]
+        return (matrix @ vector).astype(np.float64)
+
+    def semantic_scores(self, resume: ResumeData) -> np.ndarray:
+        """Cosine similarity between a resume and every job, in catalog order"""
+        return self._semantic(self.resume_vector(resume))
+
+    def similarity(self, resume: ResumeData, job: JobListing) -> float:
+        """Cosine similarity for a single job, which need not be in the index"""
+        vector = self.resume_vector(resume)
+        if vector is None:
+            return FALLBACK_SIMILARITY
+        position = self._positions.get(job.id)
+        if self.embeddings is not None:
+            row = self.embeddings.row(position) if position is not None else self.embeddings.encode([job_text(job)])[0]
+            return float(row @ vector)
+        row = self.matrix[position] if position is not None else self.vectorizer.transform([job_text(job)])
+        return float((row @ vector)[0])
+
+    def fingerprint(self, resume: ResumeData) -> str:
+        """Digest of the parts of a resume that scoring reads.
+
+        Resumes with the same skills and the same words in their experience,
+        in any order, share a fingerprint and therefore the same scores.
+        Embeddings depend on word order, so with them the text is kept as is.
+        """
+        keys = sorted({self.taxonomy.skill_key(skill) for skill in resume.skills})
+        if self.embeddings is not None:
+            terms = resume_text(resume)
+        else:
+            terms = sorted(self.vectorizer.build_analyzer()(resume_text(resume)))
+        return hashlib.sha256(json.dumps([keys, terms]).encode()).hexdigest()
+
+    def resume_skills(self, skills: Iterable[str]) -> ResumeSkills:
+        skills = list(skills)
+        key_ids = [self._key_ids.get(self.taxonomy.skill_key(skill), -1) for skill in skills]
+        vector = np.zeros(len(self._key_ids), dtype=np.float32)
+        vector[[key_id for key_id in key_ids if key_id >= 0]] = 1.0
+        return ResumeSkills(skills, key_ids, vector)
+
+    def _score(
+        self, vector: Optional[np.ndarray], profile: ResumeSkills, positions: Optional[np.ndarray] = None
+    ) -> JobScores:
+        incidence = self.incidence if positions is None else self.incidence[positions]
+        counts = self.requirement_counts if positions is None else self.requirement_counts[positions]
+        semantic = self._semantic(vector, positions)
+        matched = (incidence @ profile.vector).astype(np.float64)
+        skill_ratio = matched / np.maximum(counts, 1)
+        return JobScores(semantic, matched, skill_ratio, combine_scores(semantic, skill_ratio))
+
+    def score(self, resume: ResumeData) -> Tuple[JobScores, ResumeSkills]:
+        """Score a resume against every job at once"""
+        profile = self.resume_skills(resume.skills)
+        return self._score(self.resume_vector(resume), profile), profile
+
+    def skill_details(self, position: int, profile: ResumeSkills) -> Tuple[List[str], List[str]]:
+        """Matching resume skills and missing requirements for one job"""
+        job = self.jobs[position]
+        keys = self._requirement_keys[self._requirement_indptr[position]:self._requirement_indptr[position + 1]]
+        missing = [requirement for requirement, key in zip(job.requirements, keys) if not profile.vector[key]]
+        job_keys = set(keys.tolist())
+        matching = [skill for skill, key in zip(profile.skills, profile.key_ids) if key in job_keys]
+        return matching, missing
+
+    def build_match(self, position: int, match_score: float, profile: ResumeSkills) -> JobMatch:
+        matching, missing = self.skill_details(position, profile)
+        return build_job_match(self.jobs[position], match_score, matching, missing)
+
+    def matches(self, resume: ResumeData) -> List[JobMatch]:
+        """JobMatch for every job in the catalog, in catalog order"""
+        scores, profile = self.score(resume)
+        return [self.build_match(position, scores.match_score[position], profile) for position in range(len(self.jobs))]
+
+    def _column_matrices(self) -> Tuple[Optional[sparse.csc_matrix], sparse.csc_matrix]:
+        if self._columns is None:
+            text = self.matrix.tocsc() if self.matrix is not None else None
+            self._columns = (text, self.incidence.tocsc())
+        return self._columns
+
+    def _term_weights(self, text: str) -> Dict[int, float]:
+        """Unnormalized TF-IDF weight of each vocabulary column in ``text``"""
+        weights: Dict[int, float] = {}
+        vocabulary = self.vectorizer.vocabulary_
+        for term in self.vectorizer.build_analyzer()(text):
+            column = vocabulary.get(term)
+            if column is not None:
+                weights[column] = weights.get(column, 0.0) + 1.0
+        idf = self.vectorizer.idf_
+        return {column: count * idf[column] for column, count in weights.items()}
+
+    def what_if(self, resume: ResumeData, added_skills: Sequence[str]) -> WhatIfScores:
+        """Scores before and after appending ``added_skills`` to a resume.
+
+        Appending skills only adds terms to the resume text, so the new
+        TF-IDF products are the baseline products plus those of the added
+        terms, rescaled by the new vector norm. Likewise each newly covered
+        skill adds one incidence column to the matched counts. Only the
+        columns of the resume's and the added skills' terms are read.
+        Embeddings have no such decomposition, so both texts are encoded.
+        """
+        added_skills = list(added_skills)
+        before_skills = self.resume_skills(resume.skills)
+        after_skills = self.resume_skills(resume.skills + added_skills)
+        text_columns, skill_columns = self._column_matrices()
+
+        if self.embeddings is not None:
+            modified = ResumeData(skills=resume.skills + added_skills, experience=resume.experience)
+            vectors = self.embeddings.encode([resume_text(resume), resume_text(modified)])
+            semantic, after_semantic = self.embeddings.scores(vectors).T
+        elif text_columns is None:
+            semantic = after_semantic = np.full(len(self.jobs), FALLBACK_SIMILARITY)
+        else:
+            weights = self._term_weights(resume_text(resume))
+            added = self._term_weights(" ".join(added_skills))
+            products = self._column_products(text_columns, weights)
+            norm = np.sqrt(sum(weight * weight for weight in weights.values()))
+            semantic = products / norm if norm else products
+
+            combined = dict(weights)
+            for column, weight in added.items():
+                combined[column] = combined.get(column, 0.0) + weight
+            after_norm = np.sqrt(sum(weight * weight for weight in combined.values()))
+            after_products = products + self._column_products(text_columns, added)
+            after_semantic = after_products / after_norm if after_norm else after_products
+
+        matched = self._column_products(skill_columns, {key: 1.0 for key in np.flatnonzero(before_skills.vector)})
+        new_keys = np.flatnonzero(after_skills.vector - before_skills.vector)
+        after_matched = matched + self._column_products(skill_columns, {key: 1.0 for key in new_keys})
+
+        counts = np.maximum(self.requirement_counts, 1)
+        before = JobScores(semantic, matched, matched / counts, combine_scores(semantic, matched / counts))
+        after = JobScores(
+            after_semantic, after_matched, after_matched / counts, combine_scores(after_semantic, after_matched / counts)
+        )
+        return WhatIfScores(before, after, before_skills, after_skills)
+
+    def _column_products(self, columns: sparse.csc_matrix, weights: Dict[int, float]) -> np.ndarray:
+        """``columns @ x`` for a vector ``x`` given as {column: weight}, reading only those columns"""
+        result = np.zeros(columns.shape[0], dtype=np.float64)
+        for column, weight in weights.items():
+            start, end = columns.indptr[column], columns.indptr[column + 1]
+            result[columns.indices[start:end]] += weight * columns.data[start:end].astype(np.float64)
+        return result
+
+    def skill_gains(self, resume: ResumeData, include_taxonomy: bool = False) -> List[SkillGain]:
+        """What-if effect of each candidate skill on a resume, evaluated in one batch.
+
+        Candidates are the skills some job requires that the resume lacks,
+        plus every other taxonomy skill with ``include_taxonomy``. The added
+        terms of all candidates form one sparse vocabulary x candidates
+        matrix, so their TF-IDF products are a single sparse product. A job
+        can only gain, and so cross the "Great fit" threshold, where that
+        product or its incidence is non-zero; every other job just sees the
+        resume vector's norm grow. The work is proportional to those
+        non-zeros rather than to jobs x candidates. With embeddings every
+        candidate is encoded and scored against every job instead.
+        """
+        owned = {self.taxonomy.skill_key(skill) for skill in resume.skills}
+        names = [name for key, name in zip(self._key_ids, self._key_names) if key not in owned]
+        key_ids = [key_id for key, key_id in self._key_ids.items() if key not in owned]
+        if include_taxonomy:
+            for skill in self.taxonomy.skills:
+                if skill.id not in owned and skill.id not in self._key_ids:
+                    names.append(skill.name)
+                    key_ids.append(-1)
+        if not names or not self.jobs:
+            return []
+
+        count = len(names)
+        ratio = (self.incidence @ self.resume_skills(resume.skills).vector).astype(np.float64)
+        ratio /= np.maximum(self.requirement_counts, 1)
+        covered = self._covered(key_ids)
+        if self.embeddings is not None:
+            return self._embedding_gains(resume, names, ratio, covered)
+        if self.matrix is None:
+            # No vocabulary: the semantic term stays at its fallback value
+            products = np.full(len(self.jobs), FALLBACK_SIMILARITY)
+            norm = 1.0
+            added_products = sparse.csr_matrix((len(self.jobs), count))
+            new_norms = np.ones(count)
+        else:
+            weights = self._term_weights(resume_text(resume))
+            resume_vector = np.zeros(len(self.vectorizer.idf_))
+            resume_vector[list(weights)] = list(weights.values())
+            products = (self.matrix @ resume_vector).astype(np.float64)
+            norm = float(np.linalg.norm(resume_vector))
+
+            # Vocabulary x candidates matrix of the terms each candidate adds
+            rows, columns, values = [], [], []
+            for column, name in enumerate(names):
+                for row, weight in self._term_weights(name).items():
+                    rows.append(row)
+                    columns.append(column)
+                    values.append(weight)
+            added = sparse.csc_matrix((values, (rows, columns)), shape=(len(resume_vector), count))
+            added_products = (self.matrix @ added).astype(np.float64)
+            # |u + d|^2 = |u|^2 + 2 u.d + |d|^2 for each candidate's terms d
+            new_norms = np.sqrt(
+                norm * norm + 2 * (added.T @ resume_vector) + np.asarray(added.multiply(added).sum(axis=0)).ravel()
+            )
+        inverse_norm = 1 / norm if norm else 0.0
+        inverse_new_norms = np.divide(1, new_norms, out=np.zeros(count), where=new_norms > 0)
+        before = combine_scores(products * inverse_norm, ratio)
+
+        # Score gained over the rescaled baseline, non-zero only where terms or skills are added
+        gains = (
+            added_products @ sparse.diags(inverse_new_norms) * (SEMANTIC_WEIGHT * 100)
+            + sparse.diags(1 / np.maximum(self.requirement_counts, 1)) @ covered * (SKILL_WEIGHT * 100)
+        ).tocoo()
+        rows, columns = gains.row, gains.col
+        after = gains.data + SEMANTIC_WEIGHT * 100 * products[rows] * inverse_new_norms[columns] + SKILL_WEIGHT * 100 * ratio[rows]
+        improved = np.bincount(columns[after > before[rows]], minlength=count)
+        great_fit = np.bincount(
+            columns[(after > GREAT_FIT_SCORE) & (before[rows] <= GREAT_FIT_SCORE)], minlength=count
+        )
+
+        # Sum of every job's new score, for the average change
+        after_totals = (
+            SEMANTIC_WEIGHT * 100 * products.sum() * inverse_new_norms
+            + np.asarray(gains.tocsc().sum(axis=0)).ravel()
+            + SKILL_WEIGHT * 100 * ratio.sum()
+        )
+        average_gain = (after_totals - before.sum()) / len(self.jobs)
+        return [
+            SkillGain(
+                skill=name,
+                average_gain=float(average_gain[column]),
+                jobs_improved=int(improved[column]),
+                great_fit_jobs=int(great_fit[column]),
+            )
+            for column, name in enumerate(names)
+        ]
+
+    def _covered(self, key_ids: List[int]) -> sparse.csr_matrix:
+        """Jobs x candidates requirements each candidate skill key would cover (-1 for none)"""
+        valid = np.flatnonzero(np.asarray(key_ids) >= 0)
+        selection = sparse.csr_matrix(
+            (np.ones(len(valid)), (np.asarray(key_ids)[valid], valid)), shape=(len(self._key_ids), len(key_ids))
+        )
+        return self.incidence @ selection
+
+    def _embedding_gains(
+        self, resume: ResumeData, names: List[str], ratio: np.ndarray, covered: sparse.csr_matrix, batch_size: int = 64
+    ) -> List[SkillGain]:
+        """skill_gains with embeddings: every candidate's resume text is encoded and scored densely"""
+        counts = np.maximum(self.requirement_counts, 1)
+        before = combine_scores(self._semantic(self.resume_vector(resume)), ratio)
+        gains = []
+        for start in range(0, len(names), batch_size):
+            batch = names[start:start + batch_size]
+            texts = [
+                resume_text(ResumeData(skills=resume.skills + [name], experience=resume.experience)) for name in batch
+            ]
+            semantic = self.embeddings.scores(self.embeddings.encode(texts))
+            ratios = ratio[:, np.newaxis] + covered[:, start:start + len(batch)].toarray() / counts[:, np.newaxis]
+            after = combine_scores(semantic, ratios)
+            improved = np.count_nonzero(after > before[:, np.newaxis], axis=0)
+            great_fit = np.count_nonzero((after > GREAT_FIT_SCORE) & (before <= GREAT_FIT_SCORE)[:, np.newaxis], axis=0)
+            average_gain = after.mean(axis=0) - before.mean()
+            gains.extend(
+                SkillGain(
+                    skill=name,
+                    average_gain=float(average_gain[column]),
+                    jobs_improved=int(improved[column]),
+                    great_fit_jobs=int(great_fit[column]),
+                )
+                for column, name in enumerate(batch)
+            )
+        return gains
+
+    def sorted_matches(
+        self, scores: JobScores, profile: ResumeSkills, top_k: Optional[int] = None, offset: int = 0
+    ) -> List[JobMatch]:
+        """JobMatch for one page of jobs (every job by default), highest score first"""
+        count = len(self.jobs) if top_k is None else offset + top_k
+        return [
+            self.build_match(int(position), scores.match_score[position], profile)
+            for position in top_positions(scores.match_score, count)[offset:]
+        ]
+
+    def _score_best(
+        self, resume: ResumeData, count: int
+    ) -> Tuple[Optional[np.ndarray], JobScores, ResumeSkills]:
+        """Score the ANN candidates for the ``count`` best jobs, or every job.
+
+        Returns the positions scored (None for the whole catalog) with their
+        scores.
+        """
+        profile = self.resume_skills(resume.skills)
+        vector = self.resume_vector(resume)
+        positions = None
+        if self.ann is not None and count < len(self.jobs):
+            positions = self.candidates(vector, profile, max(self.ann_candidates, count))
+        return positions, self._score(vector, profile, positions), profile
+
+    def rank(self, resume: ResumeData, count: int) -> Tuple[np.ndarray, np.ndarray, int]:
+        """Positions and scores of the ``count`` best jobs, best first.
+
+        Also returns the number of jobs that were scored, which is smaller
+        than the catalog when ANN candidates were used.
+        """
+        positions, scores, _ = self._score_best(resume, count)
+        rows = top_positions(scores.match_score, count)
+        return rows if positions is None else positions[rows], scores.match_score[rows], len(scores.match_score)
+
+    def rank_batch(
+        self, resumes: Sequence[ResumeData], count: int, min_score: Optional[float] = None
+    ) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """Positions and scores of the ``count`` best jobs for each resume, best first.
+
+        The batch is scored as one jobs x resumes product of the text rows
+        and one of the skill rows, so the catalog is read once per batch
+        instead of once per resume. Every job is scored, even with an ANN
+        index; memory grows with jobs x len(resumes).
+        """
+        if not resumes:
+            return []
+        texts = [resume_text(resume) for resume in resumes]
+        if self.embeddings is not None:
+            semantic = self.embeddings.scores(self.embeddings.encode(texts))
+        elif self.matrix is not None:
+            # Only the columns of terms in the batch, with the batch dense over them
+            queries = self.vectorizer.transform(texts).tocsc()
+            columns = np.flatnonzero(np.diff(queries.indptr))
+            text_columns, _ = self._column_matrices()
+            semantic = (text_columns[:, columns].tocsr() @ queries[:, columns].T.toarray()).astype(np.float64)
+        else:
+            semantic = np.full((len(self.jobs), len(resumes)), FALLBACK_SIMILARITY)
+        # combine_scores in place: the skill term is only added where some requirement is covered
+        scores = semantic
+        scores *= SEMANTIC_WEIGHT * 100
+        profiles = sparse.csr_matrix(np.vstack([self.resume_skills(resume.skills).vector for resume in resumes]))
+        matched = (self.incidence @ profiles.T).tocoo()
+        weights = SKILL_WEIGHT * 100 / np.maximum(self.requirement_counts, 1)
+        scores[matched.row, matched.col] += matched.data * weights[matched.row]
+        # One contiguous row of scores per resume
+        scores = np.ascontiguousarray(scores.T)
+        results = []
+        for row in scores:
+            positions = top_positions(row, count, min_score)
+            results.append((positions, row[positions]))
+        return results
+
+    def top_matches(
+        self, resume: ResumeData, top_k: int, offset: int = 0, min_score: Optional[float] = None
+    ) -> Tuple[List[JobMatch], int]:
+        """One page of the best matches, highest score first.
+
+        Returns the page and the number of jobs scoring at least
+        ``min_score``. JobMatch objects are only built for the page. With an
+        ANN index only its candidates are scored, so the count covers the
+        candidates rather than the whole catalog.
+        """
+        positions, scores, profile = self._score_best(resume, offset + top_k)
+        total = len(scores.match_score) if min_score is None else int(np.count_nonzero(scores.match_score >= min_score))
+        page = top_positions(scores.match_score, offset + top_k, min_score)[offset:]
+        return [
+            self.build_match(int(row if positions is None else positions[row]), scores.match_score[row], profile)
+            for row in page
+        ], total
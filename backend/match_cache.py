@@ -0,0 +1,188 @@
+"""Cache of job rankings keyed by resume fingerprint and catalog version.
+
+Scoring depends only on a resume's skills and experience text and on the job
+catalog, so rankings are stored under (JobIndex.fingerprint, JobIndex.version).
+Resumes with identical skills share entries, and any change to the catalog or
+the skill taxonomy produces a new version, which older entries no longer match.
+Entries live in an in-process LRU in front of a Mongo collection, which other
+workers share and which expires entries ``ttl`` seconds after they were
+computed. Only job IDs and scores are stored; JobMatch objects are rebuilt for
+the requested page.
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+
+from job_index import JobIndex
+from models import JobMatch, ResumeData
+from parse_cache import LRUCache
+
+logger = logging.getLogger(__name__)
+
+
+class CachedRanking(BaseModel):
+    fingerprint: str
+    catalog_version: str
+    # Best jobs first; cut off at the cache depth on large catalogs
+    job_ids: List[str]
+    scores: List[float]
+    # Jobs scored to produce the ranking (the catalog, or the ANN candidates)
+    scored: int
+    compute_seconds: float
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+    @property
+    def complete(self) -> bool:
+        return len(self.job_ids) >= self.scored
+
+    def covers(self, depth: int) -> bool:
+        return self.complete or len(self.job_ids) >= depth
+
+    def page(
+        self, offset: int, top_k: int, min_score: Optional[float] = None
+    ) -> Optional[Tuple[List[str], List[float], int]]:
+        """Job IDs and scores of one page, and the number of jobs at or above ``min_score``.
+
+        Returns None when the ranking is cut off before it can answer.
+        """
+        end = offset + top_k
+        if min_score is None:
+            if not self.covers(end):
+                return None
+            total = self.scored
+        else:
+            total = int(np.count_nonzero(np.asarray(self.scores) >= min_score))
+            # Every cached job qualifies, so more may follow beyond the cut-off
+            if total == len(self.scores) and not self.complete:
+                return None
+            end = min(end, total)
+        return self.job_ids[offset:end], self.scores[offset:end], total
+
+
+def ranked_matches(index: JobIndex, resume: ResumeData, job_ids: List[str], scores: List[float]) -> List[JobMatch]:
+    """JobMatch objects for cached job IDs and scores, in the given order"""
+    profile = index.resume_skills(resume.skills)
+    return [index.build_match(index.position(job_id), score, profile) for job_id, score in zip(job_ids, scores)]
+
+
+def timed_rank(index: JobIndex, resume: ResumeData, depth: int) -> Tuple[Tuple[np.ndarray, np.ndarray, int], float]:
+    """``index.rank(resume, depth)`` and the seconds it took"""
+    start = time.perf_counter()
+    ranked = index.rank(resume, depth)
+    return ranked, time.perf_counter() - start
+
+
+class MatchCache:
+    """Two-tier (LRU + Mongo) cache of job rankings"""
+
+    def __init__(self, collection, max_entries: int = 1024, depth: int = 1000, ttl: int = 7 * 24 * 3600):
+        self.collection = collection
+        self.memory = LRUCache(max_entries)
+        # Jobs kept per ranking; deeper rankings are held in memory only
+        self.depth = depth
+        # Seconds a persisted ranking is kept, whatever its catalog version
+        self.ttl = ttl
+        self.catalog_version: Optional[str] = None
+        self.memory_hits = 0
+        self.persisted_hits = 0
+        self.misses = 0
+        self.compute_seconds = 0.0
+        self.saved_seconds = 0.0
+
+    async def ensure_indexes(self) -> None:
+        await self.collection.create_index([("fingerprint", 1), ("catalog_version", 1)], unique=True)
+        # Workers may be on different catalog versions for a while, so
+        # persisted rankings of older versions are left to expire rather
+        # than deleted
+        await self.collection.create_index("created_at", expireAfterSeconds=self.ttl)
+
+    def invalidate(self, catalog_version: str) -> None:
+        """Drop the in-memory rankings computed against another catalog version"""
+        self.memory.clear()
+        self.catalog_version = catalog_version
+
+    async def get(self, fingerprint: str, catalog_version: str, depth: int) -> Optional[CachedRanking]:
+        key = (fingerprint, catalog_version)
+        cached = self.memory.get(key)
+        if cached is not None and cached.covers(depth):
+            self.memory_hits += 1
+            return cached
+
+        try:
+            doc = await self.collection.find_one({"fingerprint": fingerprint, "catalog_version": catalog_version})
+        except Exception as e:
+            logger.warning(f"Could not read match cache: {e}")
+            return None
+        if not doc:
+            return None
+        doc.pop("_id", None)
+        cached = CachedRanking(**doc)
+        if not cached.covers(depth):
+            return None
+        self.persisted_hits += 1
+        self.memory.put(key, cached)
+        return cached
+
+    async def put(self, ranking: CachedRanking) -> None:
+        self.memory.put((ranking.fingerprint, ranking.catalog_version), ranking)
+        if len(ranking.job_ids) > self.depth:
+            return
+        try:
+            await self.collection.replace_one(
+                {"fingerprint": ranking.fingerprint, "catalog_version": ranking.catalog_version},
+                ranking.dict(),
+                upsert=True,
+            )
+        except Exception as e:
+            logger.warning(f"Could not persist match cache entry: {e}")
+
+    async def ranking(self, index: JobIndex, resume: ResumeData, depth: int = 0) -> CachedRanking:
+        """The resume's ranking in ``index``, at least ``depth`` jobs deep.
+
+        Served from the cache when possible; otherwise computed and stored.
+        """
+        if index.version != self.catalog_version:
+            self.invalidate(index.version)
+        depth = max(depth, self.depth)
+        fingerprint = index.fingerprint(resume)
+        cached = await self.get(fingerprint, index.version, depth)
+        if cached is not None:
+            self.saved_seconds += cached.compute_seconds
+            return cached
+
+        self.misses += 1
+        # Scoring the catalog (and encoding the resume, with embeddings)
+        # would stall the event loop
+        (positions, scores, scored), elapsed = await asyncio.to_thread(timed_rank, index, resume, depth)
+        self.compute_seconds += elapsed
+        ranking = CachedRanking(
+            fingerprint=fingerprint,
+            catalog_version=index.version,
+            job_ids=[index.jobs[position].id for position in positions],
+            scores=scores.tolist(),
+            scored=scored,
+            compute_seconds=elapsed,
+        )
+        await self.put(ranking)
+        return ranking
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self.memory_hits + self.persisted_hits
+        lookups = hits + self.misses
+        return {
+            "entries": len(self.memory),
+            "max_entries": self.memory.max_entries,
+            "catalog_version": self.catalog_version,
+            "hits": hits,
+            "memory_hits": self.memory_hits,
+            "persisted_hits": self.persisted_hits,
+            "misses": self.misses,
+            "hit_ratio": hits / lookups if lookups else 0.0,
+            "compute_seconds": self.compute_seconds,
+            "saved_seconds": self.saved_seconds,
+        }
@@ -0,0 +1,69 @@
+"""Pydantic models shared by the API and the resume parsing pipeline"""
+from pydantic import BaseModel, Field
+from typing import List, Dict, Any
+import uuid
+from datetime import datetime
+
+class ResumeData(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    name: str = ""
+    email: str = ""
+    phone: str = ""
+    skills: List[str] = []
+    experience: List[Dict[str, Any]] = []
+    education: List[Dict[str, Any]] = []
+    raw_text: str = ""
+    content_hash: str = ""  # SHA-256 of the uploaded file
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+class TextExtraction(BaseModel):
+    pages_read: int = 0
+    total_pages: int = 0
+    characters: int = 0
+    truncated: bool = False
+    truncation_reason: str = ""  # "pages", "chars" or "time" when truncated
+
+class JobListing(BaseModel):
+    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    title: str
+    company: str
+    description: str
+    requirements: List[str]
+    location: str = ""
+    salary_range: str = ""
+    experience_level: str = ""
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+class JobMatch(BaseModel):
+    job: JobListing
+    match_score: float
+    matching_skills: List[str]
+    missing_skills: List[str]
+    recommendations: List[str]
+
+class CandidateMatch(BaseModel):
+    resume_id: str
+    name: str
+    match_score: float
+    matching_skills: List[str]
+    missing_skills: List[str]
+
+class SkillGain(BaseModel):
+    skill: str
+    average_gain: float  # Mean match score change across the catalog
+    jobs_improved: int
+    great_fit_jobs: int  # Jobs that would cross the "Great fit" threshold
+
+class ResumeQARequest(BaseModel):
+    resume_id: str
+    question: str
+
+class ResumeQAResponse(BaseModel):
+    answer: str
+    suggestions: List[str] = []
+
+class CareerSuggestion(BaseModel):
+    career_path: str
+    current_fit: float
+    required_skills: List[str]
+    learning_resources: List[str]
@@ -0,0 +1,158 @@
+"""Content-addressed cache of parsed resumes.
+
+Uploads are keyed by the SHA-256 of their bytes. A hit returns the stored
+parse result, so identical files skip text extraction and parsing entirely.
+Entries live in a small in-process LRU in front of a Mongo collection with a
+unique index on the hash. Stored entries keep the resume's raw text
+zlib-compressed beside it, as the ResumeTextStore does, rather than inline.
+"""
+import hashlib
+import logging
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from fastapi import UploadFile
+from pydantic import BaseModel, Field
+
+from models import ResumeData, TextExtraction
+from resume_parser import PARSER_VERSION, SKILL_TAXONOMY
+from resume_text import CODEC, compress_text, decompress_text
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+class LRUCache:
+    """Size-bounded least-recently-used mapping with hit/miss counters"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max(0, max_entries)
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        try:
+            value = self._entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        if self.max_entries == 0:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        return self._entries.pop(key, default)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class CachedParse(BaseModel):
+    content_hash: str
+    parser_version: int = PARSER_VERSION
+    # Skills file the result was parsed with; a new vocabulary means a re-parse
+    skills_checksum: str = Field(default_factory=lambda: SKILL_TAXONOMY.get().checksum)
+    resume: ResumeData
+    extraction: TextExtraction
+    # Latest stored resume parsed from this content, used for deduplication
+    resume_id: str = ""
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+async def read_upload(file: UploadFile, chunk_size: int = UPLOAD_CHUNK_SIZE) -> Tuple[bytes, str]:
+    """Read an upload in chunks, hashing it as it streams in.
+
+    Returns the file content and its hex SHA-256 digest.
+    """
+    digest = hashlib.sha256()
+    chunks = []
+    while True:
+        chunk = await file.read(chunk_size)
+        if not chunk:
+            break
+        digest.update(chunk)
+        chunks.append(chunk)
+    return b"".join(chunks), digest.hexdigest()
+
+
+class ParseCache:
+    """Two-tier (LRU + Mongo) cache of parse results keyed by content hash"""
+
+    def __init__(self, collection, max_entries: int = 1024):
+        self.collection = collection
+        self.memory = LRUCache(max_entries)
+
+    async def ensure_indexes(self) -> None:
+        await self.collection.create_index("content_hash", unique=True)
+
+    def _doc(self, cached: CachedParse) -> Dict[str, Any]:
+        doc = cached.dict(exclude={"resume": {"raw_text"}})
+        doc["text_codec"] = CODEC
+        doc["text"] = compress_text(cached.resume.raw_text)
+        return doc
+
+    def _entry(self, doc: Dict[str, Any]) -> CachedParse:
+        doc.pop("_id", None)
+        text = doc.pop("text", None)
+        codec = doc.pop("text_codec", CODEC)
+        # Entries stored before the text was compressed hold it inline
+        if text is not None:
+            doc["resume"]["raw_text"] = decompress_text(text, codec)
+        return CachedParse(**doc)
+
+    async def get(self, content_hash: str) -> Optional[CachedParse]:
+        skills_checksum = SKILL_TAXONOMY.get().checksum
+        cached = self.memory.get(content_hash)
+        if cached is not None and cached.skills_checksum == skills_checksum:
+            return cached
+
+        try:
+            doc = await self.collection.find_one({"content_hash": content_hash})
+        except Exception as e:
+            logger.warning(f"Could not read parse cache: {e}")
+            return None
+        if not doc or doc.get("parser_version") != PARSER_VERSION:
+            return None
+        if doc.get("skills_checksum") != skills_checksum:
+            return None
+        cached = self._entry(doc)
+        self.memory.put(content_hash, cached)
+        return cached
+
+    async def put(self, cached: CachedParse) -> None:
+        self.memory.put(cached.content_hash, cached)
+        try:
+            await self.collection.replace_one(
+                {"content_hash": cached.content_hash}, self._doc(cached), upsert=True
+            )
+        except Exception as e:
+            # The in-process tier still holds the entry; a persist failure
+            # only costs a re-parse in other workers.
+            logger.warning(f"Could not persist parse cache entry: {e}")
@@ -0,0 +1,245 @@
+"""Process pool for the CPU-bound resume extraction and parsing pipeline.
+
+Upload handlers submit work here instead of calling pdfplumber and the parsers
+on the event loop, so one large resume no longer stalls every other request
+served by the same uvicorn worker.
+
+Workers report the tasks they start, with their process ID. A task still
+queued when it times out is skipped by the worker that later picks it up.
+A running task cannot be cancelled, so a task that overruns its timeout
+while running retires the whole executor: new tasks go to a fresh one, and
+the processes stuck on timed-out tasks are terminated once every task the
+old one was given has finished or timed out too. A document that hangs the
+parser therefore costs one timeout, not a worker and a queue slot for the
+life of the server.
+"""
+import asyncio
+import itertools
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Queue on which a pool worker reports (task ID, process ID) as it starts a task
+_started = None
+
+
+class ParsePoolBusy(Exception):
+    """Raised when the pool already holds its maximum number of pending tasks"""
+
+
+class ParsePoolTimeout(Exception):
+    """Raised when a task does not finish within the configured timeout"""
+
+
+def _init_worker(started) -> None:
+    global _started
+    _started = started
+
+
+def _run_task(task_id: int, deadline: float, func: Callable[..., Any], *args: Any) -> Any:
+    """Run ``func(*args)`` in a pool worker, unless it is picked up after ``deadline``.
+
+    The deadline falls a little before the caller's timeout, so that every
+    task still running at its timeout has been reported by then.
+    """
+    if time.time() >= deadline:
+        raise ParsePoolTimeout("Parse task timed out before it started")
+    _started.put((task_id, os.getpid()))
+    return func(*args)
+
+
+class _Workers:
+    """A process pool executor, and which of its processes runs which task"""
+
+    def __init__(self, max_workers: int):
+        context = multiprocessing.get_context('spawn')
+        self.started = context.Queue()
+        # Spawned workers import only the parsing modules, never the app,
+        # its Mongo client or the running event loop.
+        self.executor = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=context, initializer=_init_worker, initargs=(self.started,)
+        )
+        # Process ID of each started task that has not finished
+        self.running: Dict[int, int] = {}
+        # Processes running tasks that timed out
+        self.stuck: Set[int] = set()
+
+    def _collect(self) -> None:
+        while True:
+            try:
+                task_id, pid = self.started.get_nowait()
+            except queue.Empty:
+                return
+            self.running[task_id] = pid
+
+    def process_of(self, task_id: int) -> Optional[int]:
+        """The process running the task, None when it has not started"""
+        self._collect()
+        return self.running.get(task_id)
+
+    def finished(self, task_id: int) -> None:
+        self._collect()
+        self.running.pop(task_id, None)
+
+    def terminate_stuck(self) -> None:
+        for process in multiprocessing.active_children():
+            if process.pid in self.stuck:
+                process.terminate()
+
+
+class ParsePool:
+    """Bounded, timeout-aware wrapper around a ProcessPoolExecutor.
+
+    ``max_workers=0`` runs tasks on the default thread executor instead, which
+    keeps the loop responsive for I/O but not for CPU-heavy parsing; it is
+    meant for development and tests.
+
+    Callers that can wait (bulk uploads) queue for a slot instead of being
+    refused, and never take the last ``reserved`` slots, which are kept for
+    callers that cannot (single uploads).
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, timeout: float, reserved: int = 0):
+        self.max_workers = max(0, max_workers)
+        self.max_pending = max(1, max_pending)
+        self.timeout = timeout
+        self.reserved = min(max(0, reserved), self.max_pending - 1)
+        # Tasks starting with less than this many seconds left are skipped
+        self.start_margin = min(1.0, timeout / 4)
+        self._workers: Optional[_Workers] = None
+        self._task_ids = itertools.count()
+        self._pending = 0
+        self._lock = threading.Lock()
+        # Callers waiting for a slot, woken one per released slot
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    @classmethod
+    def from_env(cls) -> "ParsePool":
+        """Build a pool from PARSE_WORKERS, PARSE_MAX_PENDING, PARSE_RESERVED_SLOTS and PARSE_TIMEOUT_SECONDS"""
+        workers = int(os.environ.get('PARSE_WORKERS', os.cpu_count() or 1))
+        max_pending = int(os.environ.get('PARSE_MAX_PENDING', max(workers, 1) * 4))
+        reserved = int(os.environ.get('PARSE_RESERVED_SLOTS', max(workers, 1)))
+        timeout = float(os.environ.get('PARSE_TIMEOUT_SECONDS', 60))
+        return cls(max_workers=workers, max_pending=max_pending, timeout=timeout, reserved=reserved)
+
+    @property
+    def pending(self) -> int:
+        """Tasks submitted and not yet finished, including ones that timed out"""
+        return self._pending
+
+    def start(self) -> None:
+        if self._workers is None and self.max_workers > 0:
+            self._workers = _Workers(self.max_workers)
+            logger.info(f"Started parse pool with {self.max_workers} workers")
+
+    def shutdown(self, wait: bool = True) -> None:
+        if self._workers is not None:
+            self._workers.executor.shutdown(wait=wait, cancel_futures=True)
+            self._workers = None
+            logger.info("Parse pool shut down")
+
+    def _release(self, _future: Any) -> None:
+        with self._lock:
+            self._pending -= 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+    async def _acquire(self, wait: bool) -> None:
+        if not wait:
+            with self._lock:
+                if self._pending >= self.max_pending:
+                    raise ParsePoolBusy(f"{self._pending} parse tasks already pending")
+                self._pending += 1
+            return
+
+        while True:
+            with self._lock:
+                if self._pending < self.max_pending - self.reserved:
+                    self._pending += 1
+                    return
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    # Woken for a slot this caller no longer takes
+                    self._wake()
+                raise
+
+    def _timed_out(self, workers: _Workers, task_id: int) -> None:
+        pid = workers.process_of(task_id)
+        if pid is None:
+            # Still queued; the worker that picks it up skips it
+            return
+        workers.stuck.add(pid)
+        with self._lock:
+            if self._workers is not workers:
+                # Already retired after another timeout; its stuck processes
+                # are terminated together
+                return
+            self._workers = None
+        logger.warning("Parse task timed out while running; replacing the parse pool workers")
+        # Tasks already queued still run on its other workers
+        workers.executor.shutdown(wait=False)
+        # Every task submitted to it has timed out or finished by then.
+        # Terminating the stuck workers fails their tasks, releasing their slots.
+        timer = threading.Timer(self.timeout, workers.terminate_stuck)
+        timer.daemon = True
+        timer.start()
+
+    async def run(self, func: Callable[..., Any], *args: Any, wait: bool = False) -> Any:
+        """Run ``func(*args)`` off the event loop and return its result.
+
+        Raises ParsePoolBusy when the queue is full, or with ``wait`` waits
+        for a slot outside the reserved ones, and ParsePoolTimeout when the
+        task overruns. A slot stays taken until the task really finishes,
+        so a timed-out task still counts against ``max_pending`` until its
+        worker is terminated.
+        """
+        await self._acquire(wait)
+
+        loop = asyncio.get_running_loop()
+        try:
+            if self.max_workers > 0:
+                self.start()
+                workers = self._workers
+                task_id = next(self._task_ids)
+                deadline = time.time() + self.timeout - self.start_margin
+                future: Future = workers.executor.submit(_run_task, task_id, deadline, func, *args)
+                # Released on the event loop, where the waiters are
+                task = asyncio.wrap_future(future)
+                task.add_done_callback(lambda _task: workers.finished(task_id))
+                task.add_done_callback(self._release)
+            else:
+                task = loop.run_in_executor(None, func, *args)
+                task.add_done_callback(self._release)
+        except BaseException:
+            self._release(None)
+            raise
+
+        try:
+            # shield() keeps the wrapped future alive so the release callback
+            # still fires when the worker eventually finishes.
+            return await asyncio.wait_for(asyncio.shield(task), timeout=self.timeout)
+        except asyncio.TimeoutError:
+            if self.max_workers > 0 and not future.cancel():
+                # Handed to the workers; only stopping its process stops it
+                self._timed_out(workers, task_id)
+            # Nobody awaits the task any more; consume its outcome quietly
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            raise ParsePoolTimeout(f"Parse task exceeded {self.timeout:g}s")
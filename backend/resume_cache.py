@@ -0,0 +1,79 @@
+"""In-process read-through cache of validated resumes by ID.
+
+The frontend calls /match-jobs, /career-suggestions,
+/skill-development-comparison and /resume-qa back to back for the same
+resume, and each used to read and validate it again. Entries are kept in an
+LRU for at most ``ttl`` seconds. Nothing in the app changes a resume once
+it is stored, so entries are not invalidated: ``ttl`` alone bounds how long
+a change made to the collection by other means can go unseen. Concurrent
+misses for one resume share a single load.
+
+Cached resumes are shared between requests and must not be modified.
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from models import ResumeData
+from parse_cache import LRUCache
+
+
+class ResumeCache:
+    """Size- and age-bounded cache of resumes, loaded once per miss"""
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        # Entries are (expiry time, resume)
+        self.memory = LRUCache(max_entries)
+        self.ttl = ttl
+        self.clock = clock
+        self._loading: Dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        # Misses served by a load another request had already started
+        self.coalesced = 0
+        self.expired = 0
+
+    def __len__(self) -> int:
+        return len(self.memory)
+
+    async def get(
+        self, resume_id: str, load: Callable[[], Awaitable[Optional[ResumeData]]]
+    ) -> Optional[ResumeData]:
+        """The cached resume, or the result of ``load()`` (None when it does not exist)"""
+        entry = self.memory.get(resume_id)
+        if entry is not None:
+            expires, resume = entry
+            if expires > self.clock():
+                self.hits += 1
+                return resume
+            self.memory.pop(resume_id)
+            self.expired += 1
+
+        loading = self._loading.get(resume_id)
+        if loading is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            loading = asyncio.ensure_future(load())
+            self._loading[resume_id] = loading
+            loading.add_done_callback(lambda future: self._loaded(resume_id, future))
+        # A cancelled request leaves the load running for the others waiting on it
+        return await asyncio.shield(loading)
+
+    def _loaded(self, resume_id: str, loading: asyncio.Future) -> None:
+        del self._loading[resume_id]
+        if not loading.cancelled() and loading.exception() is None and loading.result() is not None:
+            self.memory.put(resume_id, (self.clock() + self.ttl, loading.result()))
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "entries": len(self.memory),
+            "max_entries": self.memory.max_entries,
+            "ttl_seconds": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "expired": self.expired,
+            "hit_ratio": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+        }
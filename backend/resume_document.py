@@ -0,0 +1,245 @@
+"""Normalized view of a resume's text, built once and shared by every extractor.
+
+Splitting, stripping and lowercasing used to happen separately in each
+extractor. ResumeDocument does that work a single time per resume and keeps
+the results around: cleaned lines, their lowercase forms, the offset of each
+line in the normalized text and the detected section headings.
+"""
+import re
+from functools import cached_property
+from typing import Dict, List, NamedTuple, Optional, Tuple, Union
+
+# Runs of spaces, tabs and other non-newline whitespace
+_INLINE_WHITESPACE = re.compile(r'[^\S\n]+')
+
+# Headings commonly used to open a resume section, mapped to a section name
+SECTION_HEADINGS = {
+    'summary': 'summary',
+    'professional summary': 'summary',
+    'profile': 'summary',
+    'objective': 'summary',
+    'about me': 'summary',
+    'skills': 'skills',
+    'technical skills': 'skills',
+    'core skills': 'skills',
+    'key skills': 'skills',
+    'technologies': 'skills',
+    'competencies': 'skills',
+    'core competencies': 'skills',
+    'expertise': 'skills',
+    'experience': 'experience',
+    'work experience': 'experience',
+    'professional experience': 'experience',
+    'employment': 'experience',
+    'employment history': 'experience',
+    'work history': 'experience',
+    'education': 'education',
+    'academic background': 'education',
+    'qualifications': 'education',
+    'projects': 'projects',
+    'certifications': 'certifications',
+    'certificates': 'certifications',
+    'awards': 'awards',
+    'publications': 'publications',
+    'languages': 'languages',
+    'interests': 'interests',
+    'references': 'references',
+    'contact': 'contact',
+}
+
+# Words that name a section inside longer heading lines ("TECHNICAL EXPERTISE")
+SECTION_KEYWORDS = {
+    'skills': 'skills',
+    'technologies': 'skills',
+    'competencies': 'skills',
+    'expertise': 'skills',
+    'proficiencies': 'skills',
+    'experience': 'experience',
+    'employment': 'experience',
+    'education': 'education',
+    'projects': 'projects',
+    'certifications': 'certifications',
+}
+
+
+class Section(NamedTuple):
+    name: str
+    heading: str
+    heading_line: int
+    # Body lines are [start_line, end_line), ending at the next heading
+    start_line: int
+    end_line: int
+    # Character span of the body in ResumeDocument.text / .lower
+    start: int
+    end: int
+    # End of the first block of the body: the next blank or heading-like line
+    block_end: int
+
+
+def normalize_lines(text: str) -> List[str]:
+    """Split text into stripped lines with collapsed whitespace.
+
+    Words broken across lines with a trailing hyphen ("develop-" / "ment")
+    are joined back together. Blank lines are kept as empty strings because
+    they separate sections.
+    """
+    text = text.replace('\r\n', '\n').replace('\r', '\n')
+    lines: List[str] = []
+    carry = ""
+    for line in _INLINE_WHITESPACE.sub(' ', text).split('\n'):
+        line = line.strip()
+        if carry:
+            if line[:1].islower():
+                line = carry + line
+            else:
+                lines.append(carry + '-')
+            carry = ""
+        if len(line) > 1 and line[-1] == '-' and line[-2].isalpha():
+            carry = line[:-1]
+            continue
+        lines.append(line)
+    if carry:
+        lines.append(carry + '-')
+    return lines
+
+
+def lower_line(line: str) -> str:
+    """``line.lower()``, but always of the same length as ``line``.
+
+    A few characters lowercase to more than one ("İ" becomes "i" plus a
+    combining dot); they keep only the first, so that offsets into a line
+    are offsets into its lowercase form too.
+    """
+    lower = line.lower()
+    if len(lower) == len(line):
+        return lower
+    return ''.join(ch.lower()[0] for ch in line)
+
+
+def heading_name(line: str, line_lower: str) -> Optional[str]:
+    """Return the section name for a heading line, or None"""
+    key = line_lower.rstrip(':').strip()
+    name = SECTION_HEADINGS.get(key)
+    if name is None and is_heading_like(line) and len(key.split()) <= 5:
+        for word in key.split():
+            name = SECTION_KEYWORDS.get(word)
+            if name is not None:
+                break
+    return name
+
+
+def inline_heading(line_lower: str) -> Optional[Tuple[str, int]]:
+    """Detect a "Heading: content" line.
+
+    Returns the section name and the column where the content starts.
+    """
+    label, colon, rest = line_lower.partition(':')
+    if not colon or not rest.strip():
+        return None
+    name = SECTION_HEADINGS.get(label.strip())
+    if name is None:
+        return None
+    return name, len(line_lower) - len(rest.lstrip())
+
+
+def is_heading_like(line: str) -> bool:
+    """True for short all-caps lines ("PROJECTS") and "Some Label:" lines"""
+    if not line or len(line) > 40:
+        return False
+    label = line[:-1] if line.endswith(':') else line
+    if not label or not all(ch.isalpha() or ch in ' &/' for ch in label):
+        return False
+    return line.endswith(':') or label.isupper()
+
+
+def index_sections(lines: List[str], lower_lines: List[str], line_offsets: List[int]) -> List[Section]:
+    """Find every section heading and its body span in one pass over the lines.
+
+    Each line is looked at a bounded number of times, so the cost is linear
+    in the document size no matter how the text is laid out.
+    """
+    headings: List[Tuple[int, str, int]] = []  # (line, section name, body start column)
+    for index, line_lower in enumerate(lower_lines):
+        if not line_lower:
+            continue
+        name = heading_name(lines[index], line_lower)
+        if name is not None:
+            headings.append((index, name, -1))
+            continue
+        inline = inline_heading(line_lower)
+        if inline is not None:
+            headings.append((index, inline[0], inline[1]))
+
+    text_end = line_offsets[-1] + len(lines[-1]) if lines else 0
+    sections = []
+    for position, (index, name, column) in enumerate(headings):
+        end_line = headings[position + 1][0] if position + 1 < len(headings) else len(lines)
+        body_end = end_line
+        while body_end > index + 1 and not lines[body_end - 1]:
+            body_end -= 1  # Trailing blank lines are not part of the body
+        end = line_offsets[body_end - 1] + len(lines[body_end - 1]) if body_end > index else text_end
+
+        if column >= 0:
+            # Content on the heading line itself
+            start_line = index
+            start = line_offsets[index] + column
+            block_line = index + 1
+        else:
+            start_line = index + 1
+            start = line_offsets[start_line] if start_line < len(lines) else text_end
+            block_line = start_line
+
+        while block_line < end_line and lines[block_line] and not is_heading_like(lines[block_line]):
+            block_line += 1
+        block_end = line_offsets[block_line] - 1 if block_line < len(lines) else text_end
+
+        sections.append(Section(
+            name, lines[index], index, start_line, end_line,
+            min(start, end), end, max(min(block_end, end), min(start, end))
+        ))
+    return sections
+
+
+class ResumeDocument:
+    """Pre-tokenized resume text shared by the extractors"""
+
+    def __init__(self, raw_text: str):
+        self.raw_text = raw_text
+        self.lines = normalize_lines(raw_text)
+        self.lower_lines = [lower_line(line) for line in self.lines]
+        self.text = '\n'.join(self.lines)
+        self.lower = '\n'.join(self.lower_lines)
+
+        # Offset of each line in ``text``/``lower``
+        self.line_offsets: List[int] = []
+        offset = 0
+        for line in self.lines:
+            self.line_offsets.append(offset)
+            offset += len(line) + 1
+
+    @classmethod
+    def of(cls, text_or_document: Union[str, "ResumeDocument"]) -> "ResumeDocument":
+        """Accept either raw text or an already built document"""
+        if isinstance(text_or_document, ResumeDocument):
+            return text_or_document
+        return cls(text_or_document)
+
+    @cached_property
+    def nonempty_lines(self) -> List[int]:
+        """Indexes of lines that are not blank"""
+        return [index for index, line in enumerate(self.lines) if line]
+
+    @cached_property
+    def sections(self) -> List[Section]:
+        """Sections opened by a recognised heading, in document order"""
+        return index_sections(self.lines, self.lower_lines, self.line_offsets)
+
+    def section_map(self) -> Dict[str, List[Section]]:
+        grouped: Dict[str, List[Section]] = {}
+        for section in self.sections:
+            grouped.setdefault(section.name, []).append(section)
+        return grouped
+
+    def section_blocks(self, name: str) -> List[Tuple[int, int]]:
+        """Character spans of the first block of every section called ``name``"""
+        return [(section.start, section.block_end) for section in self.sections if section.name == name]
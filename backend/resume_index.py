@@ -0,0 +1,328 @@
+"""Resume-side index for ranking stored resumes against a job.
+
+What scoring needs from a resume that does not depend on the job catalog,
+its skills and the term counts of its matching text, is computed once at
+upload and stored in its own collection. The in-memory index turns those
+features into TF-IDF rows under the catalog's IDF and into inverted skill
+postings, and appends new resumes as they are uploaded. When the catalog's
+vocabulary or the skill taxonomy changes it is rebuilt from the features
+it already holds, without reading resume documents again.
+
+Stored features carry a ``seq`` from a counter document, as jobs in the job
+catalog do, so that every worker picks up resumes uploaded through the
+others by reading only the features written since its last refresh.
+Features written late, after ``REFRESH_LOOKBACK`` later sequence numbers
+were applied, fall outside that read; since features are only ever
+inserted, every refresh that finds new features also compares the number
+stored with the index and reads the missing ones by ID when they differ.
+"""
+import asyncio
+import logging
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+import numpy as np
+from pydantic import BaseModel, Field
+from pymongo import ReturnDocument
+from scipy import sparse
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.preprocessing import normalize
+
+from job_index import FALLBACK_SIMILARITY, JobIndex, combine_scores, resume_text, top_positions
+from models import CandidateMatch, ResumeData
+from resume_repository import MATCH_FIELDS, projection
+
+logger = logging.getLogger(__name__)
+
+# Same tokenization as the job index's TfidfVectorizer
+TEXT_ANALYZER = TfidfVectorizer().build_analyzer()
+
+# Resume fields the features are computed from
+FEATURE_FIELDS = projection(MATCH_FIELDS)
+
+# Sequence numbers re-read below the index's version on every refresh, so
+# that a batch which took its numbers before another worker's write but
+# landed after it is read without a reconcile; well above the bulk upload
+# batch size
+REFRESH_LOOKBACK = 1024
+
+
+class ResumeFeatures(BaseModel):
+    resume_id: str
+    name: str = ""
+    skills: List[str] = []
+    # Term counts of the resume's matching text
+    terms: Dict[str, int] = {}
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+
+
+def resume_features(resume: ResumeData) -> ResumeFeatures:
+    return ResumeFeatures(
+        resume_id=resume.id,
+        name=resume.name,
+        skills=resume.skills,
+        terms=dict(Counter(TEXT_ANALYZER(resume_text(resume)))),
+    )
+
+
+class DerivedRows(NamedTuple):
+    """TF-IDF rows and skill postings of a run of resumes"""
+    # None when the vocabulary is not fitted
+    matrix: Optional[sparse.csr_matrix]
+    skill_keys: List[Set[str]]
+    # Skill key -> positions of the resumes that have it
+    postings: Dict[str, List[int]]
+
+
+def derive_rows(vectorizer, taxonomy, features: List[ResumeFeatures], start: int = 0) -> DerivedRows:
+    """Rows for ``features``, which sit at ``start`` onwards in the index"""
+    skill_keys: List[Set[str]] = []
+    postings: Dict[str, List[int]] = {}
+    for position, feature in enumerate(features, start):
+        keys = {taxonomy.skill_key(skill) for skill in feature.skills}
+        skill_keys.append(keys)
+        for key in keys:
+            postings.setdefault(key, []).append(position)
+
+    vocabulary = getattr(vectorizer, 'vocabulary_', None)
+    if vocabulary is None:
+        return DerivedRows(None, skill_keys, postings)
+    rows, columns, counts = [], [], []
+    for row, feature in enumerate(features):
+        for term, count in feature.terms.items():
+            column = vocabulary.get(term)
+            if column is not None:
+                rows.append(row)
+                columns.append(column)
+                counts.append(count)
+    columns = np.asarray(columns, dtype=np.int64)
+    weights = np.asarray(counts, dtype=np.float64) * vectorizer.idf_[columns]
+    matrix = normalize(sparse.csr_matrix((weights, (rows, columns)), shape=(len(features), len(vocabulary))))
+    return DerivedRows(matrix, skill_keys, postings)
+
+
+class ResumeIndex:
+    """TF-IDF rows and skill postings of every stored resume"""
+
+    def __init__(self, collection=None, counters=None, check_interval: float = 5.0):
+        self.collection = collection
+        self.counters = counters
+        # Seconds between counter reads by ``run``
+        self.check_interval = check_interval
+        # Highest seq of the stored features applied, 0 before the first load
+        self.version = 0
+        # Features indexed here that are not stored, after a failed persist
+        self._unstored = 0
+        self.features: List[ResumeFeatures] = []
+        self._positions: Dict[str, int] = {}
+        # JobIndex vocabulary and taxonomy the derived structures match
+        self._vectorizer = None
+        self._taxonomy = None
+        self.matrix: Optional[sparse.csr_matrix] = None
+        self._skill_keys: List[Set[str]] = []
+        # Skill key -> positions of the resumes that have it
+        self._postings: Dict[str, List[int]] = {}
+        # Held while the derived structures are refitted off the event loop
+        self._sync_lock = asyncio.Lock()
+
+    def __len__(self) -> int:
+        return len(self.features)
+
+    async def ensure_indexes(self) -> None:
+        await self.collection.create_index("resume_id", unique=True)
+        await self.collection.create_index("seq")
+
+    async def _next_seq(self, count: int = 1) -> int:
+        """Reserve ``count`` sequence numbers and return the last one"""
+        counter = await self.counters.find_one_and_update(
+            {"_id": "resume_features"}, {"$inc": {"seq": count}}, upsert=True, return_document=ReturnDocument.AFTER
+        )
+        return counter["seq"]
+
+    async def _counter(self) -> int:
+        counter = await self.counters.find_one({"_id": "resume_features"})
+        return counter["seq"] if counter else 0
+
+    async def load(self, resumes, batch_size: int = 1000) -> None:
+        """Load stored features, computing them first for resumes that have none.
+
+        Resumes are only read when there are more of them than stored
+        features, which happens after features failed to persist; even then
+        only the IDs of resumes are scanned, and the matching fields are read
+        for the missing ones.
+        """
+        version = await self._counter()
+        async for doc in self.collection.find({}, {"_id": 0}):
+            doc.pop("seq", None)
+            self.add([ResumeFeatures(**doc)])
+        self.version = max(self.version, version)
+        if await resumes.count_documents({}) <= len(self.features):
+            return
+
+        missing_ids: List[str] = []
+        async for doc in resumes.find({}, {"_id": 0, "id": 1}):
+            if doc["id"] not in self._positions:
+                missing_ids.append(doc["id"])
+        logger.info(f"Computing features of {len(missing_ids)} resumes")
+        for start in range(0, len(missing_ids), batch_size):
+            batch = missing_ids[start:start + batch_size]
+            missing = [
+                resume_features(ResumeData(**doc))
+                async for doc in resumes.find({"id": {"$in": batch}}, FEATURE_FIELDS)
+            ]
+            self.add(missing)
+            await self._persist(missing)
+
+    async def _persist(self, features: List[ResumeFeatures]) -> None:
+        if not features:
+            return
+        try:
+            last = await self._next_seq(len(features))
+            await self.collection.insert_many(
+                [{**feature.dict(), "seq": seq} for seq, feature in enumerate(features, last - len(features) + 1)],
+                ordered=False,
+            )
+        except Exception as e:
+            # Features missing from the collection are recomputed on the next load
+            logger.warning(f"Could not persist resume features: {e}")
+            self._unstored += len(features)
+
+    async def refresh(self) -> int:
+        """Add the features other workers stored since the last refresh; returns how many"""
+        counter = await self._counter()
+        if counter <= self.version:
+            return 0
+        added: List[ResumeFeatures] = []
+        version = self.version
+        query = {"seq": {"$gt": max(self.version - REFRESH_LOOKBACK, 0)}}
+        async for doc in self.collection.find(query, {"_id": 0}, sort=[("seq", 1)]):
+            version = max(version, doc.pop("seq"))
+            if doc["resume_id"] not in self._positions:
+                added.append(ResumeFeatures(**doc))
+        self.version = version
+        self.add(added)
+        if await self.collection.count_documents({}) > len(self.features) - self._unstored:
+            # Features written too late for the look-back window
+            return len(added) + await self._reconcile()
+        return len(added)
+
+    async def _reconcile(self, batch_size: int = 1000) -> int:
+        """Add every stored feature missing from the index; returns how many"""
+        stored = 0
+        missing_ids: List[str] = []
+        async for doc in self.collection.find({}, {"_id": 0, "resume_id": 1}):
+            stored += 1
+            if doc["resume_id"] not in self._positions:
+                missing_ids.append(doc["resume_id"])
+        for start in range(0, len(missing_ids), batch_size):
+            query = {"resume_id": {"$in": missing_ids[start:start + batch_size]}}
+            docs = [doc async for doc in self.collection.find(query, {"_id": 0, "seq": 0})]
+            self.add(ResumeFeatures(**doc) for doc in docs)
+        # Every stored feature is indexed now, so the rest are the unstored ones
+        self._unstored = max(len(self.features) - stored, 0)
+        if missing_ids:
+            logger.warning(f"Added {len(missing_ids)} resume features written too late for a refresh")
+        return len(missing_ids)
+
+    async def run(self) -> None:
+        """Refresh every ``check_interval`` seconds, forever"""
+        while True:
+            try:
+                added = await self.refresh()
+                if added:
+                    logger.info(f"Resume index refreshed with {added} resumes, {len(self)} in total")
+            except Exception as e:
+                logger.warning(f"Could not refresh resume index: {e}")
+            await asyncio.sleep(self.check_interval)
+
+    async def add_resumes(self, resumes: List[ResumeData]) -> None:
+        """Index newly stored resumes and persist their features"""
+        features = [resume_features(resume) for resume in resumes]
+        self.add(features)
+        await self._persist(features)
+
+    def add(self, features: Iterable[ResumeFeatures]) -> None:
+        start = len(self.features)
+        for feature in features:
+            if feature.resume_id not in self._positions:
+                self._positions[feature.resume_id] = len(self.features)
+                self.features.append(feature)
+        if self._taxonomy is not None and len(self.features) > start:
+            self._extend(start)
+
+    def _stale(self, index: JobIndex) -> bool:
+        return self._vectorizer is not index.vectorizer or self._taxonomy is not index.taxonomy
+
+    def _sync(self, index: JobIndex) -> None:
+        if self._stale(index):
+            self._vectorizer, self._taxonomy = index.vectorizer, index.taxonomy
+            self._use(derive_rows(self._vectorizer, self._taxonomy, self.features))
+
+    async def sync(self, index: JobIndex) -> None:
+        """Refit to the vocabulary and taxonomy of ``index``, off the event loop.
+
+        Resumes added while the rows are derived are appended after the swap.
+        """
+        async with self._sync_lock:
+            if not self._stale(index):
+                return
+            count = len(self.features)
+            rows = await asyncio.to_thread(derive_rows, index.vectorizer, index.taxonomy, self.features[:count])
+            self._vectorizer, self._taxonomy = index.vectorizer, index.taxonomy
+            self._use(rows)
+            if len(self.features) > count:
+                self._extend(count)
+
+    def _use(self, rows: DerivedRows) -> None:
+        self.matrix, self._skill_keys, self._postings = rows
+
+    def _extend(self, start: int) -> None:
+        rows = derive_rows(self._vectorizer, self._taxonomy, self.features[start:], start)
+        self._skill_keys.extend(rows.skill_keys)
+        for key, positions in rows.postings.items():
+            self._postings.setdefault(key, []).extend(positions)
+        if rows.matrix is not None:
+            self.matrix = rows.matrix if self.matrix is None else sparse.vstack([self.matrix, rows.matrix], format='csr')
+
+    def candidates(
+        self, index: JobIndex, position: int, top_k: int, offset: int = 0, min_score: Optional[float] = None
+    ) -> Tuple[List[CandidateMatch], int]:
+        """The best resumes for the job at ``position`` in ``index``.
+
+        Scores are the same as matching each resume against the job. Returns
+        one page and the number of resumes scoring at least ``min_score``.
+        Refits on the calling thread when ``index`` changed; await ``sync``
+        first to do that off the event loop.
+        """
+        self._sync(index)
+        if not self.features:
+            return [], 0
+        job = index.jobs[position]
+        if index.matrix is None or self.matrix is None:
+            semantic = np.full(len(self.features), FALLBACK_SIMILARITY)
+        else:
+            semantic = (self.matrix @ index.matrix[position].T).toarray().ravel()
+
+        requirement_keys = [self._taxonomy.skill_key(requirement) for requirement in job.requirements]
+        covered = np.zeros(len(self.features))
+        for key in requirement_keys:
+            covered[self._postings.get(key, [])] += 1
+        scores = combine_scores(semantic, covered / max(len(requirement_keys), 1))
+
+        total = len(scores) if min_score is None else int(np.count_nonzero(scores >= min_score))
+        job_keys = set(requirement_keys)
+        page = []
+        for resume in top_positions(scores, offset + top_k, min_score)[offset:]:
+            feature = self.features[resume]
+            keys = self._skill_keys[resume]
+            page.append(CandidateMatch(
+                resume_id=feature.resume_id,
+                name=feature.name,
+                match_score=float(scores[resume]),
+                matching_skills=[skill for skill in feature.skills if self._taxonomy.skill_key(skill) in job_keys],
+                missing_skills=[
+                    requirement for requirement, key in zip(job.requirements, requirement_keys) if key not in keys
+                ],
+            ))
+        return page, total
@@ -0,0 +1,420 @@
+"""Resume text extraction and parsing.
+
+Everything in this module is CPU-bound and free of database or app state so it
+can run inside the parse worker processes.
+"""
+import logging
+import os
+import re
+import time
+from dataclasses import dataclass
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Union
+
+import file_formats
+from models import ResumeData, TextExtraction
+from resume_document import ResumeDocument
+from skill_taxonomy import TaxonomyRegistry
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever parsing output changes so cached parse results are ignored
+PARSER_VERSION = 6
+
+
+class ResumeParseError(Exception):
+    """Raised when no usable text can be extracted from an uploaded file"""
+
+
+@dataclass(frozen=True)
+class ExtractionBudget:
+    """Upper bounds on how much of an uploaded document is extracted"""
+    max_pages: int = 50
+    max_chars: int = 200_000
+    max_seconds: float = 20.0
+
+    @classmethod
+    def from_env(cls) -> "ExtractionBudget":
+        """Read EXTRACT_MAX_PAGES, EXTRACT_MAX_CHARS and EXTRACT_MAX_SECONDS"""
+        return cls(
+            max_pages=int(os.environ.get('EXTRACT_MAX_PAGES', cls.max_pages)),
+            max_chars=int(os.environ.get('EXTRACT_MAX_CHARS', cls.max_chars)),
+            max_seconds=float(os.environ.get('EXTRACT_MAX_SECONDS', cls.max_seconds)),
+        )
+
+
+def iter_pdf_pages(file_content: bytes) -> Iterator[Tuple[int, str]]:
+    """Yield ``(page_count, page_text)`` for each page of a PDF, one at a time.
+
+    Each page's layout cache is released before the next page is parsed, so
+    memory stays proportional to a single page rather than the document.
+    """
+    import pdfplumber
+    import io
+    
+    with pdfplumber.open(io.BytesIO(file_content)) as pdf:
+        page_count = len(pdf.pages)
+        for page in pdf.pages:
+            try:
+                page_text = page.extract_text() or ""
+            finally:
+                page.close()
+            yield page_count, page_text
+
+def extract_pdf_text(
+    file_content: bytes, budget: Optional[ExtractionBudget] = None
+) -> Tuple[str, TextExtraction]:
+    """Extract text from a PDF page by page, stopping once the budget is spent"""
+    budget = budget or ExtractionBudget.from_env()
+    extraction = TextExtraction()
+    parts: List[str] = []
+    started = time.monotonic()
+    
+    pages = iter_pdf_pages(file_content)
+    try:
+        for page_count, page_text in pages:
+            extraction.total_pages = page_count
+            extraction.pages_read += 1
+            if page_text:
+                remaining = max(budget.max_chars - extraction.characters, 0)
+                if len(page_text) > remaining:
+                    parts.append(page_text[:remaining])
+                    extraction.characters += remaining
+                    extraction.truncation_reason = "chars"
+                    break
+                parts.append(page_text)
+                extraction.characters += len(page_text) + 1
+            
+            # Decide before the next page is parsed, so no work is wasted
+            if extraction.pages_read >= page_count:
+                break
+            if extraction.pages_read >= budget.max_pages:
+                extraction.truncation_reason = "pages"
+                break
+            if time.monotonic() - started > budget.max_seconds:
+                extraction.truncation_reason = "time"
+                break
+    finally:
+        pages.close()
+    
+    extraction.truncated = bool(extraction.truncation_reason)
+    return "\n".join(parts).strip(), extraction
+
+# Resume parsing functions
+def extract_text_from_pdf(file_content: bytes) -> str:
+    """Extract text from PDF file using pdfplumber, within the default budget"""
+    try:
+        text, _ = extract_pdf_text(file_content)
+        return text
+    except Exception as e:
+        logger.error(f"Error extracting text from PDF: {e}")
+        raise ResumeParseError("Could not extract text from PDF file")
+
+# WordprocessingML element names as reported by expat with namespace processing
+_W = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main '
+_DOCX_TEXT = _W + 't'
+_DOCX_BREAKS = {_W + 'tab': '\t', _W + 'br': '\n', _W + 'cr': '\n', _W + 'noBreakHyphen': '-'}
+# Paragraphs end a line; a table ends with a blank line after its last cell
+_DOCX_BLOCK_ENDS = {_W + 'p': '\n', _W + 'tbl': '\n'}
+DOCX_CHUNK_SIZE = 64 * 1024
+
+
+class _DocxBudgetSpent(Exception):
+    pass
+
+
+def iter_docx_parts(names: List[str], include_headers: bool) -> Iterator[str]:
+    """Package parts to read, in reading order: headers, body, footers"""
+    def numbered(prefix: str) -> List[str]:
+        return sorted(name for name in names if name.startswith(prefix) and name.endswith('.xml'))
+    
+    if include_headers:
+        yield from numbered('word/header')
+    yield 'word/document.xml'
+    if include_headers:
+        yield from numbered('word/footer')
+
+def extract_docx_text(
+    file_content: bytes,
+    budget: Optional[ExtractionBudget] = None,
+    include_headers: bool = True,
+) -> Tuple[str, TextExtraction]:
+    """Extract text from a DOCX by streaming its XML parts through expat.
+
+    Only the main document (and, optionally, headers and footers) is read;
+    media and other parts are never decompressed. Paragraphs and table cells
+    become lines, so section headings are detected as in other formats.
+    Parsing stops as soon as the character budget is spent.
+    """
+    import io
+    import zipfile
+    from xml.parsers import expat
+    
+    budget = budget or ExtractionBudget.from_env()
+    extraction = TextExtraction()
+    parts: List[str] = []
+    started = time.monotonic()
+    in_text = False
+    
+    def start_element(name, _attrs):
+        nonlocal in_text
+        if name == _DOCX_TEXT:
+            in_text = True
+        elif name in _DOCX_BREAKS:
+            parts.append(_DOCX_BREAKS[name])
+    
+    def end_element(name):
+        nonlocal in_text
+        if name == _DOCX_TEXT:
+            in_text = False
+        elif name in _DOCX_BLOCK_ENDS:
+            parts.append(_DOCX_BLOCK_ENDS[name])
+    
+    def character_data(data):
+        if not in_text:
+            return
+        remaining = budget.max_chars - extraction.characters
+        if len(data) > remaining:
+            parts.append(data[:remaining])
+            extraction.characters += remaining
+            extraction.truncation_reason = "chars"
+            raise _DocxBudgetSpent()
+        parts.append(data)
+        extraction.characters += len(data)
+    
+    with zipfile.ZipFile(io.BytesIO(file_content)) as package:
+        names = package.namelist()
+        try:
+            for part_name in iter_docx_parts(names, include_headers):
+                parser = expat.ParserCreate(namespace_separator=' ')
+                parser.buffer_text = True
+                parser.StartElementHandler = start_element
+                parser.EndElementHandler = end_element
+                parser.CharacterDataHandler = character_data
+                with package.open(part_name) as part:
+                    while True:
+                        chunk = part.read(DOCX_CHUNK_SIZE)
+                        parser.Parse(chunk, not chunk)
+                        if not chunk:
+                            break
+                        if time.monotonic() - started > budget.max_seconds:
+                            extraction.truncation_reason = "time"
+                            raise _DocxBudgetSpent()
+                parts.append('\n')
+        except _DocxBudgetSpent:
+            pass
+    
+    extraction.truncated = bool(extraction.truncation_reason)
+    return "".join(parts).strip(), extraction
+
+def extract_text_from_docx(file_content: bytes) -> str:
+    """Extract text from DOCX file, within the default budget"""
+    try:
+        text, _ = extract_docx_text(file_content)
+        return text
+    except Exception as e:
+        logger.error(f"Error extracting text from DOCX: {e}")
+        raise ResumeParseError("Could not extract text from DOCX file")
+
+# Extractors for formats that are returned as a single string; Markdown is
+# decoded and cut to the budget in extract_text before it is stripped
+TEXT_EXTRACTORS = {
+    file_formats.TEXT: file_formats.extract_text_from_plain,
+    file_formats.HTML: file_formats.extract_text_from_html,
+    file_formats.RTF: file_formats.extract_text_from_rtf,
+}
+
+def extract_text(
+    filename: str, file_content: bytes, budget: Optional[ExtractionBudget] = None
+) -> Tuple[str, TextExtraction]:
+    """Sniff an upload's format and extract its text with the matching extractor.
+
+    Raises ResumeParseError for content that is not a supported document.
+    """
+    file_format = file_formats.sniff_format(filename, file_content)
+    if file_format is None:
+        raise ResumeParseError("Unsupported file format")
+    
+    budget = budget or ExtractionBudget.from_env()
+    if file_format == file_formats.PDF:
+        try:
+            return extract_pdf_text(file_content, budget)
+        except Exception as e:
+            logger.error(f"Error extracting text from PDF: {e}")
+            raise ResumeParseError("Could not extract text from PDF file")
+    if file_format == file_formats.DOCX:
+        try:
+            return extract_docx_text(file_content, budget)
+        except Exception as e:
+            logger.error(f"Error extracting text from DOCX: {e}")
+            raise ResumeParseError("Could not extract text from DOCX file")
+    
+    cut = False
+    try:
+        if file_format == file_formats.MARKDOWN:
+            # Cut before the Markdown patterns run, so that their cost is within the budget too
+            source = file_formats.decode_text(file_content)
+            cut = len(source) > budget.max_chars
+            text = file_formats.strip_markdown(source[:budget.max_chars])
+        else:
+            text = TEXT_EXTRACTORS[file_format](file_content)
+    except ResumeParseError:
+        raise
+    except Exception as e:
+        logger.error(f"Error extracting text from {file_format} file: {e}")
+        raise ResumeParseError(f"Could not extract text from {file_format} file")
+    
+    extraction = TextExtraction(characters=len(text))
+    if cut or len(text) > budget.max_chars:
+        text = text[:budget.max_chars]
+        extraction = TextExtraction(characters=len(text), truncated=True, truncation_reason="chars")
+    return text, extraction
+
+EMAIL_PATTERN = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+PHONE_PATTERN = re.compile(r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+NAME_EXCLUDE_KEYWORDS = [
+    'resume', 'cv', 'curriculum', 'email', 'phone', 'address', 
+    'experience', 'education', 'skills', 'objective', 'summary',
+    'profile', 'contact', 'linkedin', 'github', 'portfolio'
+]
+
+def extract_contact_info(text: Union[str, ResumeDocument]) -> Dict[str, str]:
+    """Extract contact information from resume text"""
+    doc = ResumeDocument.of(text)
+    contact_info = {"name": "", "email": "", "phone": ""}
+    
+    # Extract email
+    email = EMAIL_PATTERN.search(doc.text)
+    if email:
+        contact_info["email"] = email.group(0)
+    
+    # Extract phone (the first match's country-code group, as findall reported it)
+    phone = PHONE_PATTERN.search(doc.text)
+    if phone:
+        contact_info["phone"] = phone.group(1) or ""
+    
+    # Extract name (improved heuristic)
+    # Look for name in first few lines
+    for index in doc.nonempty_lines[:8]:  # Check first 8 lines
+        line = doc.lines[index]
+        line_lower = doc.lower_lines[index]
+        
+        # Skip lines that are clearly not names
+        if any(keyword in line_lower for keyword in NAME_EXCLUDE_KEYWORDS):
+            continue
+        if '@' in line or any(char.isdigit() for char in line if char not in [' ', '-', '.']):
+            continue
+        
+        # Check if line looks like a name
+        words = line.split()
+        if 1 <= len(words) <= 4:  # Names are typically 1-4 words
+            # Check if words start with capital letters (common for names)
+            if all(word[0].isupper() for word in words if word):
+                contact_info["name"] = line
+                break
+    
+    return contact_info
+
+# Skill vocabulary shared by the parser and the job scorers; reloaded in
+# every process when the skills file changes
+SKILL_TAXONOMY = TaxonomyRegistry.from_env()
+
+def extract_skills(text: Union[str, ResumeDocument]) -> List[str]:
+    """Extract skills from resume text using keyword matching.
+
+    Aliases are reported under their canonical name ("Golang" -> "Go").
+    """
+    doc = ResumeDocument.of(text)
+    
+    # Skills in dedicated sections are more likely to be accurate, so they
+    # are accepted without word boundaries
+    section_spans = doc.section_blocks('skills')
+    
+    # General text search for skills, using word boundaries elsewhere
+    return [skill.name for skill in SKILL_TAXONOMY.get().find(doc.lower, section_spans)]
+
+EXPERIENCE_SKIP_KEYWORDS = ['experience', 'work', 'employment', 'career']
+YEAR_PATTERN = re.compile(r'\b(19|20)\d{2}\b')
+MAX_EXPERIENCE_ENTRIES = 5
+
+def extract_experience(text: Union[str, ResumeDocument]) -> List[Dict[str, Any]]:
+    """Extract work experience from resume text"""
+    doc = ResumeDocument.of(text)
+    experience = []
+    
+    # Look for common experience patterns
+    current_exp = {}
+    description: List[str] = []
+    
+    for index in doc.nonempty_lines:
+        line = doc.lines[index]
+        
+        # Look for job titles and companies (heuristic approach)
+        if any(keyword in doc.lower_lines[index] for keyword in EXPERIENCE_SKIP_KEYWORDS):
+            continue
+        
+        # Look for date patterns that might indicate employment periods
+        if YEAR_PATTERN.search(line):
+            if current_exp:
+                current_exp["description"] = "".join(description)
+                experience.append(current_exp)
+                if len(experience) == MAX_EXPERIENCE_ENTRIES:
+                    # Later entries would be dropped anyway
+                    return experience
+            current_exp = {"role": line, "duration": line, "description": ""}
+            description = []
+        elif current_exp:
+            description.append(line + " ")
+    
+    if current_exp:
+        current_exp["description"] = "".join(description)
+        experience.append(current_exp)
+    
+    return experience[:MAX_EXPERIENCE_ENTRIES]  # Limit to 5 most recent
+
+EDUCATION_KEYWORDS = ['university', 'college', 'school', 'degree', 'bachelor', 'master', 'phd', 'diploma']
+MAX_EDUCATION_ENTRIES = 3
+
+def extract_education(text: Union[str, ResumeDocument]) -> List[Dict[str, Any]]:
+    """Extract education from resume text"""
+    doc = ResumeDocument.of(text)
+    education = []
+    
+    for line in doc.lower_lines:
+        if any(keyword in line for keyword in EDUCATION_KEYWORDS):
+            education.append({"institution": line, "degree": line, "year": ""})
+            if len(education) == MAX_EDUCATION_ENTRIES:
+                break
+    
+    return education
+
+def parse_resume_content(text: str) -> ResumeData:
+    """Parse resume text and extract structured data"""
+    # Normalize and split the text once for every extractor
+    doc = ResumeDocument(text)
+    contact_info = extract_contact_info(doc)
+    skills = extract_skills(doc)
+    experience = extract_experience(doc)
+    education = extract_education(doc)
+    
+    return ResumeData(
+        name=contact_info["name"],
+        email=contact_info["email"],
+        phone=contact_info["phone"],
+        skills=skills,
+        experience=experience,
+        education=education,
+        raw_text=text
+    )
+
+def process_resume_file(filename: str, file_content: bytes) -> Tuple[ResumeData, TextExtraction]:
+    """Extract text from an uploaded file and parse it into ResumeData.
+
+    This is the unit of work submitted to the parse pool. The returned
+    TextExtraction says how much of the document was read.
+    """
+    text, extraction = extract_text(filename, file_content)
+    
+    if not text.strip():
+        raise ResumeParseError("Could not extract text from file")
+    
+    return parse_resume_content(text), extraction
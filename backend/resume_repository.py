@@ -0,0 +1,193 @@
+"""Access to the resumes collection.
+
+Every read names the fields its caller uses, and only those are sent back
+by Mongo: matching and career suggestions never move ``raw_text``, which is
+by far the largest field of a resume. Fields left out keep their ResumeData
+defaults. Lookups by ``id`` and ``content_hash`` and listing by
+``created_at`` are served by the indexes created in ``ensure_indexes``.
+
+``raw_text`` is kept out of the resume documents altogether, compressed in
+a ResumeTextStore, and fetched from there only by reads that name it.
+
+``get_cached`` serves the per-resume endpoints from a ResumeCache holding
+the union of the fields they read. Stored resumes are never rewritten, only
+inserted under new IDs, so the cache's TTL is its only expiry.
+
+Listings page by key rather than by offset: a page ends with a cursor
+holding the (``created_at``, ``id``) of its last resume, and the next page
+starts strictly after it, so every page costs one index seek whatever its
+depth, and resumes uploaded meanwhile never shift a page.
+"""
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from models import ResumeData
+from resume_cache import ResumeCache
+from resume_text import ResumeTextStore
+
+# Fields read by job matching, what-if scoring and the resume index
+MATCH_FIELDS = ("id", "name", "skills", "experience")
+# Fields read by career suggestions
+SKILL_FIELDS = ("id", "skills")
+# Fields read by resume Q&A
+QA_FIELDS = ("id", "name", "email", "phone", "skills", "experience")
+# Fields of cached resumes, every field the endpoints above read
+CACHED_FIELDS = tuple(dict.fromkeys(MATCH_FIELDS + SKILL_FIELDS + QA_FIELDS))
+# Migrations document recording that no resume holds its raw text inline
+TEXT_MIGRATION = "resume_text_out_of_line"
+# Fields of a resume listing in summary mode
+SUMMARY_FIELDS = ("id", "name", "email", "skills", "created_at")
+# Fields a listing may select: every field but raw_text, which is only read
+# one resume at a time
+RESUME_FIELDS = tuple(field for field in ResumeData.__fields__ if field != "raw_text")
+
+# Oldest first, so that new uploads land after the last page; id breaks ties
+# between resumes created in the same instant
+LIST_ORDER = [("created_at", 1), ("id", 1)]
+# Fields every listed resume carries, because its cursor is made of them
+CURSOR_FIELDS = ("created_at", "id")
+
+
+class InvalidCursor(ValueError):
+    """A listing cursor that ``encode_cursor`` did not produce"""
+
+
+def encode_cursor(doc: Dict[str, Any]) -> str:
+    """Opaque cursor positioned just after ``doc``"""
+    key = json.dumps([doc["created_at"].isoformat(), doc["id"]])
+    return base64.urlsafe_b64encode(key.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        created_at, resume_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        return datetime.fromisoformat(created_at), str(resume_id)
+    except (binascii.Error, UnicodeError, TypeError, ValueError) as e:
+        raise InvalidCursor(f"Invalid cursor: {cursor!r}") from e
+
+
+def after_cursor(cursor: Optional[str]) -> Dict[str, Any]:
+    """Query for the resumes listed after ``cursor``; all of them when None"""
+    if not cursor:
+        return {}
+    created_at, resume_id = decode_cursor(cursor)
+    return {"$or": [
+        {"created_at": {"$gt": created_at}},
+        {"created_at": created_at, "id": {"$gt": resume_id}},
+    ]}
+
+
+def projection(fields: Optional[Sequence[str]] = None) -> Dict[str, int]:
+    """Mongo projection of ``fields``; every field but Mongo's _id when None"""
+    if fields is None:
+        return {"_id": 0}
+    return {"_id": 0, **{field: 1 for field in fields}}
+
+
+class ResumeRepository:
+    """Projection-aware reads and writes of stored resumes.
+
+    Without ``texts``, raw text stays inline in the resume documents;
+    without ``cache``, ``get_cached`` only shares concurrent reads.
+    """
+
+    def __init__(self, collection, texts: Optional[ResumeTextStore] = None, cache: Optional[ResumeCache] = None):
+        self.collection = collection
+        self.texts = texts
+        self.cache = cache if cache is not None else ResumeCache(max_entries=0)
+
+    async def ensure_indexes(self) -> None:
+        await self.collection.create_index("id", unique=True)
+        await self.collection.create_index(LIST_ORDER)
+        await self.collection.create_index("content_hash")
+        if self.texts is not None:
+            await self.texts.ensure_indexes()
+
+    async def get(self, resume_id: str, fields: Optional[Sequence[str]] = None) -> Optional[ResumeData]:
+        doc = await self.get_doc(resume_id, fields)
+        return ResumeData(**doc) if doc else None
+
+    async def get_cached(self, resume_id: str) -> Optional[ResumeData]:
+        """CACHED_FIELDS of a resume, from the cache when it holds them"""
+        return await self.cache.get(resume_id, lambda: self.get(resume_id, CACHED_FIELDS))
+
+    async def get_doc(self, resume_id: str, fields: Optional[Sequence[str]] = None) -> Optional[Dict[str, Any]]:
+        """A stored resume document; ``raw_text`` is fetched only when ``fields`` is None or names it"""
+        doc = await self.collection.find_one({"id": resume_id}, projection(fields))
+        if doc is not None and self.texts is not None and "raw_text" not in doc:
+            if fields is None or "raw_text" in fields:
+                doc["raw_text"] = await self.texts.get(resume_id) or ""
+        return doc
+
+    def find(self, query: Optional[Dict[str, Any]] = None, fields: Optional[Sequence[str]] = None, **options):
+        """Cursor over the stored resumes matching ``query``"""
+        return self.collection.find(query or {}, projection(fields), **options)
+
+    def listing(
+        self, fields: Optional[Sequence[str]] = None, after: Optional[str] = None, limit: int = 0, batch_size: int = 0
+    ):
+        """Cursor over the resumes after ``after`` in listing order.
+
+        ``fields`` always gains the cursor fields and None selects
+        RESUME_FIELDS; ``limit`` and ``batch_size`` of 0 leave the choice to
+        Mongo.
+        """
+        # Whole documents leave out raw_text still inline in older resumes
+        fields = list(dict.fromkeys([*CURSOR_FIELDS, *(RESUME_FIELDS if fields is None else fields)]))
+        options = {"sort": LIST_ORDER, "limit": limit}
+        if batch_size:
+            options["batch_size"] = batch_size
+        return self.find(after_cursor(after), fields, **options)
+
+    async def page(
+        self, fields: Optional[Sequence[str]], limit: int, after: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """Up to ``limit`` resume documents after ``after``, and the cursor of the next page (None on the last)"""
+        # One more than asked tells whether another page follows without a count
+        docs = [doc async for doc in self.listing(fields, after, limit + 1)]
+        if len(docs) <= limit:
+            return docs, None
+        docs.pop()
+        return docs, encode_cursor(docs[-1])
+
+    def _stored(self, resume: ResumeData) -> Dict[str, Any]:
+        if self.texts is None:
+            return resume.dict()
+        return resume.dict(exclude={"raw_text"})
+
+    async def insert(self, resume: ResumeData) -> None:
+        # Text first, so that a resume is never visible without it
+        if self.texts is not None:
+            await self.texts.put(resume.id, resume.raw_text)
+        await self.collection.insert_one(self._stored(resume))
+
+    async def insert_many(self, resumes: List[ResumeData]) -> None:
+        if self.texts is not None:
+            await self.texts.put_many([(resume.id, resume.raw_text) for resume in resumes])
+        await self.collection.insert_many([self._stored(resume) for resume in resumes], ordered=False)
+
+    async def move_inline_text(self, migrations=None) -> int:
+        """Move raw text still inline in older resumes to the text store; returns how many moved.
+
+        Safe to run from several workers at once: each step can be repeated.
+        The scan reads every resume, so with a ``migrations`` collection its
+        completion is recorded there and later calls return at once; delete
+        the ``TEXT_MIGRATION`` document to scan again.
+        """
+        if self.texts is None:
+            return 0
+        if migrations is not None and await migrations.find_one({"_id": TEXT_MIGRATION}):
+            return 0
+        moved = 0
+        async for doc in self.find({"raw_text": {"$exists": True}}, ("id", "raw_text")):
+            await self.texts.put(doc["id"], doc["raw_text"])
+            await self.collection.update_one({"id": doc["id"]}, {"$unset": {"raw_text": ""}})
+            moved += 1
+        if migrations is not None:
+            await migrations.update_one(
+                {"_id": TEXT_MIGRATION}, {"$set": {"moved": moved, "completed_at": datetime.utcnow()}}, upsert=True
+            )
+        return moved
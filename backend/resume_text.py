@@ -0,0 +1,62 @@
+"""Raw resume text, compressed and stored apart from the resumes.
+
+``raw_text`` is by far the largest field of a resume, yet matching, listing
+and career suggestions never read it. Keeping it inline made every resume
+document several times larger than what those reads use, and Mongo caches
+whole documents, so the text crowded the hot fields out of memory. Here it
+lives zlib-compressed in its own collection, one document per resume, and
+is read only when a caller asks for ``raw_text``.
+"""
+import asyncio
+import zlib
+from typing import Optional, Sequence, Tuple
+
+# Recorded on every document, so that another codec can be added later
+CODEC = "zlib"
+COMPRESSION_LEVEL = 6
+
+
+def compress_text(text: str, level: int = COMPRESSION_LEVEL) -> bytes:
+    return zlib.compress(text.encode("utf-8"), level)
+
+
+def decompress_text(data: bytes, codec: str = CODEC) -> str:
+    if codec != CODEC:
+        raise ValueError(f"Unknown resume text codec: {codec!r}")
+    return zlib.decompress(data).decode("utf-8")
+
+
+class ResumeTextStore:
+    """Compressed raw text of stored resumes, by resume ID"""
+
+    def __init__(self, collection, level: int = COMPRESSION_LEVEL):
+        self.collection = collection
+        self.level = level
+
+    async def ensure_indexes(self) -> None:
+        await self.collection.create_index("resume_id", unique=True)
+
+    def _doc(self, resume_id: str, text: str) -> dict:
+        return {
+            "resume_id": resume_id,
+            "codec": CODEC,
+            "size": len(text),
+            "data": compress_text(text, self.level),
+        }
+
+    async def put(self, resume_id: str, text: str) -> None:
+        """Store the text of one resume, replacing any stored before"""
+        doc = self._doc(resume_id, text)
+        await self.collection.replace_one({"resume_id": resume_id}, doc, upsert=True)
+
+    async def put_many(self, texts: Sequence[Tuple[str, str]]) -> None:
+        """Store the texts of newly stored resumes, as (resume ID, text) pairs"""
+        if texts:
+            # zlib releases the GIL, so a large batch compresses off the event loop
+            docs = await asyncio.to_thread(lambda: [self._doc(resume_id, text) for resume_id, text in texts])
+            await self.collection.insert_many(docs, ordered=False)
+
+    async def get(self, resume_id: str) -> Optional[str]:
+        """The text of a resume; None when none was stored"""
+        doc = await self.collection.find_one({"resume_id": resume_id}, {"_id": 0, "codec": 1, "data": 1})
+        return decompress_text(doc["data"], doc["codec"]) if doc else None
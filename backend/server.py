@@ -1,12 +1,12 @@
-from fastapi import FastAPI, APIRouter, File, UploadFile, HTTPException
+from fastapi import FastAPI, APIRouter, File, UploadFile, HTTPException, Query, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from dotenv import load_dotenv
 from motor.motor_asyncio import AsyncIOMotorClient
 import os
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Literal, Optional, Any, Tuple
 import uuid
 from datetime import datetime
 import tempfile
@@ -14,12 +14,32 @@ import io
 import asyncio
 
 # AI/NLP imports - simplified
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
 import numpy as np
 import re
 import json
 
+from models import (
+    ResumeData, JobListing, ResumeQARequest, ResumeQAResponse, CareerSuggestion,
+    TextExtraction
+)
+from resume_parser import SKILL_TAXONOMY, ResumeParseError, process_resume_file
+from skill_taxonomy import SkillTaxonomy, SkillTaxonomyError
+from file_formats import (
+    SUPPORTED_EXTENSIONS, UNKNOWN_CONTENT_DETAIL, UNSUPPORTED_FORMAT_DETAIL, sniff_format
+)
+from parse_pool import ParsePool, ParsePoolBusy, ParsePoolTimeout
+from parse_cache import CachedParse, ParseCache, read_upload
+from match_cache import MatchCache, ranked_matches
+from resume_index import ResumeIndex
+from job_index import JobIndex
+from embeddings import EmbeddingStore
+from bulk_ingest import BulkFile, bounded_map, iter_bulk_files, ndjson_line, spool_uploads
+from bulk_match import stream_bulk_matches
+from resume_repository import RESUME_FIELDS, SUMMARY_FIELDS, InvalidCursor, ResumeRepository, encode_cursor
+from resume_text import ResumeTextStore
+from resume_cache import ResumeCache
+from job_catalog import CatalogChanges, JobCatalog
+
 # AI Integration - works both locally and on Emergent platform
 try:
     # Try Emergent integration first (for Emergent platform)
@@ -50,6 +70,25 @@ mongo_url = os.environ['MONGO_URL']
 client = AsyncIOMotorClient(mongo_url)
 db = client[os.environ['DB_NAME']]
 
+# Stored resumes, read with per-endpoint projections; their raw text is
+# stored compressed in its own collection
+resumes = ResumeRepository(
+    db.resumes,
+    ResumeTextStore(db.resume_texts),
+    # Resumes read by the per-resume endpoints, kept for RESUME_CACHE_TTL seconds
+    ResumeCache(
+        max_entries=int(os.environ.get('RESUME_CACHE_SIZE', 1024)),
+        ttl=float(os.environ.get('RESUME_CACHE_TTL', 60))
+    )
+)
+
+# Page size of /resumes when limit is not given, and its upper bound
+RESUMES_PAGE_SIZE = int(os.environ.get('RESUMES_PAGE_SIZE', 100))
+RESUMES_MAX_LIMIT = int(os.environ.get('RESUMES_MAX_LIMIT', 1000))
+# Resumes per cursor batch of /resumes/export, and bytes of NDJSON per write
+RESUMES_EXPORT_BATCH = int(os.environ.get('RESUMES_EXPORT_BATCH', 1000))
+RESUMES_EXPORT_CHUNK = 64 * 1024
+
 # Create the main app without a prefix
 app = FastAPI()
 
@@ -63,351 +102,52 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Define Models
-class ResumeData(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    name: str = ""
-    email: str = ""
-    phone: str = ""
-    skills: List[str] = []
-    experience: List[Dict[str, Any]] = []
-    education: List[Dict[str, Any]] = []
-    raw_text: str = ""
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-
-class JobListing(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    title: str
-    company: str
-    description: str
-    requirements: List[str]
-    location: str = ""
-    salary_range: str = ""
-    experience_level: str = ""
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-
-class JobMatch(BaseModel):
-    job: JobListing
-    match_score: float
-    matching_skills: List[str]
-    missing_skills: List[str]
-    recommendations: List[str]
-
-class ResumeQARequest(BaseModel):
-    resume_id: str
-    question: str
-
-class ResumeQAResponse(BaseModel):
-    answer: str
-    suggestions: List[str] = []
-
-class CareerSuggestion(BaseModel):
-    career_path: str
-    current_fit: float
-    required_skills: List[str]
-    learning_resources: List[str]
-
-# Resume parsing functions
-def extract_text_from_pdf(file_content: bytes) -> str:
-    """Extract text from PDF file using pdfplumber"""
-    import pdfplumber
-    import io
-    
-    try:
-        with pdfplumber.open(io.BytesIO(file_content)) as pdf:
-            text = ""
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-            return text.strip()
-    except Exception as e:
-        logger.error(f"Error extracting text from PDF: {e}")
-        # Fallback: try basic text extraction
-        try:
-            text = file_content.decode('utf-8', errors='ignore')
-            return text
-        except:
-            raise Exception("Could not extract text from PDF file")
-
-def extract_text_from_docx(file_content: bytes) -> str:
-    """Extract text from DOCX file using docx2txt"""
-    import docx2txt
-    import io
-    
-    try:
-        text = docx2txt.process(io.BytesIO(file_content))
-        return text.strip() if text else ""
-    except Exception as e:
-        logger.error(f"Error extracting text from DOCX: {e}")
-        # Fallback: try basic text extraction
-        try:
-            text = file_content.decode('utf-8', errors='ignore')
-            return text
-        except:
-            raise Exception("Could not extract text from DOCX file")
-
-def extract_contact_info(text: str) -> Dict[str, str]:
-    """Extract contact information from resume text"""
-    contact_info = {"name": "", "email": "", "phone": ""}
-    
-    # Extract email
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    emails = re.findall(email_pattern, text)
-    if emails:
-        contact_info["email"] = emails[0]
-    
-    # Extract phone
-    phone_pattern = r'(\+?\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-    phones = re.findall(phone_pattern, text)
-    if phones:
-        contact_info["phone"] = ''.join(phones[0]) if isinstance(phones[0], tuple) else phones[0]
-    
-    # Extract name (improved heuristic)
-    lines = [line.strip() for line in text.split('\n') if line.strip()]
-    
-    # Look for name in first few lines
-    for i, line in enumerate(lines[:8]):  # Check first 8 lines
-        line = line.strip()
-        
-        # Skip lines that are clearly not names
-        if not line:
-            continue
-        if any(keyword in line.lower() for keyword in [
-            'resume', 'cv', 'curriculum', 'email', 'phone', 'address', 
-            'experience', 'education', 'skills', 'objective', 'summary',
-            'profile', 'contact', 'linkedin', 'github', 'portfolio'
-        ]):
-            continue
-        if '@' in line or any(char.isdigit() for char in line if char not in [' ', '-', '.']):
-            continue
-        if len(line.split()) > 6:  # Too long to be a name
-            continue
-            
-        # Check if line looks like a name
-        words = line.split()
-        if 1 <= len(words) <= 4:  # Names are typically 1-4 words
-            # Check if words start with capital letters (common for names)
-            if all(word[0].isupper() for word in words if word):
-                contact_info["name"] = line
-                break
-    
-    return contact_info
+# Worker processes for CPU-bound text extraction and parsing
+parse_pool = ParsePool.from_env()
 
-def extract_skills(text: str) -> List[str]:
-    """Extract skills from resume text using keyword matching"""
-    skills = set()
-    
-    # Comprehensive tech skills database
-    tech_skills = [
-        # Programming Languages
-        'Python', 'Java', 'JavaScript', 'TypeScript', 'C++', 'C#', 'C', 'Go', 'Rust', 
-        'Swift', 'Kotlin', 'Scala', 'R', 'MATLAB', 'PHP', 'Ruby', 'Perl', 'Shell',
-        'PowerShell', 'Bash', 'VB.NET', 'Assembly', 'Objective-C', 'Dart', 'Julia',
-        
-        # Web Technologies
-        'React', 'Angular', 'Vue', 'Vue.js', 'Svelte', 'Next.js', 'Nuxt.js', 'Gatsby',
-        'Node.js', 'Express', 'Express.js', 'Koa', 'FastAPI', 'Django', 'Flask', 
-        'Spring', 'Spring Boot', 'Laravel', 'CodeIgniter', 'ASP.NET', 'Rails',
-        'HTML', 'HTML5', 'CSS', 'CSS3', 'SCSS', 'SASS', 'Less', 'Bootstrap', 
-        'Tailwind', 'Tailwind CSS', 'Material-UI', 'Ant Design', 'Semantic UI',
-        
-        # Databases
-        'SQL', 'MySQL', 'PostgreSQL', 'MongoDB', 'Redis', 'SQLite', 'Oracle', 
-        'SQL Server', 'MariaDB', 'Cassandra', 'DynamoDB', 'Neo4j', 'InfluxDB',
-        'CouchDB', 'Firebase', 'Supabase', 'PlanetScale',
-        
-        # Cloud & DevOps
-        'AWS', 'Azure', 'GCP', 'Google Cloud', 'Docker', 'Kubernetes', 'Jenkins',
-        'CI/CD', 'GitHub Actions', 'GitLab CI', 'Travis CI', 'CircleCI', 'Terraform',
-        'Ansible', 'Chef', 'Puppet', 'Vagrant', 'Nginx', 'Apache', 'Linux', 'Ubuntu',
-        
-        # Version Control & Tools
-        'Git', 'GitHub', 'GitLab', 'Bitbucket', 'SVN', 'Mercurial', 'Jira', 'Confluence',
-        'Slack', 'Trello', 'Asana', 'Monday.com', 'Notion', 'Figma', 'Adobe XD',
-        'Sketch', 'InVision', 'Zeplin', 'Postman', 'Insomnia', 'Swagger',
-        
-        # Data Science & AI
-        'Machine Learning', 'Deep Learning', 'Artificial Intelligence', 'AI', 'ML',
-        'Data Science', 'Data Analysis', 'Statistics', 'Pandas', 'NumPy', 'SciPy',
-        'Matplotlib', 'Seaborn', 'Plotly', 'TensorFlow', 'PyTorch', 'Keras',
-        'Scikit-learn', 'OpenCV', 'NLTK', 'spaCy', 'Hugging Face', 'LangChain',
-        'NLP', 'Computer Vision', 'Neural Networks', 'CNN', 'RNN', 'LSTM', 'GAN',
-        'Jupyter', 'Colab', 'Tableau', 'Power BI', 'Looker', 'D3.js',
-        
-        # Mobile Development
-        'iOS', 'Android', 'React Native', 'Flutter', 'Xamarin', 'Cordova', 'PhoneGap',
-        'Ionic', 'Xcode', 'Android Studio', 'SwiftUI', 'UIKit', 'Jetpack Compose',
-        
-        # Game Development
-        'Unity', 'Unreal Engine', 'Godot', 'GameMaker', 'Construct', 'Phaser',
-        'Three.js', 'WebGL', 'OpenGL', 'DirectX', 'Vulkan',
-        
-        # Other Technologies
-        'Blockchain', 'Ethereum', 'Solidity', 'Web3', 'Smart Contracts', 'DeFi',
-        'GraphQL', 'REST', 'SOAP', 'gRPC', 'WebSocket', 'Socket.io', 'RabbitMQ',
-        'Kafka', 'Elasticsearch', 'Solr', 'Spark', 'Hadoop', 'Flink', 'Storm',
-        'Microservices', 'Serverless', 'Lambda', 'API Gateway', 'Load Balancing',
-        
-        # Methodologies & Concepts
-        'Agile', 'Scrum', 'Kanban', 'DevOps', 'TDD', 'BDD', 'DDD', 'Clean Code',
-        'SOLID', 'Design Patterns', 'Microservices', 'Monolith', 'Event-Driven',
-        'Test Automation', 'Unit Testing', 'Integration Testing', 'E2E Testing',
-        'Performance Testing', 'Security Testing', 'UI/UX', 'Responsive Design',
-        'SEO', 'Accessibility', 'PWA', 'SPA', 'SSR', 'JAMstack'
-    ]
-    
-    # Extract skills using keyword matching (case insensitive)
-    text_lower = text.lower()
-    
-    # Also look for skills in specific sections
-    sections = ['skills', 'technical skills', 'technologies', 'competencies', 'expertise']
-    for section in sections:
-        section_pattern = rf'{section}[:\s]+(.*?)(?=\n\s*[A-Z][A-Z\s]*[:\n]|\n\s*\n|$)'
-        matches = re.findall(section_pattern, text, re.IGNORECASE | re.DOTALL)
-        for match in matches:
-            # Skills in dedicated sections are more likely to be accurate
-            for skill in tech_skills:
-                if skill.lower() in match.lower():
-                    skills.add(skill)
-    
-    # General text search for skills
-    for skill in tech_skills:
-        # Use word boundaries to avoid partial matches
-        pattern = rf'\b{re.escape(skill.lower())}\b'
-        if re.search(pattern, text_lower):
-            skills.add(skill)
-    
-    return list(skills)
+# Parse results keyed by upload content hash
+parse_cache = ParseCache(db.parse_cache, max_entries=int(os.environ.get('PARSE_CACHE_SIZE', 1024)))
 
-def extract_experience(text: str) -> List[Dict[str, Any]]:
-    """Extract work experience from resume text"""
-    experience = []
-    
-    # Look for common experience patterns
-    lines = text.split('\n')
-    current_exp = {}
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        # Look for job titles and companies (heuristic approach)
-        if any(keyword in line.lower() for keyword in ['experience', 'work', 'employment', 'career']):
-            continue
-        
-        # Look for date patterns that might indicate employment periods
-        date_pattern = r'\b(19|20)\d{2}\b'
-        if re.search(date_pattern, line):
-            if current_exp:
-                experience.append(current_exp)
-            current_exp = {"role": line, "duration": line, "description": ""}
-        elif current_exp and line:
-            current_exp["description"] += line + " "
-    
-    if current_exp:
-        experience.append(current_exp)
-    
-    return experience[:5]  # Limit to 5 most recent
+# Bulk ingestion: files parsed concurrently and resumes per insert_many
+BULK_CONCURRENCY = int(os.environ.get('BULK_CONCURRENCY', max(parse_pool.max_workers, 1) * 2))
+BULK_INSERT_BATCH = int(os.environ.get('BULK_INSERT_BATCH', 100))
 
-def extract_education(text: str) -> List[Dict[str, Any]]:
-    """Extract education from resume text"""
-    education = []
-    
-    # Common education keywords
-    edu_keywords = ['university', 'college', 'school', 'degree', 'bachelor', 'master', 'phd', 'diploma']
-    
-    lines = text.split('\n')
-    for line in lines:
-        line = line.strip().lower()
-        if any(keyword in line for keyword in edu_keywords):
-            education.append({"institution": line, "degree": line, "year": ""})
-    
-    return education[:3]  # Limit to 3 entries
-
-def parse_resume_content(text: str) -> ResumeData:
-    """Parse resume text and extract structured data"""
-    contact_info = extract_contact_info(text)
-    skills = extract_skills(text)
-    experience = extract_experience(text)
-    education = extract_education(text)
-    
-    return ResumeData(
-        name=contact_info["name"],
-        email=contact_info["email"],
-        phone=contact_info["phone"],
-        skills=skills,
-        experience=experience,
-        education=education,
-        raw_text=text
-    )
+# Page size of /match-jobs when top_k is not given, and its upper bound
+MATCH_DEFAULT_TOP_K = int(os.environ.get('MATCH_DEFAULT_TOP_K', 20))
+MATCH_MAX_TOP_K = int(os.environ.get('MATCH_MAX_TOP_K', 100))
 
-def calculate_job_match(resume: ResumeData, job: JobListing) -> JobMatch:
-    """Calculate match score between resume and job listing using simplified approach"""
-    try:
-        # Combine resume skills and experience into text
-        resume_text = " ".join(resume.skills) + " " + " ".join([exp.get("description", "") for exp in resume.experience])
-        job_text = job.description + " " + " ".join(job.requirements)
-        
-        # Calculate simple text similarity using TF-IDF
-        vectorizer = TfidfVectorizer()
-        try:
-            tfidf_matrix = vectorizer.fit_transform([resume_text, job_text])
-            semantic_similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
-        except:
-            # Fallback if TF-IDF fails
-            semantic_similarity = 0.5
-        
-        # Calculate skill matching
-        resume_skills_lower = [skill.lower() for skill in resume.skills]
-        job_requirements_lower = [req.lower() for req in job.requirements]
-        
-        matching_skills = []
-        for skill in resume.skills:
-            if any(skill.lower() in req.lower() or req.lower() in skill.lower() for req in job_requirements_lower):
-                matching_skills.append(skill)
-        
-        missing_skills = []
-        for req in job.requirements:
-            if not any(req.lower() in skill.lower() or skill.lower() in req.lower() for skill in resume_skills_lower):
-                missing_skills.append(req)
-        
-        # Calculate overall match score
-        skill_match_ratio = len(matching_skills) / max(len(job.requirements), 1)
-        match_score = (semantic_similarity * 0.6 + skill_match_ratio * 0.4) * 100
-        
-        # Generate recommendations
-        recommendations = []
-        if missing_skills:
-            recommendations.append(f"Consider learning: {', '.join(missing_skills[:3])}")
-        if match_score > 70:
-            recommendations.append("Great fit! Consider applying.")
-        elif match_score > 50:
-            recommendations.append("Good potential match with some skill development.")
-        else:
-            recommendations.append("Focus on building relevant skills for this role.")
-        
-        return JobMatch(
-            job=job,
-            match_score=match_score,
-            matching_skills=matching_skills,
-            missing_skills=missing_skills[:5],
-            recommendations=recommendations
-        )
-    except Exception as e:
-        logger.error(f"Error calculating job match: {e}")
-        return JobMatch(
-            job=job,
-            match_score=0.0,
-            matching_skills=[],
-            missing_skills=[],
-            recommendations=["Error calculating match score"]
-        )
+# Resumes scored per jobs x resumes product by /match-jobs/bulk, and its upper bound
+MATCH_BULK_BATCH = int(os.environ.get('MATCH_BULK_BATCH', 256))
+MATCH_BULK_MAX_BATCH = int(os.environ.get('MATCH_BULK_MAX_BATCH', 2048))
+
+# Skills and term counts of every stored resume, for ranking resumes against a
+# job; resumes uploaded through other workers are picked up every
+# RESUME_INDEX_REFRESH_INTERVAL seconds
+resume_index = ResumeIndex(
+    db.resume_features, db.counters, check_interval=float(os.environ.get('RESUME_INDEX_REFRESH_INTERVAL', 5))
+)
+resume_index_tasks: List[asyncio.Task] = []
+
+# Catalogs of at least this many jobs are matched in two stages: an ANN index
+# picks MATCH_ANN_CANDIDATES jobs, which are then scored exactly (0 disables)
+MATCH_ANN_MIN_JOBS = int(os.environ.get('MATCH_ANN_MIN_JOBS', 50000))
+MATCH_ANN_CANDIDATES = int(os.environ.get('MATCH_ANN_CANDIDATES', 2000))
+
+# Job rankings keyed by resume fingerprint and catalog version, each
+# MATCH_CACHE_DEPTH jobs deep so that later pages are served too; persisted
+# rankings expire MATCH_CACHE_TTL seconds after they were computed
+match_cache = MatchCache(
+    db.match_cache,
+    max_entries=int(os.environ.get('MATCH_CACHE_SIZE', 1024)),
+    depth=max(int(os.environ.get('MATCH_CACHE_DEPTH', 1000)), MATCH_MAX_TOP_K),
+    ttl=int(os.environ.get('MATCH_CACHE_TTL', 7 * 24 * 3600))
+)
 
-# Sample job data
+# Sample jobs, stored in the job catalog when it is empty; fixed IDs so that
+# workers seeding at the same time store them once
 sample_jobs = [
     JobListing(
+        id="sample-full-stack-developer",
         title="Full Stack Developer",
         company="TechCorp Inc.",
         description="We are looking for a skilled Full Stack Developer to join our dynamic team. You will be responsible for developing both front-end and back-end applications.",
@@ -417,6 +157,7 @@ sample_jobs = [
         experience_level="Mid-level"
     ),
     JobListing(
+        id="sample-data-scientist",
         title="Data Scientist",
         company="AI Solutions Ltd.",
         description="Join our data science team to build machine learning models and analyze large datasets to drive business insights.",
@@ -426,6 +167,7 @@ sample_jobs = [
         experience_level="Senior"
     ),
     JobListing(
+        id="sample-frontend-developer",
         title="Frontend Developer",
         company="WebDesign Pro",
         description="Create beautiful and responsive user interfaces using modern web technologies. Work with designers to implement pixel-perfect designs.",
@@ -435,6 +177,7 @@ sample_jobs = [
         experience_level="Junior to Mid-level"
     ),
     JobListing(
+        id="sample-devops-engineer",
         title="DevOps Engineer",
         company="CloudTech Systems",
         description="Manage cloud infrastructure and automate deployment processes. Ensure high availability and scalability of applications.",
@@ -444,6 +187,7 @@ sample_jobs = [
         experience_level="Mid to Senior"
     ),
     JobListing(
+        id="sample-mobile-app-developer",
         title="Mobile App Developer",
         company="AppInnovate",
         description="Develop native and cross-platform mobile applications for iOS and Android platforms.",
@@ -454,72 +198,389 @@ sample_jobs = [
     )
 ]
 
+# Sentence embeddings of jobs for the semantic score when EMBEDDING_MODEL is
+# set (TF-IDF otherwise), memory-mapped from EMBEDDING_STORE_DIR by every worker
+embedding_store = EmbeddingStore.from_env(ROOT_DIR / 'embedding_store')
+
+def build_job_index(jobs: List[JobListing], taxonomy: SkillTaxonomy) -> JobIndex:
+    embeddings = embedding_store.sync(jobs) if embedding_store is not None else None
+    index = JobIndex(jobs, taxonomy, embeddings)
+    # ANN candidates come from TF-IDF rows, so embeddings are always scored exactly
+    if embeddings is None and MATCH_ANN_MIN_JOBS and len(index) >= MATCH_ANN_MIN_JOBS:
+        index.build_ann(MATCH_ANN_CANDIDATES)
+    return index
+
+# TF-IDF vectors and skill incidence over the catalog snapshot; the sample
+# jobs until the catalog has been loaded
+job_index = build_job_index(sample_jobs, SKILL_TAXONOMY.get())
+
+# Jobs collection and this worker's snapshot of it, refreshed when the catalog
+# version counter moves (checked every JOB_CATALOG_REFRESH_INTERVAL seconds)
+job_catalog = JobCatalog(
+    db.jobs, db.counters, check_interval=float(os.environ.get('JOB_CATALOG_REFRESH_INTERVAL', 5))
+)
+# Also refresh on change stream events (needs a replica set)
+JOB_CATALOG_WATCH = os.environ.get('JOB_CATALOG_WATCH', '').lower() in ('1', 'true', 'yes')
+JOBS_MAX_LIMIT = int(os.environ.get('JOBS_MAX_LIMIT', 100))
+job_catalog_tasks: List[asyncio.Task] = []
+
+# Held while job_index is rebuilt and swapped, so that a catalog change and a
+# taxonomy reload never build from each other's stale snapshot
+job_index_lock = asyncio.Lock()
+job_index_rebuild: Optional[asyncio.Task] = None
+
+async def apply_catalog_changes(changes: CatalogChanges) -> None:
+    """Bring the job index up to the catalog snapshot"""
+    global job_index
+    async with job_index_lock:
+        if changes.rebuild or len(job_index) + len(changes.added) != len(job_catalog):
+            # Replaced or removed jobs, or an index not built from this snapshot.
+            # Built off the event loop; requests use the old index until the swap.
+            job_index = await asyncio.to_thread(build_job_index, list(job_catalog.jobs), SKILL_TAXONOMY.get())
+        else:
+            # New terms are picked up by the next rebuild. Appended to a copy,
+            # off the event loop (with embeddings, new jobs are encoded), as
+            # requests may be scoring against the current index in threads.
+            job_index = await asyncio.to_thread(job_index.appended, changes.added)
+    logger.info(f"Job index at catalog version {job_catalog.version} with {len(job_index)} jobs")
+
+async def rebuild_job_index_for_taxonomy() -> None:
+    """Refit the job index to the current skill taxonomy, off the event loop"""
+    global job_index
+    try:
+        async with job_index_lock:
+            taxonomy = SKILL_TAXONOMY.get()
+            if job_index.taxonomy is not taxonomy:
+                job_index = await asyncio.to_thread(build_job_index, list(job_index.jobs), taxonomy)
+                logger.info(f"Job index rebuilt for skill taxonomy version {taxonomy.version}")
+    except Exception as e:
+        logger.error(f"Error rebuilding job index for the skill taxonomy: {e}")
+
+def current_job_index() -> JobIndex:
+    """The job index
+    
+    After the skill taxonomy has been reloaded, this starts a rebuild for the
+    new taxonomy and keeps returning the previous index until it is swapped in.
+    """
+    global job_index_rebuild
+    if job_index.taxonomy is not SKILL_TAXONOMY.get() and (job_index_rebuild is None or job_index_rebuild.done()):
+        job_index_rebuild = asyncio.ensure_future(rebuild_job_index_for_taxonomy())
+    return job_index
+
 # API Routes
 @api_router.get("/")
 async def root():
     return {"message": "JobMate API - AI-Powered Job Matching Platform"}
 
+async def find_duplicate_resume(cached: Optional[CachedParse]) -> Optional[Dict[str, Any]]:
+    """Return the stored resume previously parsed from the same content, if any"""
+    if not cached or not cached.resume_id:
+        return None
+    return await resumes.get_doc(cached.resume_id)
+
+async def parse_resume_upload(
+    filename: str, file_content: bytes, content_hash: str, cached: Optional[CachedParse], wait: bool = False
+) -> Tuple[ResumeData, TextExtraction]:
+    """Return a fresh ResumeData for an upload, from the parse cache when possible
+    
+    With ``wait``, waits for room in the parse pool instead of raising
+    ParsePoolBusy, leaving the pool's reserved slots to single uploads.
+    """
+    if cached:
+        resume_data = ResumeData(**cached.resume.dict(exclude={"id", "created_at"}))
+        return resume_data, cached.extraction
+    
+    # Extract and parse off the event loop
+    resume_data, extraction = await parse_pool.run(process_resume_file, filename, file_content, wait=wait)
+    resume_data.content_hash = content_hash
+    return resume_data, extraction
+
 @api_router.post("/upload-resume")
-async def upload_resume(file: UploadFile = File(...)):
-    """Upload and parse resume file"""
+async def upload_resume(file: UploadFile = File(...), dedupe: bool = False):
+    """Upload and parse resume file
+    
+    Identical files are served from the parse cache. With ``dedupe`` set, a
+    file that was uploaded before returns the existing resume instead of
+    storing a duplicate.
+    """
     try:
         # Validate file type
-        if not file.filename.lower().endswith(('.pdf', '.docx')):
-            raise HTTPException(status_code=400, detail="Only PDF and DOCX files are supported")
+        if not file.filename.lower().endswith(SUPPORTED_EXTENSIONS):
+            raise HTTPException(status_code=400, detail=UNSUPPORTED_FORMAT_DETAIL)
         
-        # Read file content
-        file_content = await file.read()
+        # Read file content, hashing it as it streams in
+        file_content, content_hash = await read_upload(file)
         
-        # Extract text based on file type
-        if file.filename.lower().endswith('.pdf'):
-            text = extract_text_from_pdf(file_content)
-        else:
-            text = extract_text_from_docx(file_content)
+        # Check the content itself before any parser is involved
+        if sniff_format(file.filename, file_content) is None:
+            raise HTTPException(status_code=400, detail=UNKNOWN_CONTENT_DETAIL)
         
-        if not text.strip():
-            raise HTTPException(status_code=400, detail="Could not extract text from file")
+        cached = await parse_cache.get(content_hash)
+        if dedupe:
+            existing = await find_duplicate_resume(cached)
+            if existing:
+                return {
+                    "message": "Resume already uploaded",
+                    "resume": ResumeData(**existing),
+                    "extraction": cached.extraction,
+                    "cached": True,
+                    "duplicate": True
+                }
         
-        # Parse resume content
-        resume_data = parse_resume_content(text)
+        resume_data, extraction = await parse_resume_upload(file.filename, file_content, content_hash, cached)
         
         # Store in database
-        await db.resumes.insert_one(resume_data.dict())
+        await resumes.insert(resume_data)
+        await resume_index.add_resumes([resume_data])
+        
+        if not cached or dedupe:
+            # Remember the latest stored resume for future duplicate checks
+            await parse_cache.put(CachedParse(
+                content_hash=content_hash,
+                resume=resume_data,
+                extraction=extraction,
+                resume_id=resume_data.id
+            ))
         
-        return {"message": "Resume uploaded and parsed successfully", "resume": resume_data}
+        return {
+            "message": "Resume uploaded and parsed successfully",
+            "resume": resume_data,
+            "extraction": extraction,
+            "cached": cached is not None,
+            "duplicate": False
+        }
     
     except HTTPException:
         # Re-raise HTTP exceptions
         raise
+    except ResumeParseError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ParsePoolBusy:
+        raise HTTPException(status_code=503, detail="Server is busy parsing other resumes, please retry shortly")
+    except ParsePoolTimeout:
+        raise HTTPException(status_code=504, detail="Timed out while parsing resume")
     except Exception as e:
         logger.error(f"Error uploading resume: {e}")
         raise HTTPException(status_code=500, detail="Error processing resume")
 
+@api_router.post("/upload-resumes/bulk")
+async def upload_resumes_bulk(files: List[UploadFile] = File(...), dedupe: bool = False):
+    """Upload many resumes, or ZIP archives of resumes, in one request
+    
+    Files are parsed concurrently and stored with batched inserts. The
+    response is NDJSON: one status line per file as it completes, then a
+    summary line.
+    """
+    async def process(entry: BulkFile) -> Dict[str, Any]:
+        if entry.error:
+            return {"filename": entry.filename, "status": "error", "detail": entry.error}
+        try:
+            cached = await parse_cache.get(entry.content_hash)
+            if dedupe:
+                existing = await find_duplicate_resume(cached)
+                if existing:
+                    return {"filename": entry.filename, "status": "duplicate", "resume_id": existing["id"]}
+            # Queues behind other uploads, outside the slots kept for single-file uploads
+            resume_data, extraction = await parse_resume_upload(
+                entry.filename, entry.content, entry.content_hash, cached, wait=True
+            )
+            return {
+                "filename": entry.filename,
+                "status": "parsed",
+                "resume": resume_data,
+                "extraction": extraction,
+                "cached": cached is not None
+            }
+        except ResumeParseError as e:
+            return {"filename": entry.filename, "status": "error", "detail": str(e)}
+        except ParsePoolTimeout:
+            return {"filename": entry.filename, "status": "error", "detail": "Timed out while parsing resume"}
+        except Exception as e:
+            logger.error(f"Error processing bulk resume {entry.filename}: {e}")
+            return {"filename": entry.filename, "status": "error", "detail": "Error processing resume"}
+    
+    async def store(batch: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        try:
+            await resumes.insert_many([result["resume"] for result in batch])
+        except Exception as e:
+            logger.error(f"Error storing bulk resumes: {e}")
+            return [
+                {"filename": result["filename"], "status": "error", "detail": "Error storing resume"}
+                for result in batch
+            ]
+        await resume_index.add_resumes([result["resume"] for result in batch])
+        
+        lines = []
+        for result in batch:
+            resume_data = result["resume"]
+            if not result["cached"] or dedupe:
+                await parse_cache.put(CachedParse(
+                    content_hash=resume_data.content_hash,
+                    resume=resume_data,
+                    extraction=result["extraction"],
+                    resume_id=resume_data.id
+                ))
+            lines.append({
+                "filename": result["filename"],
+                "status": "stored",
+                "resume_id": resume_data.id,
+                "name": resume_data.name,
+                "skills": len(resume_data.skills),
+                "cached": result["cached"],
+                "extraction": result["extraction"].dict()
+            })
+        return lines
+    
+    async def stream(uploads: List[UploadFile]):
+        counts: Dict[str, int] = {}
+        batch: List[Dict[str, Any]] = []
+        try:
+            async for result in bounded_map(process, iter_bulk_files(uploads), BULK_CONCURRENCY):
+                if result["status"] == "parsed":
+                    batch.append(result)
+                    if len(batch) < BULK_INSERT_BATCH:
+                        continue
+                    lines, batch = await store(batch), []
+                else:
+                    lines = [result]
+                for line in lines:
+                    counts[line["status"]] = counts.get(line["status"], 0) + 1
+                    yield ndjson_line(line)
+            
+            if batch:
+                for line in await store(batch):
+                    counts[line["status"]] = counts.get(line["status"], 0) + 1
+                    yield ndjson_line(line)
+            
+            yield ndjson_line({"summary": {"total": sum(counts.values()), **counts}})
+        finally:
+            for upload in uploads:
+                await upload.close()
+    
+    # The request's own uploads are closed once this handler returns
+    uploads = await spool_uploads(files)
+    return StreamingResponse(stream(uploads), media_type="application/x-ndjson")
+
 @api_router.get("/jobs", response_model=List[JobListing])
-async def get_jobs():
-    """Get all available job listings"""
-    return sample_jobs
+async def get_jobs(
+    response: Response,
+    location: Optional[str] = None,
+    experience_level: Optional[str] = None,
+    company: Optional[str] = None,
+    created_after: Optional[datetime] = None,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=JOBS_MAX_LIMIT)
+):
+    """Get job listings, newest first
+    
+    ``location``, ``experience_level`` and ``company`` match exactly. The
+    number of matching jobs is returned in the X-Total-Count header.
+    """
+    try:
+        filters = {"location": location, "experience_level": experience_level, "company": company}
+        jobs, total = await job_catalog.query(filters, offset, limit, created_after)
+        response.headers["X-Total-Count"] = str(total)
+        return jobs
+    except Exception as e:
+        logger.error(f"Error listing jobs: {e}")
+        raise HTTPException(status_code=500, detail="Error listing jobs")
 
-@api_router.post("/match-jobs/{resume_id}")
-async def match_jobs(resume_id: str):
-    """Get job matches for a specific resume"""
+@api_router.get("/jobs/{job_id}/candidates")
+async def job_candidates(
+    job_id: str,
+    top_k: int = Query(MATCH_DEFAULT_TOP_K, ge=1, le=MATCH_MAX_TOP_K),
+    offset: int = Query(0, ge=0),
+    min_score: Optional[float] = Query(None, ge=0, le=100)
+):
+    """Get the stored resumes that best match a job
+    
+    Uses the same scores as /match-jobs, from the resume index rather than
+    the resume documents; with EMBEDDING_MODEL set, the semantic part stays
+    the TF-IDF similarity. Paging works as in /match-jobs.
+    """
     try:
-        # Get resume from database
-        resume_doc = await db.resumes.find_one({"id": resume_id})
-        if not resume_doc:
-            raise HTTPException(status_code=404, detail="Resume not found")
+        index = current_job_index()
+        position = index.position(job_id)
+        if position is None:
+            raise HTTPException(status_code=404, detail="Job not found")
         
-        resume = ResumeData(**resume_doc)
+        # Refit to a changed vocabulary or taxonomy off the event loop
+        await resume_index.sync(index)
+        candidates, total = resume_index.candidates(index, position, top_k, offset, min_score)
         
-        # Calculate matches for all jobs
-        matches = []
-        for job in sample_jobs:
-            match = calculate_job_match(resume, job)
-            matches.append(match)
+        return {"candidates": candidates, "total": total, "offset": offset, "top_k": top_k}
+    
+    except HTTPException:
+        # Re-raise HTTP exceptions
+        raise
+    except Exception as e:
+        logger.error(f"Error ranking job candidates: {e}")
+        raise HTTPException(status_code=500, detail="Error ranking candidates")
+
+# Declared before /match-jobs/{resume_id}, which would otherwise match "bulk"
+@api_router.post("/match-jobs/bulk")
+async def bulk_match_jobs(
+    top_k: int = Query(10, ge=1, le=MATCH_MAX_TOP_K),
+    min_score: Optional[float] = Query(None, ge=0, le=100),
+    batch_size: int = Query(MATCH_BULK_BATCH, ge=1, le=MATCH_BULK_MAX_BATCH)
+):
+    """Stream the best job matches of every stored resume as NDJSON
+    
+    One line per resume with its ``top_k`` matches at or above
+    ``min_score``, then a summary line. Resumes are read and scored
+    ``batch_size`` at a time, so memory does not grow with the number of
+    resumes. Every job is scored exactly, ANN index or not.
+    """
+    index = current_job_index()
+    
+    async def stream():
+        try:
+            async for record in stream_bulk_matches(index, resumes, top_k, min_score, batch_size):
+                yield ndjson_line(record)
+        except Exception as e:
+            logger.error(f"Error bulk matching jobs: {e}")
+            yield ndjson_line({"error": "Error calculating job matches"})
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+@api_router.post("/match-jobs/{resume_id}")
+async def match_jobs(
+    resume_id: str,
+    top_k: int = Query(MATCH_DEFAULT_TOP_K, ge=1, le=MATCH_MAX_TOP_K),
+    offset: int = Query(0, ge=0),
+    min_score: Optional[float] = Query(None, ge=0, le=100)
+):
+    """Get the best job matches for a specific resume
+    
+    Matches are sorted by score, highest first. ``top_k`` and ``offset``
+    select a page and ``min_score`` drops weaker matches; ``total`` counts
+    every match above the threshold. On catalogs large enough for the ANN
+    index, ``approximate`` is true and only its candidates are ranked.
+    """
+    try:
+        # Get resume from the resume cache, or the database on a miss
+        resume = await resumes.get_cached(resume_id)
+        if not resume:
+            raise HTTPException(status_code=404, detail="Resume not found")
         
-        # Sort by match score (highest first)
-        matches.sort(key=lambda x: x.match_score, reverse=True)
+        # Rank every job once per resume fingerprint, then build matches for the page only
+        index = current_job_index()
+        ranking = await match_cache.ranking(index, resume)
+        page = ranking.page(offset, top_k, min_score)
+        if page is None:
+            # Beyond the cached depth; scored off the event loop like a cache miss
+            matches, total = await asyncio.to_thread(index.top_matches, resume, top_k, offset, min_score)
+        else:
+            job_ids, scores, total = page
+            matches = ranked_matches(index, resume, job_ids, scores)
         
-        return {"matches": matches}
+        return {
+            "matches": matches,
+            "total": total,
+            "offset": offset,
+            "top_k": top_k,
+            "approximate": index.ann is not None
+        }
     
     except HTTPException:
         # Re-raise HTTP exceptions
@@ -532,16 +593,15 @@ async def match_jobs(resume_id: str):
 async def get_career_suggestions(resume_id: str):
     """Get career path suggestions for a resume"""
     try:
-        # Get resume from database
-        resume_doc = await db.resumes.find_one({"id": resume_id})
-        if not resume_doc:
+        # Get resume from the resume cache, or the database on a miss
+        resume = await resumes.get_cached(resume_id)
+        if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        resume = ResumeData(**resume_doc)
-        
         # Generate career suggestions based on skills
         suggestions = []
-        skill_set = set([skill.lower() for skill in resume.skills])
+        taxonomy = SKILL_TAXONOMY.get()
+        skill_set = {taxonomy.skill_key(skill) for skill in resume.skills}
         
         # Career path mapping
         career_paths = {
@@ -564,14 +624,14 @@ async def get_career_suggestions(resume_id: str):
         }
         
         for career, details in career_paths.items():
-            required_skills_lower = [skill.lower() for skill in details["required_skills"]]
-            matching_skills = len(skill_set.intersection(set(required_skills_lower)))
-            fit_score = (matching_skills / len(required_skills_lower)) * 100
+            required_keys = [taxonomy.skill_key(skill) for skill in details["required_skills"]]
+            matching_skills = len(skill_set.intersection(required_keys))
+            fit_score = (matching_skills / len(required_keys)) * 100
             
             suggestions.append(CareerSuggestion(
                 career_path=career,
                 current_fit=fit_score,
-                required_skills=[skill for skill in details["required_skills"] if skill.lower() not in skill_set],
+                required_skills=[skill for skill, key in zip(details["required_skills"], required_keys) if key not in skill_set],
                 learning_resources=details["learning_resources"]
             ))
         
@@ -587,54 +647,134 @@ async def get_career_suggestions(resume_id: str):
         logger.error(f"Error generating career suggestions: {e}")
         raise HTTPException(status_code=500, detail="Error generating career suggestions")
 
-@api_router.get("/resumes", response_model=List[ResumeData])
-async def get_resumes():
-    """Get all uploaded resumes"""
+def listed_fields(fields: Optional[List[str]], summary: bool) -> Optional[List[str]]:
+    """Fields of each resume a listing returns; None for whole documents"""
+    if summary and fields:
+        raise HTTPException(status_code=400, detail="Pass either fields or summary, not both")
+    if summary:
+        return list(SUMMARY_FIELDS)
+    unknown = [field for field in fields or [] if field not in RESUME_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown resume fields: {', '.join(unknown)}")
+    return fields or None
+
+@api_router.get("/resumes")
+async def get_resumes(
+    response: Response,
+    limit: int = Query(RESUMES_PAGE_SIZE, ge=1, le=RESUMES_MAX_LIMIT),
+    after: Optional[str] = None,
+    fields: Optional[List[str]] = Query(None),
+    summary: bool = False
+):
+    """Get uploaded resumes, oldest first, one page at a time
+    
+    The X-Next-Cursor header of a page, passed back as ``after``, gets the
+    next page; the last page has none. ``fields`` may be repeated to return
+    only those fields, and ``summary`` returns the ID, name, email, skills
+    and upload time; ``id`` and ``created_at`` are always included.
+    """
     try:
-        resumes = await db.resumes.find().to_list(100)
-        return [ResumeData(**resume) for resume in resumes]
+        docs, cursor = await resumes.page(listed_fields(fields, summary), limit, after)
+        if cursor:
+            response.headers["X-Next-Cursor"] = cursor
+        return docs
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except HTTPException:
+        # Re-raise HTTP exceptions
+        raise
     except Exception as e:
         logger.error(f"Error fetching resumes: {e}")
         raise HTTPException(status_code=500, detail="Error fetching resumes")
 
+@api_router.get("/resumes/export")
+async def export_resumes(
+    after: Optional[str] = None,
+    fields: Optional[List[str]] = Query(None),
+    summary: bool = False
+):
+    """Stream every uploaded resume after ``after`` as NDJSON, oldest first
+    
+    ``after``, ``fields`` and ``summary`` work as for ``/resumes``.
+    Documents are written as the database cursor returns them, so memory
+    does not grow with the number of resumes. If the export fails part way,
+    the last line is an error with the ``after`` cursor to resume from.
+    """
+    try:
+        docs = resumes.listing(listed_fields(fields, summary), after, batch_size=RESUMES_EXPORT_BATCH)
+    except InvalidCursor as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    async def stream():
+        last = None
+        chunk = bytearray()
+        try:
+            async for doc in docs:
+                chunk += ndjson_line(doc)
+                last = doc
+                if len(chunk) >= RESUMES_EXPORT_CHUNK:
+                    yield bytes(chunk)
+                    chunk.clear()
+            if chunk:
+                yield bytes(chunk)
+        except Exception as e:
+            logger.error(f"Error exporting resumes: {e}")
+            yield bytes(chunk) + ndjson_line({"error": "Error exporting resumes", "after": encode_cursor(last) if last else after})
+    
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
 @api_router.get("/skill-development-comparison/{resume_id}")
-async def skill_development_comparison(resume_id: str, skill_to_develop: str):
-    """Compare job matches before and after developing a specific skill"""
+async def skill_development_comparison(
+    resume_id: str,
+    skill_to_develop: Optional[str] = None,
+    skills: Optional[List[str]] = Query(None),
+    top_k: int = Query(MATCH_DEFAULT_TOP_K, ge=1, le=MATCH_MAX_TOP_K),
+    offset: int = Query(0, ge=0)
+):
+    """Compare job matches before and after developing one or more skills
+    
+    ``skill_to_develop`` names a single skill; ``skills`` may be repeated to
+    add several at once. Scores after the change are derived from the
+    baseline scores rather than by re-scoring a modified resume. ``top_k``
+    and ``offset`` select a page of each ranking; ``total`` counts every job.
+    """
     try:
-        # Get resume from database
-        resume_doc = await db.resumes.find_one({"id": resume_id})
-        if not resume_doc:
-            raise HTTPException(status_code=404, detail="Resume not found")
-        
-        original_resume = ResumeData(**resume_doc)
+        skills_to_develop = list(dict.fromkeys(
+            skill.strip() for skill in ([skill_to_develop] if skill_to_develop else []) + (skills or []) if skill.strip()
+        ))
+        if not skills_to_develop:
+            raise HTTPException(status_code=400, detail="Provide skill_to_develop or at least one skills parameter")
         
-        # Create modified resume with the new skill
-        modified_resume = ResumeData(**resume_doc)
-        modified_resume.skills = original_resume.skills + [skill_to_develop]
+        # Get resume from the resume cache, or the database on a miss
+        original_resume = await resumes.get_cached(resume_id)
+        if not original_resume:
+            raise HTTPException(status_code=404, detail="Resume not found")
         
-        # Calculate matches for both scenarios
-        original_matches = []
-        modified_matches = []
+        # Score the resume once and add the new skills' contribution. Sort
+        # both by match score (highest first), building matches for the page
+        # only. Scoring (and encoding, with embeddings) runs off the event loop.
+        index = current_job_index()
         
-        for job in sample_jobs:
-            # Original matches
-            original_match = calculate_job_match(original_resume, job)
-            original_matches.append(original_match)
-            
-            # Modified matches (with new skill)
-            modified_match = calculate_job_match(modified_resume, job)
-            modified_matches.append(modified_match)
+        def compare():
+            what_if = index.what_if(original_resume, skills_to_develop)
+            return (
+                what_if,
+                index.sorted_matches(what_if.before, what_if.before_skills, top_k, offset),
+                index.sorted_matches(what_if.after, what_if.after_skills, top_k, offset),
+            )
         
-        # Sort both by match score (highest first)
-        original_matches.sort(key=lambda x: x.match_score, reverse=True)
-        modified_matches.sort(key=lambda x: x.match_score, reverse=True)
+        what_if, original_matches, modified_matches = await asyncio.to_thread(compare)
         
         return {
-            "skill_developed": skill_to_develop,
+            "skill_developed": ", ".join(skills_to_develop),
+            "skills_developed": skills_to_develop,
             "original_matches": original_matches,
             "modified_matches": modified_matches,
+            "total": len(index),
+            "offset": offset,
+            "top_k": top_k,
             "original_resume_skills": original_resume.skills,
-            "modified_resume_skills": modified_resume.skills
+            "modified_resume_skills": what_if.after_skills.skills
         }
     
     except HTTPException:
@@ -644,6 +784,44 @@ async def skill_development_comparison(resume_id: str, skill_to_develop: str):
         logger.error(f"Error in skill development comparison: {e}")
         raise HTTPException(status_code=500, detail="Error calculating skill development comparison")
 
+@api_router.get("/next-skills/{resume_id}")
+async def next_skills(
+    resume_id: str,
+    top_k: int = Query(10, ge=1, le=MATCH_MAX_TOP_K),
+    sort_by: Literal["gain", "great_fit"] = "gain",
+    include_taxonomy: bool = False
+):
+    """Rank the skills a resume could learn next by their effect on job matches
+    
+    Every skill some job requires, and with ``include_taxonomy`` every other
+    known skill, is evaluated as a what-if in one batch. ``sort_by=gain``
+    ranks by the average match score change across the catalog, and
+    ``sort_by=great_fit`` by the number of jobs that would become a great fit.
+    """
+    try:
+        # Get resume from the resume cache, or the database on a miss
+        resume = await resumes.get_cached(resume_id)
+        if not resume:
+            raise HTTPException(status_code=404, detail="Resume not found")
+        index = current_job_index()
+        # One what-if over the whole catalog per candidate skill (and, with
+        # embeddings, encoding); run off the event loop
+        gains = await asyncio.to_thread(index.skill_gains, resume, include_taxonomy)
+        
+        if sort_by == "great_fit":
+            gains.sort(key=lambda gain: (gain.great_fit_jobs, gain.average_gain), reverse=True)
+        else:
+            gains.sort(key=lambda gain: gain.average_gain, reverse=True)
+        
+        return {"skills": gains[:top_k], "candidates": len(gains), "jobs": len(index), "sort_by": sort_by}
+    
+    except HTTPException:
+        # Re-raise HTTP exceptions
+        raise
+    except Exception as e:
+        logger.error(f"Error ranking next skills: {e}")
+        raise HTTPException(status_code=500, detail="Error ranking next skills")
+
 # AI Resume Q&A Helper Functions
 def format_resume_for_ai(resume: ResumeData) -> str:
     """Format resume data for AI context"""
@@ -783,13 +961,11 @@ Instructions:
 async def ask_resume_question(request: ResumeQARequest):
     """Ask questions about a specific resume using AI"""
     try:
-        # Get resume from database
-        resume_doc = await db.resumes.find_one({"id": request.resume_id})
-        if not resume_doc:
+        # Get resume from the resume cache, or the database on a miss
+        resume = await resumes.get_cached(request.resume_id)
+        if not resume:
             raise HTTPException(status_code=404, detail="Resume not found")
         
-        resume = ResumeData(**resume_doc)
-        
         # Format resume for AI context
         resume_text = format_resume_for_ai(resume)
         
@@ -805,6 +981,36 @@ async def ask_resume_question(request: ResumeQARequest):
         logger.error(f"Error in resume Q&A: {e}")
         raise HTTPException(status_code=500, detail="Error processing resume question")
 
+@api_router.post("/admin/reload-skills")
+async def reload_skills():
+    """Reload the skill taxonomy from its file.
+
+    Parse workers pick the new file up on their own within
+    SKILLS_RELOAD_INTERVAL seconds. Returns once this worker's job index has
+    been refitted to the new taxonomy.
+    """
+    try:
+        taxonomy = await asyncio.to_thread(SKILL_TAXONOMY.reload)
+    except SkillTaxonomyError as e:
+        logger.error(f"Error reloading skill taxonomy: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    await rebuild_job_index_for_taxonomy()
+
+    return {
+        "version": taxonomy.version,
+        "checksum": taxonomy.checksum,
+        "skills": len(taxonomy),
+    }
+
+@api_router.get("/metrics")
+async def get_metrics():
+    """Hit ratios of the parse, match and resume caches, and the scoring time saved"""
+    return {
+        "parse_cache": parse_cache.memory.stats(),
+        "match_cache": match_cache.stats(),
+        "resume_cache": resumes.cache.stats()
+    }
+
 # Include the router in the main app
 app.include_router(api_router)
 
@@ -816,6 +1022,82 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+@app.on_event("startup")
+async def start_parse_pool():
+    parse_pool.start()
+
+# Owners of the collections whose indexes are created at startup, before
+# anything is loaded from them
+INDEXED_COLLECTIONS = {
+    "resumes": resumes,
+    "resume features": resume_index,
+    "jobs": job_catalog,
+    "parse cache": parse_cache,
+    "match cache": match_cache,
+}
+
+@app.on_event("startup")
+async def ensure_indexes():
+    for name, owner in INDEXED_COLLECTIONS.items():
+        try:
+            await owner.ensure_indexes()
+        except Exception as e:
+            logger.warning(f"Could not create {name} indexes: {e}")
+
+@app.on_event("startup")
+async def move_inline_resume_text():
+    try:
+        # Scans the resumes once per database; later starts find it recorded in db.migrations
+        moved = await resumes.move_inline_text(db.migrations)
+        if moved:
+            logger.info(f"Moved the raw text of {moved} resumes to the resume text store")
+    except Exception as e:
+        logger.warning(f"Could not move raw resume text: {e}")
+
+@app.on_event("startup")
+async def load_job_catalog():
+    try:
+        if await job_catalog.seed(sample_jobs):
+            logger.info("Seeded the job catalog with the sample jobs")
+        changes = await job_catalog.refresh()
+        if changes is not None:
+            await apply_catalog_changes(changes)
+        logger.info(f"Job catalog loaded with {len(job_catalog)} jobs")
+    except Exception as e:
+        logger.warning(f"Could not load job catalog, matching the sample jobs: {e}")
+    job_catalog_tasks.append(asyncio.create_task(job_catalog.run(apply_catalog_changes)))
+    if JOB_CATALOG_WATCH:
+        job_catalog_tasks.append(asyncio.create_task(watch_job_catalog()))
+
+async def watch_job_catalog():
+    try:
+        await job_catalog.watch()
+    except Exception as e:
+        logger.warning(f"Job catalog change stream stopped, polling only: {e}")
+
+@app.on_event("startup")
+async def load_resume_index():
+    try:
+        await resume_index.load(db.resumes)
+        logger.info(f"Resume index loaded with {len(resume_index)} resumes")
+    except Exception as e:
+        logger.warning(f"Could not load resume index: {e}")
+    resume_index_tasks.append(asyncio.create_task(resume_index.run()))
+
+@app.on_event("shutdown")
+async def stop_resume_index_refresh():
+    for task in resume_index_tasks:
+        task.cancel()
+
+@app.on_event("shutdown")
+async def stop_job_catalog_refresh():
+    for task in job_catalog_tasks:
+        task.cancel()
+
+@app.on_event("shutdown")
+async def shutdown_parse_pool():
+    parse_pool.shutdown()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
\ No newline at end of file
@@ -0,0 +1,196 @@
+"""Multi-pattern skill matching.
+
+The skill vocabulary is compiled once into an Aho-Corasick automaton so a
+resume can be scanned for every known skill in a single linear pass,
+instead of running one regex per skill over the whole text.
+"""
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Sequence, Set, Tuple
+
+
+def is_word_char(ch: str) -> bool:
+    """Return True for characters that the regex ``\\w`` class would match"""
+    return ch.isalnum() or ch == '_'
+
+
+class SkillMatcher:
+    """Aho-Corasick automaton over lowercased skill names.
+
+    Transitions that follow failure links are resolved lazily and memoized,
+    so scanning is usually a single dict lookup per character. Only
+    characters that occur in some pattern are memoized: any other character
+    leads back to the root from every state, so the table stays bounded by
+    states x pattern alphabet whatever text is scanned.
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        self._skills: List[str] = []
+        self._patterns: List[str] = []
+        self._pattern_ids: Dict[str, int] = {}
+        self._pattern_skills: List[List[str]] = []
+
+        for skill in skills:
+            pattern = skill.lower()
+            if not pattern:
+                continue
+            pattern_id = self._pattern_ids.get(pattern)
+            if pattern_id is None:
+                pattern_id = len(self._patterns)
+                self._pattern_ids[pattern] = pattern_id
+                self._patterns.append(pattern)
+                self._pattern_skills.append([])
+            if skill not in self._pattern_skills[pattern_id]:
+                self._pattern_skills[pattern_id].append(skill)
+                self._skills.append(skill)
+
+        self._build()
+
+    def _build(self) -> None:
+        delta: List[Dict[str, int]] = [{}]
+        output: List[List[int]] = [[]]
+
+        for pattern_id, pattern in enumerate(self._patterns):
+            state = 0
+            for ch in pattern:
+                next_state = delta[state].get(ch)
+                if next_state is None:
+                    delta.append({})
+                    output.append([])
+                    next_state = len(delta) - 1
+                    delta[state][ch] = next_state
+                state = next_state
+            output[state].append(pattern_id)
+
+        self._delta = delta
+        self._fail = [0] * len(delta)
+        self._alphabet = frozenset(ch for pattern in self._patterns for ch in pattern)
+
+        # Breadth-first, so a state's failure target is always finished first
+        queue = deque(delta[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in list(delta[state].items()):
+                # Children of the root fail back to the root; all others follow
+                # the parent's failure transition on the same character.
+                self._fail[child] = self._transition(self._fail[state], ch) if state else 0
+                queue.append(child)
+            if self._fail[state]:
+                output[state] = output[state] + output[self._fail[state]]
+
+        # Each output entry is (pattern length, pattern id), ready for scanning
+        self._output: List[Tuple[Tuple[int, int], ...]] = [
+            tuple((len(self._patterns[pid]), pid) for pid in pids) for pids in output
+        ]
+        self._edges: List[Tuple[bool, bool]] = [
+            (is_word_char(pattern[0]), is_word_char(pattern[-1])) for pattern in self._patterns
+        ]
+
+    def _transition(self, state: int, ch: str) -> int:
+        """Follow failure links from ``state`` on ``ch`` and memoize the result"""
+        next_state = self._delta[state].get(ch)
+        if next_state is not None:
+            return next_state
+        if state == 0 or ch not in self._alphabet:
+            return 0
+        next_state = self._transition(self._fail[state], ch)
+        self._delta[state][ch] = next_state
+        return next_state
+
+    @property
+    def skills(self) -> List[str]:
+        """Skill names known to the matcher, in insertion order"""
+        return list(self._skills)
+
+    @property
+    def patterns(self) -> List[str]:
+        """Lowercased patterns, indexed by pattern id"""
+        return list(self._patterns)
+
+    @property
+    def state_count(self) -> int:
+        return len(self._delta)
+
+    def iter_matches(self, text_lower: str) -> Iterator[Tuple[int, int, int]]:
+        """Yield ``(start, end, pattern_id)`` for every occurrence in the text.
+
+        The text is expected to already be lowercased. Occurrences are reported
+        regardless of word boundaries; see :meth:`is_bounded`.
+        """
+        delta = self._delta
+        output = self._output
+        state = 0
+        for index, ch in enumerate(text_lower):
+            next_state = delta[state].get(ch)
+            state = next_state if next_state is not None else self._transition(state, ch)
+            if output[state]:
+                end = index + 1
+                for length, pattern_id in output[state]:
+                    yield end - length, end, pattern_id
+
+    def is_bounded(self, text: str, start: int, end: int, pattern_id: int) -> bool:
+        """Check that a match is not glued to neighbouring word characters.
+
+        Only edges of the skill that are themselves word characters need a
+        boundary, so "C++" matches in "C++," while "Java" does not match in
+        "JavaScript".
+        """
+        word_start, word_end = self._edges[pattern_id]
+        if word_start and start > 0 and is_word_char(text[start - 1]):
+            return False
+        if word_end and end < len(text) and is_word_char(text[end]):
+            return False
+        return True
+
+    def skills_for(self, pattern_id: int) -> List[str]:
+        return self._pattern_skills[pattern_id]
+
+    def find(
+        self,
+        text_lower: str,
+        unbounded_spans: Sequence[Tuple[int, int]] = (),
+    ) -> Set[str]:
+        """Return every skill found in ``text_lower`` with word boundaries.
+
+        Matches that fall entirely inside one of ``unbounded_spans`` are
+        accepted as plain substrings, which is how dedicated skills sections
+        have always been treated. The spans must not overlap.
+        """
+        found: Set[str] = set()
+        for pattern_id in self.find_patterns(text_lower, unbounded_spans):
+            found.update(self._pattern_skills[pattern_id])
+        return found
+
+    def find_patterns(
+        self,
+        text_lower: str,
+        unbounded_spans: Sequence[Tuple[int, int]] = (),
+    ) -> Set[int]:
+        """Like :meth:`find`, but return the ids of the matched patterns"""
+        found: Set[int] = set()
+        # Matches arrive in order of their end, so the only span that can hold
+        # one is the first not ending before it: a pointer that only moves
+        # forward keeps the whole scan linear however many spans there are.
+        spans = sorted(unbounded_spans)
+        span = 0
+        # iter_matches() inlined: this loop is the parser's hottest path
+        delta = self._delta
+        output = self._output
+        transition = self._transition
+        state = 0
+        for index, ch in enumerate(text_lower):
+            next_state = delta[state].get(ch)
+            state = next_state if next_state is not None else transition(state, ch)
+            if not output[state]:
+                continue
+            end = index + 1
+            while span < len(spans) and spans[span][1] < end:
+                span += 1
+            for length, pattern_id in output[state]:
+                if pattern_id in found:
+                    continue
+                start = end - length
+                if self.is_bounded(text_lower, start, end, pattern_id) or (
+                    span < len(spans) and spans[span][0] <= start
+                ):
+                    found.add(pattern_id)
+        return found
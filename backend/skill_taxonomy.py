@@ -0,0 +1,221 @@
+"""Skill taxonomy: canonical skill IDs, aliases and the compiled matcher.
+
+The vocabulary lives in a JSON file (``skills.json`` next to this module, or
+SKILLS_FILE). Every skill has an interned canonical ID, a display name, a
+category and any number of aliases, so "Vue", "Vue.js" and "vue.js" all
+resolve to the same skill. A TaxonomyRegistry holds the current taxonomy and
+swaps in a new one when the file changes, without restarting any worker.
+"""
+import hashlib
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from skill_matcher import SkillMatcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SKILLS_FILE = Path(__file__).parent / 'skills.json'
+
+
+class SkillTaxonomyError(ValueError):
+    """Raised when a skills file cannot be loaded or is inconsistent"""
+
+
+class Skill(NamedTuple):
+    id: str
+    name: str
+    category: str = ""
+    aliases: Tuple[str, ...] = ()
+
+
+def normalize_skill(name: str) -> str:
+    """Lowercase form used to look skills and job requirements up"""
+    return ' '.join(name.lower().split())
+
+
+class SkillTaxonomy:
+    """Immutable skill vocabulary with alias lookup and a compiled matcher"""
+
+    def __init__(self, skills: Iterable[Skill], version: str = "", checksum: str = ""):
+        self.version = version
+        self.checksum = checksum
+        self.skills: List[Skill] = []
+        self._index: Dict[str, int] = {}
+        # Normalized name or alias -> position in ``skills``
+        self._lookup: Dict[str, int] = {}
+
+        for skill in skills:
+            skill_id = sys.intern(skill.id)
+            if not skill_id or not skill.name:
+                raise SkillTaxonomyError(f"Skill entries need an id and a name: {skill!r}")
+            if skill_id in self._index:
+                raise SkillTaxonomyError(f"Duplicate skill id '{skill_id}'")
+            position = len(self.skills)
+            self._index[skill_id] = position
+            self.skills.append(skill._replace(id=skill_id, aliases=tuple(skill.aliases)))
+            for surface in (skill.name,) + tuple(skill.aliases):
+                key = normalize_skill(surface)
+                owner = self._lookup.setdefault(key, position)
+                if owner != position:
+                    raise SkillTaxonomyError(
+                        f"'{surface}' is used by both '{self.skills[owner].id}' and '{skill_id}'"
+                    )
+
+        # Precomputed forms used by the job and career scorers
+        self.ids: List[str] = [skill.id for skill in self.skills]
+        self.names: List[str] = [skill.name for skill in self.skills]
+        self.lower_names: List[str] = [skill.name.lower() for skill in self.skills]
+
+        self.matcher = SkillMatcher(
+            surface for skill in self.skills for surface in (skill.name,) + skill.aliases
+        )
+        # Matcher pattern id -> position of the skill it belongs to
+        self._pattern_skill: List[int] = [self._lookup[normalize_skill(p)] for p in self.matcher.patterns]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], checksum: str = "") -> "SkillTaxonomy":
+        try:
+            skills = [
+                Skill(
+                    id=str(entry['id']),
+                    name=str(entry['name']),
+                    category=str(entry.get('category', "")),
+                    aliases=tuple(str(alias) for alias in entry.get('aliases', ())),
+                )
+                for entry in data['skills']
+            ]
+        except (KeyError, TypeError, AttributeError) as e:
+            raise SkillTaxonomyError(f"Malformed skills data: {e}")
+        return cls(skills, version=str(data.get('version', "")), checksum=checksum)
+
+    @classmethod
+    def from_file(cls, path: os.PathLike) -> "SkillTaxonomy":
+        try:
+            raw = Path(path).read_bytes()
+            data = json.loads(raw)
+        except (OSError, ValueError) as e:
+            raise SkillTaxonomyError(f"Could not read skills file {path}: {e}")
+        return cls.from_dict(data, checksum=hashlib.sha256(raw).hexdigest()[:16])
+
+    def __len__(self) -> int:
+        return len(self.skills)
+
+    def __contains__(self, skill_id: str) -> bool:
+        return skill_id in self._index
+
+    def get(self, skill_id: str) -> Optional[Skill]:
+        position = self._index.get(skill_id)
+        return self.skills[position] if position is not None else None
+
+    def canonical_id(self, name: str) -> Optional[str]:
+        """Resolve a skill name or alias to its canonical ID"""
+        position = self._lookup.get(normalize_skill(name))
+        return self.skills[position].id if position is not None else None
+
+    def canonical_name(self, name: str) -> str:
+        """Display name for a skill name or alias; unknown names pass through"""
+        position = self._lookup.get(normalize_skill(name))
+        return self.skills[position].name if position is not None else name
+
+    def skill_key(self, name: str) -> str:
+        """Canonical ID when known, otherwise the normalized name.
+
+        Lets free-form job requirements be compared against resume skills
+        whether or not they are part of the taxonomy.
+        """
+        position = self._lookup.get(normalize_skill(name))
+        return self.skills[position].id if position is not None else normalize_skill(name)
+
+    def find(self, text_lower: str, unbounded_spans: Sequence[Tuple[int, int]] = ()) -> List[Skill]:
+        """Skills mentioned in ``text_lower``, in taxonomy order.
+
+        The cost depends on the text and the number of matches, not on the
+        size of the vocabulary.
+        """
+        positions = {self._pattern_skill[p] for p in self.matcher.find_patterns(text_lower, unbounded_spans)}
+        return [self.skills[position] for position in sorted(positions)]
+
+
+class TaxonomyRegistry:
+    """Holds the current SkillTaxonomy and reloads it when its file changes.
+
+    Every process (the API and each parse worker) has its own registry. The
+    file's modification time is checked at most every ``check_interval``
+    seconds, so an edited skills file is picked up everywhere without a
+    restart. A changed file is loaded in a background thread, and readers
+    keep getting the previous, complete taxonomy until the new one has been
+    built; a file that fails to load is logged and the previous taxonomy
+    stays in use.
+    """
+
+    def __init__(self, path: os.PathLike, check_interval: float = 5.0):
+        self.path = Path(path)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._mtime = self._stat()
+        self._checked_at = time.monotonic()
+        self._taxonomy = SkillTaxonomy.from_file(self.path)
+        # Background load started by get(), None before the first
+        self._loading: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_env(cls) -> "TaxonomyRegistry":
+        """Build a registry from SKILLS_FILE and SKILLS_RELOAD_INTERVAL"""
+        return cls(
+            os.environ.get('SKILLS_FILE', DEFAULT_SKILLS_FILE),
+            check_interval=float(os.environ.get('SKILLS_RELOAD_INTERVAL', 5)),
+        )
+
+    def _stat(self) -> float:
+        try:
+            return self.path.stat().st_mtime
+        except OSError:
+            return 0.0
+
+    def get(self) -> SkillTaxonomy:
+        """Return the current taxonomy, never building one.
+
+        When the file changed, a load starts in the background and the
+        current taxonomy is returned until the new one is swapped in.
+        """
+        if self.check_interval >= 0 and time.monotonic() - self._checked_at >= self.check_interval:
+            self._checked_at = time.monotonic()
+            if self._stat() != self._mtime and not self._lock.locked():
+                self._loading = threading.Thread(target=self._load_changed, name="skill-taxonomy-load", daemon=True)
+                self._loading.start()
+        return self._taxonomy
+
+    def _load_changed(self) -> None:
+        try:
+            self._load(changed_only=True)
+        except SkillTaxonomyError as e:
+            logger.error(f"Keeping skill taxonomy {self._taxonomy.version}: {e}")
+
+    def reload(self) -> SkillTaxonomy:
+        """Load the skills file now and swap it in.
+
+        Raises SkillTaxonomyError, leaving the current taxonomy in place, when
+        the file is missing or invalid.
+        """
+        return self._load(changed_only=False)
+
+    def _load(self, changed_only: bool) -> SkillTaxonomy:
+        with self._lock:
+            mtime = self._stat()
+            if changed_only and mtime == self._mtime:
+                # Loaded already, by reload() or an earlier background load
+                return self._taxonomy
+            # Recorded before building, so that get() does not start another
+            # load of the same file, and a broken file is not retried until
+            # it changes again
+            self._mtime = mtime
+            taxonomy = SkillTaxonomy.from_file(self.path)
+            self._taxonomy = taxonomy
+        logger.info(f"Loaded skill taxonomy {taxonomy.version} ({len(taxonomy)} skills)")
+        return taxonomy
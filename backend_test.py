@@ -442,13 +442,13 @@ class JobMateAPITester(unittest.TestCase):
         
         # Test invalid file type for upload
         print("   Testing invalid file type...")
-        with tempfile.NamedTemporaryFile(suffix='.txt', delete=False) as temp_file:
+        with tempfile.NamedTemporaryFile(suffix='.png', delete=False) as temp_file:
             temp_txt_path = temp_file.name
-            temp_file.write(b"This is a text file, not a resume")
+            temp_file.write(b"\x89PNG\r\n\x1a\n This is an image, not a resume")
         
         try:
             with open(temp_txt_path, 'rb') as txt_file:
-                files = {'file': ('resume.txt', txt_file, 'text/plain')}
+                files = {'file': ('resume.png', txt_file, 'image/png')}
                 response = requests.post(f"{API_URL}/upload-resume", files=files)
             
             self.assertEqual(response.status_code, 400)
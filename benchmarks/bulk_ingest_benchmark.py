@@ -0,0 +1,95 @@
+"""Benchmark: bulk ingestion throughput against a running backend.
+
+Uploads the same set of generated resumes once by looping over
+/api/upload-resume and once through /api/upload-resumes/bulk (as a ZIP
+archive), and reports files per second for each. Every resume is unique so
+the parse cache does not short-circuit either path.
+
+Start the backend first (cd backend; uvicorn server:app --port 8001), then:
+    python benchmarks/bulk_ingest_benchmark.py [file_count]
+"""
+import io
+import json
+import os
+import sys
+import time
+import uuid
+import zipfile
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tests.fixtures import make_pdf  # noqa: E402
+
+BACKEND_URL = os.environ.get("BACKEND_URL", "http://localhost:8001")
+API_URL = f"{BACKEND_URL}/api"
+
+TEMPLATE = """Candidate {n}
+candidate{n}.{run}@example.com
+(555) 123-{n:04d}
+
+SKILLS
+Python, JavaScript, React, Docker, Kubernetes, SQL, Git
+
+EXPERIENCE
+Software Engineer, Company {n}
+2019-2023
+Built services with FastAPI and deployed them on AWS.
+
+EDUCATION
+University of Technology
+Bachelor of Science in Computer Science, 2018
+"""
+
+
+def make_resumes(count):
+    run = uuid.uuid4().hex[:8]
+    return [(f"resume_{n}.pdf", make_pdf([TEMPLATE.format(n=n, run=run)])) for n in range(count)]
+
+
+def single_file_loop(resumes):
+    start = time.perf_counter()
+    for filename, content in resumes:
+        response = requests.post(f"{API_URL}/upload-resume", files={"file": (filename, content, "application/pdf")})
+        response.raise_for_status()
+    return time.perf_counter() - start
+
+
+def bulk_zip(resumes):
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+        for filename, content in resumes:
+            zf.writestr(filename, content)
+
+    start = time.perf_counter()
+    response = requests.post(
+        f"{API_URL}/upload-resumes/bulk",
+        files=[("files", ("resumes.zip", archive.getvalue(), "application/zip"))],
+        stream=True,
+    )
+    response.raise_for_status()
+    summary = {}
+    for line in response.iter_lines():
+        record = json.loads(line)
+        summary = record.get("summary", summary)
+    elapsed = time.perf_counter() - start
+    if summary.get("stored") != len(resumes):
+        print(f"warning: bulk summary {summary}")
+    return elapsed
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    print(f"Uploading {count} resumes to {API_URL}")
+    loop_seconds = single_file_loop(make_resumes(count))
+    bulk_seconds = bulk_zip(make_resumes(count))
+    print(f"{'mode':>22} {'seconds':>8} {'files/s':>8}")
+    print(f"{'single-file loop':>22} {loop_seconds:>8.2f} {count / loop_seconds:>8.1f}")
+    print(f"{'bulk (zip, ndjson)':>22} {bulk_seconds:>8.2f} {count / bulk_seconds:>8.1f}")
+    print(f"speedup: {loop_seconds / bulk_seconds:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
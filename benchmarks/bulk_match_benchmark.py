@@ -0,0 +1,52 @@
+"""Benchmark: ranking many resumes against the whole catalog.
+
+"per resume" ranks each resume with JobIndex.rank, as a loop over
+/match-jobs/{resume_id} does without its database round trips; "batch" is
+JobIndex.rank_batch over batches of resumes, as /match-jobs/bulk does.
+Both return the top 10 jobs per resume.
+
+Run from the repository root:
+    python benchmarks/bulk_match_benchmark.py
+"""
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from job_index import JobIndex  # noqa: E402
+from resume_parser import SKILL_TAXONOMY  # noqa: E402
+from tests.fixtures import make_jobs  # noqa: E402
+from tests.test_resume_index import make_resumes  # noqa: E402
+
+TOP_K = 10
+
+
+def timed(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    taxonomy = SKILL_TAXONOMY.get()
+    resumes = make_resumes(1000)
+    print(f"{'jobs':>7} {'batch':>6} {'per resume/s':>13} {'batch/s':>9} {'speedup':>8}")
+    for count in (1_000, 10_000, 50_000):
+        index = JobIndex(make_jobs(count, taxonomy.names), taxonomy)
+        single = timed(lambda: [index.rank(resume, TOP_K) for resume in resumes])
+        for batch_size in (64, 256):
+            batched = timed(lambda: [
+                index.rank_batch(resumes[start:start + batch_size], TOP_K)
+                for start in range(0, len(resumes), batch_size)
+            ])
+            print(
+                f"{count:>7} {batch_size:>6} {len(resumes) / single:>13.0f} {len(resumes) / batched:>9.0f}"
+                f" {single / batched:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
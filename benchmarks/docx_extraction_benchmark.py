@@ -0,0 +1,67 @@
+"""Benchmark: DOCX extraction latency and peak traced memory.
+
+Compares docx2txt.process, which the parser used before, with the streaming
+extract_docx_text on image-heavy packages of growing size. Memory is the
+tracemalloc peak during one extraction; the DOCX bytes themselves are
+allocated before tracing starts.
+
+Run from the repository root:
+    python benchmarks/docx_extraction_benchmark.py
+"""
+import io
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from resume_parser import ExtractionBudget, extract_docx_text  # noqa: E402
+from tests.fixtures import SAMPLE_RESUME_PAGE, make_docx  # noqa: E402
+
+
+def docx2txt_extract(content):
+    import docx2txt
+
+    return docx2txt.process(io.BytesIO(content))
+
+
+def streaming_extract(content):
+    text, _ = extract_docx_text(content, ExtractionBudget())
+    return text
+
+
+def unbounded_extract(content):
+    text, _ = extract_docx_text(content, ExtractionBudget(max_chars=10**9, max_seconds=10**6))
+    return text
+
+
+def measure(func, content, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(content)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    text = func(content)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return best, peak / 1e6, len(text)
+
+
+def main():
+    implementations = [("docx2txt", docx2txt_extract), ("streaming", streaming_extract), ("unbounded", unbounded_extract)]
+    print(f"{'pages':>6} {'images':>7} {'package MB':>11} {'impl':>10} {'ms':>9} {'peak MB':>8} {'chars':>9}")
+    for pages, images in ((1, 10), (20, 20), (300, 40)):
+        content = make_docx(SAMPLE_RESUME_PAGE.split("\n") * pages, header="John Doe", images=images, image_bytes=512 * 1024)
+        for name, func in implementations:
+            elapsed, peak, chars = measure(func, content)
+            print(f"{pages:>6} {images:>7} {len(content) / 1e6:>11.1f} {name:>10} "
+                  f"{elapsed * 1000:>9.2f} {peak:>8.2f} {chars:>9}")
+
+
+if __name__ == "__main__":
+    main()
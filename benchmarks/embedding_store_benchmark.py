@@ -0,0 +1,66 @@
+"""Benchmark: job embedding store startup and scoring.
+
+"cold" syncs a catalog into an empty store, encoding every job; "warm" syncs
+the same catalog again, as a restarted worker does, and only hashes the job
+texts and maps the file; "1% changed" re-encodes one job in a hundred.
+"score" is one resume scored against every job with embeddings. Uses the
+hashing stand-in encoder unless a model directory is passed, so encoding
+times are far below those of a real model.
+
+Run from the repository root:
+    python benchmarks/embedding_store_benchmark.py [model-directory]
+"""
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from embeddings import EmbeddingStore, load_encoder  # noqa: E402
+from job_index import JobIndex  # noqa: E402
+from resume_parser import SKILL_TAXONOMY, parse_resume_content  # noqa: E402
+from tests.fixtures import SAMPLE_RESUME_PAGE, make_jobs  # noqa: E402
+
+
+def timed(func):
+    start = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - start
+
+
+def best_of(func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    encoder = load_encoder(sys.argv[1] if len(sys.argv) > 1 else "hashing")
+    resume = parse_resume_content(SAMPLE_RESUME_PAGE)
+    taxonomy = SKILL_TAXONOMY.get()
+    print(f"{encoder.name}, {encoder.dim} dimensions")
+    print(f"{'jobs':>7} {'cold s':>8} {'warm s':>8} {'1% changed s':>13} {'score ms':>9}")
+    for count in (1_000, 10_000, 100_000):
+        jobs = make_jobs(count, taxonomy.names)
+        changed = [
+            job.copy(update={"description": job.description + " updated"}) if position % 100 == 0 else job
+            for position, job in enumerate(jobs)
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            store = EmbeddingStore(directory, encoder)
+            _, cold = timed(lambda: store.sync(jobs))
+            _, warm = timed(lambda: EmbeddingStore(directory, encoder).sync(jobs))
+            embeddings, partial = timed(lambda: EmbeddingStore(directory, encoder).sync(changed))
+            index = JobIndex(changed, taxonomy, embeddings)
+            score = best_of(lambda: index.score(resume))
+        print(f"{count:>7} {cold:>8.2f} {warm:>8.2f} {partial:>13.2f} {score * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark: recall@k and latency of two-stage ANN matching against exact search.
+
+"exact" is JobIndex.top_matches scoring every job; "ann" first takes the
+given number of candidates from the IVF index, then scores them exactly.
+Recall@k is the share of the exact top k that the two-stage page returns,
+averaged over synthetic resumes. "+10%" rows build the ANN index on 90% of
+the catalog and insert the rest with JobIndex.add_jobs.
+
+The synthetic catalog draws requirements uniformly from the taxonomy, so it
+has no natural clusters; real catalogs, where jobs group by role, give the
+IVF index an easier time.
+
+Run from the repository root:
+    python benchmarks/job_ann_benchmark.py
+"""
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from job_index import JobIndex  # noqa: E402
+from models import ResumeData  # noqa: E402
+from resume_parser import SKILL_TAXONOMY  # noqa: E402
+from tests.fixtures import JOB_WORDS, make_jobs  # noqa: E402
+
+QUERIES = 50
+KS = (10, 20)
+
+
+def make_resumes(skills, count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        ResumeData(
+            skills=rng.choice(skills, size=rng.integers(4, 13), replace=False).tolist(),
+            experience=[{"description": " ".join(rng.choice(JOB_WORDS, size=30).tolist())}],
+        )
+        for _ in range(count)
+    ]
+
+
+def run(index, resumes, k):
+    """Job IDs of the top k per resume, and the mean latency in ms"""
+    results = []
+    start = time.perf_counter()
+    for resume in resumes:
+        page, _ = index.top_matches(resume, k)
+        results.append([match.job.id for match in page])
+    return results, (time.perf_counter() - start) / len(resumes) * 1000
+
+
+def recall(exact, approximate, k):
+    return np.mean([len(set(e[:k]) & set(a[:k])) / k for e, a in zip(exact, approximate)])
+
+
+def main():
+    taxonomy = SKILL_TAXONOMY.get()
+    resumes = make_resumes(taxonomy.names, QUERIES)
+    print(f"{'jobs':>7} {'candidates':>10} {'build s':>8} {'exact ms':>9} {'ann ms':>7} "
+          + " ".join(f"{f'recall@{k}':>9}" for k in KS))
+    for count in (10_000, 100_000, 300_000):
+        jobs = make_jobs(count, taxonomy.names)
+        index = JobIndex(jobs, taxonomy)
+        exact, exact_ms = run(index, resumes, max(KS))
+
+        for candidates in (1000, 2000, 5000):
+            start = time.perf_counter()
+            index.build_ann(candidates)
+            build = time.perf_counter() - start
+            approximate, ann_ms = run(index, resumes, max(KS))
+            print(f"{count:>7} {candidates:>10} {build:>8.2f} {exact_ms:>9.2f} {ann_ms:>7.2f} "
+                  + " ".join(f"{recall(exact, approximate, k):>9.3f}" for k in KS))
+        index.ann = None
+
+        # Insert the last 10% after the ANN index has been built
+        split = count * 9 // 10
+        grown = JobIndex(jobs[:split], taxonomy)
+        grown.build_ann(2000)
+        grown.add_jobs(jobs[split:])
+        approximate, ann_ms = run(grown, resumes, max(KS))
+        exact_grown, _ = run(JobIndex(jobs, taxonomy), resumes, max(KS))
+        print(f"{'+10%':>7} {2000:>10} {'-':>8} {'-':>9} {ann_ms:>7.2f} "
+              + " ".join(f"{recall(exact_grown, approximate, k):>9.3f}" for k in KS))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark: semantic match latency against catalogs of 5 to 100k jobs.
+
+"legacy" fits a two-document TfidfVectorizer per (resume, job) pair, as
+calculate_job_match used to; it is only run up to 1,000 jobs. "index" is
+JobIndex.score: one TF-IDF transform plus the semantic and skill-incidence
+products for every job. The index build time is reported separately.
+"sorted" builds a JobMatch for every job and sorts them, as /match-jobs did
+before paging; "top 20" is JobIndex.top_matches for the first page.
+
+Run from the repository root:
+    python benchmarks/job_match_benchmark.py
+"""
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from sklearn.feature_extraction.text import TfidfVectorizer  # noqa: E402
+from sklearn.metrics.pairwise import cosine_similarity  # noqa: E402
+
+from job_index import JobIndex, job_text, resume_text  # noqa: E402
+from resume_parser import SKILL_TAXONOMY, parse_resume_content  # noqa: E402
+from tests.fixtures import SAMPLE_RESUME_PAGE, make_jobs  # noqa: E402
+
+LEGACY_MAX_JOBS = 1000
+
+
+def legacy_scores(resume, jobs):
+    text = resume_text(resume)
+    scores = []
+    for job in jobs:
+        matrix = TfidfVectorizer().fit_transform([text, job_text(job)])
+        scores.append(cosine_similarity(matrix[0:1], matrix[1:2])[0][0])
+    return scores
+
+
+def best_of(func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    resume = parse_resume_content(SAMPLE_RESUME_PAGE)
+    taxonomy = SKILL_TAXONOMY.get()
+    skills = taxonomy.names
+    print(f"{'jobs':>7} {'legacy ms':>10} {'build s':>8} {'index ms':>9} {'speedup':>8} "
+          f"{'sorted ms':>10} {'top 20 ms':>10}")
+    for count in (5, 100, 1_000, 10_000, 100_000):
+        jobs = make_jobs(count, skills)
+        start = time.perf_counter()
+        index = JobIndex(jobs, taxonomy)
+        build = time.perf_counter() - start
+        current = best_of(lambda: index.score(resume))
+        full = best_of(lambda: sorted(index.matches(resume), key=lambda m: m.match_score, reverse=True), repeat=1)
+        page = best_of(lambda: index.top_matches(resume, 20))
+
+        if count <= LEGACY_MAX_JOBS:
+            legacy = best_of(lambda: legacy_scores(resume, jobs), repeat=1 if count > 100 else 3)
+            legacy_columns = f"{legacy * 1000:>10.1f} {build:>8.2f} {current * 1000:>9.2f} {legacy / current:>7.0f}x"
+        else:
+            legacy_columns = f"{'-':>10} {build:>8.2f} {current * 1000:>9.2f} {'-':>8}"
+        print(f"{count:>7} {legacy_columns} {full * 1000:>10.1f} {page * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark: "best next skill" ranking against catalogs of 1k to 100k jobs.
+
+"per skill" runs JobIndex.what_if once for each candidate, the way a client
+trying one skill at a time would; it is only run up to 10,000 jobs. "batch"
+is JobIndex.skill_gains over the same candidates in one pass. The 10k-job
+row is checked against BUDGET_MS, the latency /next-skills is sized for.
+
+Run from the repository root:
+    python benchmarks/next_skill_benchmark.py
+"""
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from job_index import JobIndex  # noqa: E402
+from resume_parser import SKILL_TAXONOMY, parse_resume_content  # noqa: E402
+from tests.fixtures import SAMPLE_RESUME_PAGE, make_jobs  # noqa: E402
+
+BUDGET_MS = 100
+PER_SKILL_MAX_JOBS = 10_000
+
+
+def best_of(func, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    resume = parse_resume_content(SAMPLE_RESUME_PAGE)
+    taxonomy = SKILL_TAXONOMY.get()
+    print(f"{'jobs':>7} {'candidates':>11} {'per skill ms':>13} {'batch ms':>9}")
+    for count in (1_000, 10_000, 100_000):
+        index = JobIndex(make_jobs(count, taxonomy.names), taxonomy)
+        gains = index.skill_gains(resume, include_taxonomy=True)
+        batch = best_of(lambda: index.skill_gains(resume, include_taxonomy=True))
+        per_skill = "-"
+        if count <= PER_SKILL_MAX_JOBS:
+            elapsed = best_of(lambda: [index.what_if(resume, [gain.skill]) for gain in gains], repeat=1)
+            per_skill = f"{elapsed * 1000:.1f}"
+        print(f"{count:>7} {len(gains):>11} {per_skill:>13} {batch * 1000:>9.2f}")
+        if count == 10_000 and batch * 1000 > BUDGET_MS:
+            print(f"        over the {BUDGET_MS} ms budget")
+
+
+if __name__ == "__main__":
+    main()
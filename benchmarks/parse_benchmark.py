@@ -0,0 +1,37 @@
+"""Benchmark: end-to-end parse_resume_content time by resume size.
+
+Run from the repository root:
+    python benchmarks/parse_benchmark.py
+"""
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from resume_parser import parse_resume_content  # noqa: E402
+from tests.fixtures import SAMPLE_RESUME_PAGE as PAGE  # noqa: E402
+
+
+def measure(func, text, min_seconds=0.5):
+    runs = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_seconds or runs < 3:
+        func(text)
+        runs += 1
+        elapsed = time.perf_counter() - start
+    return elapsed / runs
+
+
+def main():
+    print(f"{'pages':>6} {'chars':>9} {'parse ms':>9}")
+    for pages in (1, 10, 50, 200):
+        text = PAGE * pages
+        print(f"{pages:>6} {len(text):>9} {measure(parse_resume_content, text) * 1000:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
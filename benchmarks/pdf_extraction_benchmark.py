@@ -0,0 +1,81 @@
+"""Benchmark: PDF extraction latency and peak RSS by page count.
+
+Each measurement runs in a fresh process so ru_maxrss reflects a single
+extraction. "legacy" is the old whole-document loop with ``text +=``;
+"streaming" is extract_pdf_text with its default budget and "unbounded" is
+the same streaming extractor with the budget lifted.
+
+Run from the repository root:
+    python benchmarks/pdf_extraction_benchmark.py
+"""
+import io
+import multiprocessing
+import resource
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from resume_parser import ExtractionBudget, extract_pdf_text  # noqa: E402
+from tests.fixtures import make_pdf  # noqa: E402
+
+PAGE = "\n".join(
+    f"Line {n}: built data pipelines in Python and SQL, deployed with Docker on AWS" for n in range(50)
+)
+
+
+def legacy_extract(file_content):
+    import pdfplumber
+
+    with pdfplumber.open(io.BytesIO(file_content)) as pdf:
+        text = ""
+        for page in pdf.pages:
+            page_text = page.extract_text()
+            if page_text:
+                text += page_text + "\n"
+        return text.strip()
+
+
+def streaming_extract(file_content):
+    text, _ = extract_pdf_text(file_content, ExtractionBudget())
+    return text
+
+
+def unbounded_extract(file_content):
+    text, _ = extract_pdf_text(file_content, ExtractionBudget(max_pages=10**6, max_chars=10**9, max_seconds=10**6))
+    return text
+
+
+def run_once(name, pages, queue):
+    pdf = make_pdf([PAGE] * pages)
+    before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    text = {"legacy": legacy_extract, "streaming": streaming_extract, "unbounded": unbounded_extract}[name](pdf)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((elapsed, (peak - before) / 1024, len(text)))
+
+
+def measure(name, pages):
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    process = context.Process(target=run_once, args=(name, pages, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main():
+    print(f"{'pages':>6} {'impl':>10} {'seconds':>8} {'peak RSS +MB':>13} {'chars':>9}")
+    for pages in (10, 100, 500):
+        for name in ("legacy", "streaming", "unbounded"):
+            elapsed, rss_mb, chars = measure(name, pages)
+            print(f"{pages:>6} {name:>10} {elapsed:>8.2f} {rss_mb:>13.1f} {chars:>9}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark: reading the same resume for four endpoints, with and without the resume cache.
+
+The frontend calls /match-jobs, /career-suggestions,
+/skill-development-comparison and /resume-qa back to back; each reads the
+resume with ResumeRepository. "uncached" is ``get`` with the endpoint's
+fields, as before ResumeCache; "cached" is ``get_cached``. Resumes come from
+an in-memory collection that waits a simulated database round trip
+(0.5 ms by default) per read, so the times are the round trips and the
+Pydantic validation the cache saves.
+
+Run from the repository root:
+    python benchmarks/resume_cache_benchmark.py [round trip ms]
+"""
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from resume_cache import ResumeCache  # noqa: E402
+from resume_repository import MATCH_FIELDS, QA_FIELDS, SKILL_FIELDS, ResumeRepository  # noqa: E402
+from tests.fixtures import MemoryCollection  # noqa: E402
+from tests.test_resume_index import make_resumes  # noqa: E402
+
+ENDPOINT_FIELDS = [MATCH_FIELDS, SKILL_FIELDS, MATCH_FIELDS, QA_FIELDS]
+
+
+class SlowCollection(MemoryCollection):
+    def __init__(self, docs, round_trip):
+        super().__init__(docs)
+        self.by_id = {doc["id"]: doc for doc in self.docs}
+        self.round_trip = round_trip
+
+    async def find_one(self, query, projection=None):
+        await asyncio.sleep(self.round_trip)
+        return self._project(self.by_id[query["id"]], projection)
+
+
+async def uncached(repository, ids):
+    for resume_id in ids:
+        for fields in ENDPOINT_FIELDS:
+            await repository.get(resume_id, fields)
+
+
+async def cached(repository, ids):
+    for resume_id in ids:
+        for _ in ENDPOINT_FIELDS:
+            await repository.get_cached(resume_id)
+
+
+def main():
+    round_trip = float(sys.argv[1]) / 1000 if len(sys.argv) > 1 else 0.0005
+    resumes = make_resumes(500)
+    ids = [resume.id for resume in resumes]
+    collection = SlowCollection((resume.dict() for resume in resumes), round_trip)
+    repository = ResumeRepository(collection, cache=ResumeCache(max_entries=1024))
+
+    start = time.perf_counter()
+    asyncio.run(uncached(repository, ids))
+    before = (time.perf_counter() - start) / len(ids)
+    start = time.perf_counter()
+    asyncio.run(cached(repository, ids))
+    after = (time.perf_counter() - start) / len(ids)
+
+    print(f"{len(ids)} resumes, {len(ENDPOINT_FIELDS)} endpoint reads each, {round_trip * 1000:.1f} ms round trip")
+    print(f"uncached {before * 1000:.2f} ms per resume, cached {after * 1000:.2f} ms, speedup {before / after:.1f}x")
+    print(repository.cache.stats())
+
+
+if __name__ == "__main__":
+    main()
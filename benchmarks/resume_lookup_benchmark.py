@@ -0,0 +1,94 @@
+"""Benchmark: resume lookup by id against a large resumes collection.
+
+Fills a scratch database with synthetic resumes (1,000,000 by default, each
+with a few KB of raw_text) and times find_one({"id": ...}) three ways:
+without an index on id (a collection scan, as before ResumeRepository
+created one), with the unique id index and the whole document, and with the
+index and the MATCH_FIELDS projection that matching uses. Also reports the
+bytes each lookup returns.
+
+Needs a running MongoDB; uses MONGO_URL (default mongodb://localhost:27017)
+and drops its scratch database when done. Filling 1M resumes takes minutes.
+
+Run from the repository root:
+    python benchmarks/resume_lookup_benchmark.py [count]
+"""
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+import bson  # noqa: E402
+from pymongo import MongoClient  # noqa: E402
+
+from models import ResumeData  # noqa: E402
+from resume_repository import MATCH_FIELDS, projection  # noqa: E402
+from tests.fixtures import JOB_WORDS, SAMPLE_RESUME_PAGE  # noqa: E402
+
+DATABASE = "resume_lookup_benchmark"
+INSERT_BATCH = 10_000
+
+
+def make_resume(number, rng):
+    return ResumeData(
+        id=f"resume-{number:08d}",
+        name=f"Candidate {number}",
+        email=f"candidate{number}@example.com",
+        skills=rng.sample(["Python", "SQL", "React", "Docker", "AWS", "Go", "Java", "Kubernetes"], 5),
+        experience=[{"title": "Engineer", "description": " ".join(rng.choices(JOB_WORDS, k=40))}],
+        raw_text=SAMPLE_RESUME_PAGE * 6,
+        content_hash=f"{number:064x}",
+    ).dict()
+
+
+def fill(collection, count):
+    rng = random.Random(0)
+    for start in range(0, count, INSERT_BATCH):
+        collection.insert_many([make_resume(number, rng) for number in range(start, min(start + INSERT_BATCH, count))])
+
+
+def lookups(collection, ids, fields=None):
+    timings, sizes = [], []
+    for resume_id in ids:
+        start = time.perf_counter()
+        doc = collection.find_one({"id": resume_id}, projection(fields))
+        timings.append(time.perf_counter() - start)
+        sizes.append(len(bson.encode(doc)))
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95) - 1], statistics.mean(sizes)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    client = MongoClient(os.environ.get("MONGO_URL", "mongodb://localhost:27017"))
+    client.drop_database(DATABASE)
+    collection = client[DATABASE].resumes
+    try:
+        start = time.perf_counter()
+        fill(collection, count)
+        print(f"Inserted {count} resumes in {time.perf_counter() - start:.0f}s")
+
+        rng = random.Random(1)
+        print(f"{'lookup':<28} {'p50 ms':>9} {'p95 ms':>9} {'bytes':>8}")
+        scan_ids = [f"resume-{rng.randrange(count):08d}" for _ in range(5)]
+        p50, p95, size = lookups(collection, scan_ids)
+        print(f"{'no index, full document':<28} {p50 * 1000:>9.2f} {p95 * 1000:>9.2f} {size:>8.0f}")
+
+        collection.create_index("id", unique=True)
+        for label, fields in (("id index, full document", None), ("id index, MATCH_FIELDS", MATCH_FIELDS)):
+            # Fresh ids per run, so that neither reads documents the other brought into cache
+            ids = [f"resume-{rng.randrange(count):08d}" for _ in range(2000)]
+            p50, p95, size = lookups(collection, ids, fields)
+            print(f"{label:<28} {p50 * 1000:>9.2f} {p95 * 1000:>9.2f} {size:>8.0f}")
+    finally:
+        client.drop_database(DATABASE)
+
+
+if __name__ == "__main__":
+    main()
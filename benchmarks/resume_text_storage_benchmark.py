@@ -0,0 +1,120 @@
+"""Benchmark: storage and cache footprint of raw resume text, inline vs out of line.
+
+Parses a synthetic corpus of varied resumes (5,000 by default) and measures
+the BSON size of what each layout stores: "inline" keeps raw_text in every
+resume document and parse cache entry, as before ResumeTextStore; "out of
+line" stores resumes without it plus one zlib-compressed text document per
+resume, and parse cache entries with the text compressed beside the resume.
+Every resume is counted as a distinct upload with its own cache entry. The resumes
+collection is what id lookups, listings and matching read, so its size is
+the working set Mongo has to keep cached for them. Also times compressing
+and decompressing one resume's text.
+
+Sizes are of uncompressed BSON, as documents sit in Mongo's cache; on disk
+the storage engine compresses blocks further in both layouts.
+
+Run from the repository root:
+    python benchmarks/resume_text_storage_benchmark.py [count]
+"""
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+import bson  # noqa: E402
+
+from models import TextExtraction  # noqa: E402
+from parse_cache import CachedParse, ParseCache  # noqa: E402
+from resume_parser import SKILL_TAXONOMY, parse_resume_content  # noqa: E402
+from resume_text import ResumeTextStore, decompress_text  # noqa: E402
+from tests.fixtures import JOB_TITLES, JOB_WORDS  # noqa: E402
+
+FIRST_NAMES = "Ada Grace Linus Margaret Alan Barbara Dennis Frances Ken Radia Guido Sophie Tim Katherine".split()
+LAST_NAMES = "Lovelace Hopper Torvalds Hamilton Turing Liskov Ritchie Allen Thompson Perlman Rossum Wilson".split()
+VERBS = "Built Designed Led Migrated Maintained Automated Scaled Launched Owned Mentored Reduced Improved".split()
+
+
+def make_text(number, rng, skills):
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        name,
+        f"{name.split()[0].lower()}.{number}@example.com",
+        f"({rng.randint(200, 999)}) {rng.randint(200, 999)}-{rng.randint(1000, 9999)}",
+        "",
+        "SKILLS",
+        ", ".join(rng.sample(skills, rng.randint(6, 18))),
+        "",
+        "EXPERIENCE",
+    ]
+    year = 2024
+    for _ in range(rng.randint(2, 5)):
+        start = year - rng.randint(1, 4)
+        lines += [f"{rng.choice(JOB_TITLES)}, Company {rng.randint(1, 5000)}", f"{start}-{year}"]
+        for _ in range(rng.randint(3, 7)):
+            words = rng.choices(JOB_WORDS, k=rng.randint(8, 16)) + rng.sample(skills, 2)
+            rng.shuffle(words)
+            lines.append(f"{rng.choice(VERBS)} {' '.join(words)} by {rng.randint(5, 80)}%.")
+        lines.append("")
+        year = start
+    lines += ["EDUCATION", f"University {rng.randint(1, 300)}", f"Bachelor of Science in Computer Science, {year - 4}"]
+    return "\n".join(lines)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rng = random.Random(0)
+    skills = SKILL_TAXONOMY.get().names
+    resumes = [parse_resume_content(make_text(number, rng, skills)) for number in range(count)]
+    store = ResumeTextStore(None)
+    cache = ParseCache(None)
+    entries = [
+        CachedParse(
+            content_hash=f"{number:064x}", resume=resume,
+            extraction=TextExtraction(characters=len(resume.raw_text)), resume_id=resume.id
+        )
+        for number, resume in enumerate(resumes)
+    ]
+
+    inline = sum(len(bson.encode(resume.dict())) for resume in resumes)
+    cache_inline = sum(len(bson.encode(entry.dict())) for entry in entries)
+    resumes_only = sum(len(bson.encode(resume.dict(exclude={"raw_text"}))) for resume in resumes)
+    texts = [store._doc(resume.id, resume.raw_text) for resume in resumes]
+    text_docs = sum(len(bson.encode(doc)) for doc in texts)
+    cache_docs = sum(len(bson.encode(cache._doc(entry))) for entry in entries)
+    raw = sum(len(resume.raw_text.encode("utf-8")) for resume in resumes)
+    compressed = sum(len(doc["data"]) for doc in texts)
+
+    print(f"{count} resumes, {raw / count:.0f} bytes of raw text each, zlib ratio {raw / compressed:.2f}x")
+    total_inline = inline + cache_inline
+    total = resumes_only + text_docs + cache_docs
+    print(f"{'layout':<14} {'resumes':>12} {'texts':>12} {'parse cache':>12} {'total':>12} {'resume doc':>11}")
+    print(
+        f"{'inline':<14} {inline / 2**20:>9.1f} MB {'':>12} {cache_inline / 2**20:>9.1f} MB "
+        f"{total_inline / 2**20:>9.1f} MB {inline / count:>9.0f} B"
+    )
+    print(
+        f"{'out of line':<14} {resumes_only / 2**20:>9.1f} MB {text_docs / 2**20:>9.1f} MB "
+        f"{cache_docs / 2**20:>9.1f} MB {total / 2**20:>9.1f} MB {resumes_only / count:>9.0f} B"
+    )
+    print(
+        f"Resumes collection (hot working set) {inline / resumes_only:.1f}x smaller, "
+        f"parse cache {cache_inline / cache_docs:.1f}x smaller, total storage {total_inline / total:.1f}x smaller"
+    )
+
+    start = time.perf_counter()
+    for resume in resumes:
+        store._doc(resume.id, resume.raw_text)
+    compress = (time.perf_counter() - start) / count
+    start = time.perf_counter()
+    for doc in texts:
+        decompress_text(doc["data"], doc["codec"])
+    decompress = (time.perf_counter() - start) / count
+    print(f"Per resume: compress {compress * 1e6:.0f} us, decompress {decompress * 1e6:.0f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Micro-benchmark: skill extraction cost as the vocabulary grows.
+
+Builds taxonomies of the shipped skills plus synthetic entries (up to 20k
+skills) and reports build time, traced memory and the time to extract skills
+from a 10 page resume. Extraction time should stay roughly flat.
+
+Run from the repository root:
+    python benchmarks/skill_taxonomy_benchmark.py
+"""
+import random
+import string
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from resume_document import ResumeDocument  # noqa: E402
+from skill_taxonomy import DEFAULT_SKILLS_FILE, Skill, SkillTaxonomy  # noqa: E402
+from tests.fixtures import SAMPLE_RESUME_PAGE as PAGE  # noqa: E402
+
+
+def synthetic_skills(count, seed=7):
+    rng = random.Random(seed)
+    words = set()
+    while len(words) < count:
+        word = ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(4, 10)))
+        if rng.random() < 0.4:
+            word += ' ' + ''.join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 8)))
+        words.add(word)
+    return [Skill(f"synthetic-{index}", word.title()) for index, word in enumerate(sorted(words))]
+
+
+def measure(func, min_seconds=0.5):
+    runs = 0
+    start = time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_seconds or runs < 3:
+        func()
+        runs += 1
+        elapsed = time.perf_counter() - start
+    return elapsed / runs
+
+
+def main():
+    shipped = SkillTaxonomy.from_file(DEFAULT_SKILLS_FILE).skills
+    doc = ResumeDocument(PAGE * 10)
+    spans = doc.section_blocks('skills')
+
+    print(f"{'skills':>7} {'states':>8} {'build s':>8} {'memory MB':>10} {'extract ms':>11}")
+    for extra in (0, 2_000, 20_000):
+        skills = shipped + synthetic_skills(extra)
+        tracemalloc.start()
+        start = time.perf_counter()
+        taxonomy = SkillTaxonomy(skills)
+        build = time.perf_counter() - start
+        memory = tracemalloc.get_traced_memory()[0] / 1e6
+        tracemalloc.stop()
+
+        extract = measure(lambda: taxonomy.find(doc.lower, spans))
+        print(f"{len(taxonomy):>7} {taxonomy.matcher.state_count:>8} {build:>8.2f} "
+              f"{memory:>10.1f} {extract * 1000:>11.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""Benchmark: skill-development what-if scoring.
+
+"rescore" scores the original resume and a modified copy with the added
+skills, as /skill-development-comparison did before; "delta" is
+JobIndex.what_if, which scores the baseline once from the resume's term
+columns and adds the contribution of the new skills. Neither builds JobMatch
+objects.
+
+Run from the repository root:
+    python benchmarks/what_if_benchmark.py
+"""
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from job_index import JobIndex  # noqa: E402
+from models import ResumeData  # noqa: E402
+from resume_parser import SKILL_TAXONOMY, parse_resume_content  # noqa: E402
+from tests.fixtures import SAMPLE_RESUME_PAGE, make_jobs  # noqa: E402
+
+
+def rescore(index, resume, added):
+    modified = ResumeData(skills=resume.skills + added, experience=resume.experience)
+    return index.score(resume), index.score(modified)
+
+
+def best_of(func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    resume = parse_resume_content(SAMPLE_RESUME_PAGE)
+    taxonomy = SKILL_TAXONOMY.get()
+    print(f"{'jobs':>7} {'skills':>7} {'rescore ms':>11} {'delta ms':>9} {'speedup':>8}")
+    for count in (1_000, 10_000, 100_000):
+        index = JobIndex(make_jobs(count, taxonomy.names), taxonomy)
+        index.what_if(resume, [])  # Build the column-major copies once
+        for added in (["Docker"], ["Docker", "Kubernetes", "Terraform", "Go", "Rust"]):
+            full = best_of(lambda: rescore(index, resume, added))
+            delta = best_of(lambda: index.what_if(resume, added))
+            print(f"{count:>7} {len(added):>7} {full * 1000:>11.2f} {delta * 1000:>9.2f} {full / delta:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
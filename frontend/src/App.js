@@ -196,7 +196,7 @@ const JobMate = () => {
                     </p>
                     <input
                       type="file"
-                      accept=".pdf,.docx"
+                      accept=".pdf,.docx,.txt,.md,.markdown,.html,.htm,.rtf"
                       onChange={(e) => e.target.files[0] && handleResumeUpload(e.target.files[0])}
                       className="hidden"
                       id="resume-upload"
@@ -208,7 +208,7 @@ const JobMate = () => {
                       Choose File
                     </label>
                     <p className="text-sm text-gray-500 mt-4">
-                      Supports PDF and DOCX files up to 10MB
+                      Supports PDF, DOCX, TXT, Markdown, HTML and RTF files up to 10MB
                     </p>
                   </>
                 )}
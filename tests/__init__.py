@@ -5,4 +5,10 @@
 
 # FOR FRONTEND
 # cd frontend; npm install
-# to run frontend --> cd frontend; npm start
\ No newline at end of file
+# to run frontend --> cd frontend; npm start
+
+import sys
+from pathlib import Path
+
+# The backend is run from its own directory, so make its modules importable
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
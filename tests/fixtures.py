@@ -0,0 +1,227 @@
+"""Builders for small in-memory resume documents, job catalogs and collections used by tests and benchmarks"""
+import io
+import os
+import zipfile
+from types import SimpleNamespace
+from typing import List, Sequence
+from xml.sax.saxutils import escape
+
+SAMPLE_RESUME_PAGE = """John Doe
+john.doe@example.com
+(555) 123-4567
+
+SKILLS
+Python, JavaScript, React, Node.js, C++, CI/CD, Machine Learning, SQL, Git
+
+EXPERIENCE
+Senior Software Engineer, TechCorp Inc.
+2019-2023
+Built microservices with FastAPI and Docker, deployed on AWS with Kubernetes.
+Led migration of a monolith to an event-driven architecture using Kafka.
+Mentored junior engineers on unit testing, code review and clean code practices.
+
+Software Engineer, StartupXYZ
+2016-2019
+Developed responsive web applications with React, TypeScript and Tailwind CSS.
+Maintained PostgreSQL and Redis clusters and wrote data pipelines in Pandas.
+
+EDUCATION
+University of Technology
+Bachelor of Science in Computer Science, 2016
+
+"""
+
+
+def make_pdf(pages: List[str]) -> bytes:
+    """Build a minimal text-only PDF with one page per string"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page_text in pages:
+        lines = [line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") for line in page_text.split("\n")]
+        stream = "BT /F1 10 Tf 14 TL 50 780 Td " + " ".join(f"({line}) '" for line in lines) + " ET"
+        stream_bytes = stream.encode("latin-1", errors="replace")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream_bytes) + stream_bytes + b"\nendstream")
+        content_id = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_id
+        )
+        kids.append(len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (
+        b" ".join(b"%d 0 R" % kid for kid in kids), len(kids)
+    )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+W_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def docx_paragraph(text: str) -> str:
+    runs = "<w:tab/>".join(f'<w:t xml:space="preserve">{escape(part)}</w:t>' for part in text.split("\t"))
+    return f"<w:p><w:r>{runs}</w:r></w:p>"
+
+
+def make_docx(
+    paragraphs: Sequence[str],
+    table: Sequence[Sequence[str]] = (),
+    header: str = "",
+    images: int = 0,
+    image_bytes: int = 256 * 1024,
+) -> bytes:
+    """Build a minimal DOCX with one paragraph per string.
+
+    ``table`` rows are appended as a Word table, ``header`` becomes
+    word/header1.xml and ``images`` random, incompressible media files are
+    added to make the package image-heavy.
+    """
+    body = "".join(docx_paragraph(text) for text in paragraphs)
+    if table:
+        rows = "".join(
+            "<w:tr>" + "".join(f"<w:tc>{docx_paragraph(cell)}</w:tc>" for cell in row) + "</w:tr>"
+            for row in table
+        )
+        body += f"<w:tbl>{rows}</w:tbl>"
+    document = f'<?xml version="1.0" encoding="UTF-8"?><w:document xmlns:w="{W_NAMESPACE}"><w:body>{body}</w:body></w:document>'
+
+    package = io.BytesIO()
+    with zipfile.ZipFile(package, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", '<?xml version="1.0"?><Types/>')
+        if header:
+            zf.writestr(
+                "word/header1.xml",
+                f'<w:hdr xmlns:w="{W_NAMESPACE}">{docx_paragraph(header)}</w:hdr>',
+            )
+        zf.writestr("word/document.xml", document)
+        for number in range(images):
+            zf.writestr(f"word/media/image{number + 1}.png", os.urandom(image_bytes), zipfile.ZIP_STORED)
+    return package.getvalue()
+
+
+JOB_TITLES = [
+    "Software Engineer", "Backend Developer", "Frontend Developer", "Data Scientist", "DevOps Engineer",
+    "Mobile Developer", "Machine Learning Engineer", "Site Reliability Engineer", "QA Engineer", "Data Engineer",
+]
+JOB_WORDS = (
+    "build maintain design scalable reliable services team product customers data platform cloud "
+    "pipelines testing deployment monitoring performance security mentoring agile collaboration "
+    "architecture distributed systems analytics dashboards automation infrastructure mobile web"
+).split()
+
+
+def make_jobs(count: int, skills: Sequence[str], seed: int = 0) -> list:
+    """Generate ``count`` synthetic JobListings whose requirements come from ``skills``"""
+    import random
+
+    from models import JobListing
+
+    rng = random.Random(seed)
+    jobs = []
+    for number in range(count):
+        requirements = rng.sample(list(skills), rng.randint(3, 8))
+        words = rng.choices(JOB_WORDS, k=rng.randint(15, 40)) + rng.sample(requirements, 2)
+        jobs.append(JobListing(
+            id=f"job-{number}",
+            title=rng.choice(JOB_TITLES),
+            company=f"Company {number % 997}",
+            description=" ".join(words),
+            requirements=requirements,
+        ))
+    return jobs
+
+
+class MemoryCollection:
+    """Just enough of a Motor collection for the caches and indexes under test"""
+
+    def __init__(self, docs=()):
+        self.docs = [dict(doc) for doc in docs]
+
+    OPERATORS = {
+        "$ne": lambda value, operand: value != operand,
+        "$gt": lambda value, operand: value is not None and value > operand,
+        "$gte": lambda value, operand: value is not None and value >= operand,
+        "$exists": lambda value, operand: (value is not None) == operand,
+        "$in": lambda value, operand: value in operand,
+    }
+
+    @classmethod
+    def _matches(cls, doc, query):
+        for field, condition in query.items():
+            if field == "$or":
+                if not any(cls._matches(doc, clause) for clause in condition):
+                    return False
+            elif isinstance(condition, dict):
+                if not all(cls.OPERATORS[name](doc.get(field), operand) for name, operand in condition.items()):
+                    return False
+            elif doc.get(field) != condition:
+                return False
+        return True
+
+    @staticmethod
+    def _project(doc, projection):
+        included = [field for field, keep in (projection or {}).items() if keep]
+        if included:
+            return {field: doc[field] for field in included if field in doc}
+        return {field: value for field, value in doc.items() if (projection or {}).get(field, 1)}
+
+    async def create_index(self, keys, unique=False, **options):
+        pass
+
+    async def find_one(self, query, projection=None):
+        return next((self._project(doc, projection) for doc in self.docs if self._matches(doc, query)), None)
+
+    async def find(self, query, projection=None, sort=None, skip=0, limit=0, **options):
+        docs = [doc for doc in self.docs if self._matches(doc, query)]
+        for field, direction in reversed(sort or []):
+            docs.sort(key=lambda doc: doc[field], reverse=direction < 0)
+        for doc in docs[skip:skip + limit if limit else None]:
+            yield self._project(doc, projection)
+
+    async def count_documents(self, query, limit=0):
+        count = sum(1 for doc in self.docs if self._matches(doc, query))
+        return min(count, limit) if limit else count
+
+    async def distinct(self, field):
+        return list(dict.fromkeys(doc[field] for doc in self.docs if field in doc))
+
+    async def insert_one(self, doc):
+        self.docs.append(dict(doc))
+
+    async def insert_many(self, docs, ordered=True):
+        self.docs.extend(dict(doc) for doc in docs)
+
+    async def replace_one(self, query, doc, upsert=False):
+        self.docs = [existing for existing in self.docs if not self._matches(existing, query)] + [dict(doc)]
+
+    async def update_one(self, query, update, upsert=False):
+        doc = next((doc for doc in self.docs if self._matches(doc, query)), None)
+        if doc is None:
+            if upsert:
+                self.docs.append({**query, **update.get("$setOnInsert", {}), **update.get("$set", {})})
+            return SimpleNamespace(modified_count=0)
+        doc.update(update.get("$set", {}))
+        for field in update.get("$unset", {}):
+            doc.pop(field, None)
+        return SimpleNamespace(modified_count=int("$set" in update or "$unset" in update))
+
+    async def find_one_and_update(self, query, update, upsert=False, return_document=None):
+        doc = next((doc for doc in self.docs if self._matches(doc, query)), None)
+        if doc is None:
+            doc = dict(query)
+            self.docs.append(doc)
+        for field, amount in update.get("$inc", {}).items():
+            doc[field] = doc.get(field, 0) + amount
+        return dict(doc)
+
+    async def delete_many(self, query):
+        self.docs = [doc for doc in self.docs if not self._matches(doc, query)]
@@ -0,0 +1,125 @@
+import unittest
+
+import numpy as np
+from scipy import sparse
+
+from ann_index import IVFIndex, SparseProjection
+from job_index import JobIndex, top_positions
+from models import ResumeData
+from skill_taxonomy import DEFAULT_SKILLS_FILE, SkillTaxonomy
+from tests.fixtures import JOB_WORDS, make_jobs
+
+TAXONOMY = SkillTaxonomy.from_file(DEFAULT_SKILLS_FILE)
+
+
+class AnnIndexTester(unittest.TestCase):
+    """Tests for the random projection and the IVF index"""
+
+    def test_projection_is_stable_as_features_grow(self):
+        projection = SparseProjection(dim=64, seed=4)
+        rows = sparse.random(5, 300, density=0.1, random_state=1, format='csr')
+        before = projection.project(rows)
+        projection.matrix(5000)
+        wider = sparse.hstack([rows, sparse.csr_matrix((5, 4700))], format='csr')
+        np.testing.assert_allclose(projection.project(wider), before)
+
+    def test_probing_every_list_is_exact(self):
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(size=(500, 16)).astype(np.float32)
+        index = IVFIndex(n_lists=10)
+        index.train(vectors)
+        index.add(vectors)
+        query = rng.normal(size=16).astype(np.float32)
+        expected = set(np.argsort(-(vectors @ query))[:20].tolist())
+        self.assertEqual(set(index.search(query, 20, n_probe=10).tolist()), expected)
+
+    def test_incremental_add(self):
+        rng = np.random.default_rng(1)
+        vectors = rng.normal(size=(300, 8)).astype(np.float32)
+        index = IVFIndex(n_lists=5)
+        index.train(vectors[:100])
+        self.assertEqual(index.add(vectors[:100]).tolist(), list(range(100)))
+        self.assertEqual(index.add(vectors[100:]).tolist(), list(range(100, 300)))
+        self.assertEqual(len(index), 300)
+        query = vectors[250]
+        self.assertEqual(index.search(query, 1, n_probe=5).tolist(), [int(np.argmax(vectors @ query))])
+
+    def test_untrained_index(self):
+        with self.assertRaises(ValueError):
+            IVFIndex(n_lists=4).train(np.zeros((0, 8), dtype=np.float32))
+        with self.assertRaises(RuntimeError):
+            IVFIndex(n_lists=4).add(np.zeros((1, 8), dtype=np.float32))
+
+
+class TwoStageMatchTester(unittest.TestCase):
+    """Tests for JobIndex.top_matches with an ANN index"""
+
+    def setUp(self):
+        self.jobs = make_jobs(2000, TAXONOMY.names, seed=5)
+        self.rng = np.random.default_rng(6)
+
+    def make_resume(self):
+        skills = self.rng.choice(TAXONOMY.names, size=8, replace=False).tolist()
+        words = " ".join(self.rng.choice(JOB_WORDS, size=30).tolist())
+        return ResumeData(skills=skills, experience=[{"description": words}])
+
+    def test_candidates_are_scored_exactly(self):
+        index = JobIndex(self.jobs, TAXONOMY)
+        index.build_ann(n_candidates=200)
+        resume = self.make_resume()
+        exact, _ = index.score(resume)
+        page, total = index.top_matches(resume, top_k=10)
+        self.assertEqual(total, 200)
+        for match in page:
+            self.assertAlmostEqual(match.match_score, exact.match_score[index.position(match.job.id)], places=9)
+
+    def test_recall_against_exact_search(self):
+        index = JobIndex(self.jobs, TAXONOMY)
+        index.build_ann(n_candidates=200)
+        recall = []
+        for _ in range(10):
+            resume = self.make_resume()
+            exact, _ = index.score(resume)
+            expected = {self.jobs[position].id for position in top_positions(exact.match_score, 10)}
+            page, _ = index.top_matches(resume, top_k=10)
+            recall.append(len(expected & {match.job.id for match in page}) / 10)
+        self.assertGreaterEqual(np.mean(recall), 0.8)
+
+    def test_every_candidate_gives_the_exact_ranking(self):
+        index = JobIndex(self.jobs, TAXONOMY)
+        index.build_ann(n_candidates=len(self.jobs))
+        resume = self.make_resume()
+        exact, _ = index.score(resume)
+        page, _ = index.top_matches(resume, top_k=10, offset=5)
+        expected = [self.jobs[position].id for position in top_positions(exact.match_score, 15)[5:]]
+        self.assertEqual([match.job.id for match in page], expected)
+
+    def test_jobs_added_after_the_build_are_found(self):
+        index = JobIndex(self.jobs[:1500], TAXONOMY)
+        index.build_ann(n_candidates=len(self.jobs))
+        index.add_jobs(self.jobs[1500:])
+        self.assertEqual(len(index.ann), len(self.jobs))
+
+        target = self.jobs[1800]
+        resume = ResumeData(skills=target.requirements, experience=[{"description": target.description}])
+        page, _ = index.top_matches(resume, top_k=1)
+        self.assertEqual(page[0].job.id, target.id)
+
+    def test_appended_copy_leaves_the_index_unchanged(self):
+        index = JobIndex(self.jobs[:1500], TAXONOMY)
+        index.build_ann(n_candidates=len(self.jobs))
+        resume = self.make_resume()
+        before, _ = index.top_matches(resume, top_k=10)
+        grown = index.appended(self.jobs[1500:])
+        self.assertEqual((len(index), len(index.ann), len(index.matrix.indptr) - 1), (1500, 1500, 1500))
+        self.assertEqual(index.top_matches(resume, top_k=10)[0], before)
+        self.assertNotEqual(grown.version, index.version)
+
+        added = JobIndex(self.jobs[:1500], TAXONOMY)
+        added.build_ann(n_candidates=len(self.jobs))
+        added.add_jobs(self.jobs[1500:])
+        self.assertEqual(grown.top_matches(resume, top_k=10), added.top_matches(resume, top_k=10))
+
+
+if __name__ == '__main__':
+    unittest.main()
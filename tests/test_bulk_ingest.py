@@ -0,0 +1,91 @@
+import asyncio
+import io
+import json
+import unittest
+import zipfile
+from datetime import datetime, timezone
+
+from fastapi import UploadFile
+from fastapi.encoders import jsonable_encoder
+
+from bulk_ingest import bounded_map, expand_zip, iter_bulk_files, ndjson_line
+
+
+def make_zip(entries):
+    archive = io.BytesIO()
+    with zipfile.ZipFile(archive, "w") as zf:
+        for name, data in entries.items():
+            zf.writestr(name, data)
+    return archive.getvalue()
+
+
+class BulkIngestTester(unittest.TestCase):
+    """Tests for bulk upload expansion and bounded concurrency"""
+
+    def test_expand_zip(self):
+        content = make_zip({
+            "a.pdf": b"%PDF-1.4", "photo.png": b"x", "dir/b.docx": b"PK", "c.pdf": b"\x89PNG\r\n\x1a\n\x00\x00",
+        })
+        entries = list(expand_zip("batch.zip", content))
+        self.assertEqual(
+            [e.filename for e in entries],
+            ["batch.zip/a.pdf", "batch.zip/photo.png", "batch.zip/dir/b.docx", "batch.zip/c.pdf"],
+        )
+        self.assertEqual([bool(e.error) for e in entries], [False, True, False, True])
+        self.assertEqual(entries[0].content, b"%PDF-1.4")
+
+    def test_invalid_zip(self):
+        entries = list(expand_zip("broken.zip", b"not a zip"))
+        self.assertEqual(entries[0].error, "Invalid ZIP archive")
+
+    def test_iter_bulk_files_mixes_uploads_and_archives(self):
+        uploads = [
+            UploadFile(file=io.BytesIO(make_zip({"a.pdf": b"one", "b.pdf": b"two"})), filename="batch.zip"),
+            UploadFile(file=io.BytesIO(b"three"), filename="c.docx"),
+            UploadFile(file=io.BytesIO(b"four"), filename="d.doc"),
+        ]
+
+        async def collect():
+            return [entry async for entry in iter_bulk_files(uploads)]
+
+        entries = asyncio.run(collect())
+        self.assertEqual([e.filename for e in entries], ["batch.zip/a.pdf", "batch.zip/b.pdf", "c.docx", "d.doc"])
+        self.assertTrue(entries[3].error)
+        self.assertEqual(len({e.content_hash for e in entries[:3]}), 3)
+
+    def test_ndjson_line_encodes_as_responses_do(self):
+        doc = {
+            "id": "r1", "upload_date": datetime(2024, 5, 1, 9, 30, 15, 250000),
+            "parsed": datetime(2024, 5, 1, 9, 30, tzinfo=timezone.utc), "skills": ["Python"],
+        }
+        line = ndjson_line(doc)
+        self.assertTrue(line.endswith(b"\n"))
+        self.assertEqual(json.loads(line), jsonable_encoder(doc))
+        self.assertEqual(json.loads(line)["upload_date"], "2024-05-01T09:30:15.250000")
+
+    def test_bounded_map_limits_concurrency(self):
+        active = 0
+        peak = 0
+
+        async def work(item):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return item * 2
+
+        async def items():
+            for n in range(20):
+                yield n
+
+        async def collect():
+            return [result async for result in bounded_map(work, items(), 3)]
+
+        results = asyncio.run(collect())
+        self.assertEqual(sorted(results), [n * 2 for n in range(20)])
+        self.assertEqual(peak, 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import asyncio
+import unittest
+
+import numpy as np
+
+from bulk_match import iter_resume_batches, stream_bulk_matches
+from job_index import JobIndex
+from models import ResumeData
+from resume_repository import ResumeRepository
+from skill_taxonomy import DEFAULT_SKILLS_FILE, SkillTaxonomy
+from tests.fixtures import MemoryCollection, make_jobs
+from tests.test_resume_index import make_resumes
+
+TAXONOMY = SkillTaxonomy.from_file(DEFAULT_SKILLS_FILE)
+
+
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+class RankBatchTester(unittest.TestCase):
+    """Tests for ranking a batch of resumes in one product"""
+
+    def setUp(self):
+        self.index = JobIndex(make_jobs(300, TAXONOMY.names[:60], seed=5), TAXONOMY)
+        self.resumes = make_resumes(20) + [ResumeData()]
+
+    def test_matches_ranking_each_resume(self):
+        for resume, (positions, scores) in zip(self.resumes, self.index.rank_batch(self.resumes, 15)):
+            expected_positions, expected_scores, _ = self.index.rank(resume, 15)
+            np.testing.assert_allclose(scores, expected_scores, atol=1e-4)
+            self.assertEqual(set(positions.tolist()), set(expected_positions.tolist()))
+
+    def test_threshold_and_empty_batch(self):
+        for positions, scores in self.index.rank_batch(self.resumes, 300, min_score=40):
+            self.assertTrue(np.all(scores >= 40))
+        self.assertEqual(self.index.rank_batch([], 10), [])
+        empty = JobIndex([], TAXONOMY)
+        self.assertEqual([len(positions) for positions, _ in empty.rank_batch(self.resumes[:2], 5)], [0, 0])
+
+
+class StreamBulkMatchesTester(unittest.TestCase):
+    """Tests for streaming the top matches of every stored resume"""
+
+    def setUp(self):
+        self.index = JobIndex(make_jobs(100, TAXONOMY.names[:60], seed=6), TAXONOMY)
+        self.resumes = make_resumes(45, seed=7)
+        self.repository = ResumeRepository(MemoryCollection(resume.dict() for resume in self.resumes))
+
+    def test_batches(self):
+        batches = asyncio.run(collect(iter_resume_batches(self.repository, 20)))
+        self.assertEqual([len(batch) for batch in batches], [20, 20, 5])
+        self.assertEqual(batches[2][-1].id, self.resumes[-1].id)
+
+    def test_one_record_per_resume_then_a_summary(self):
+        records = asyncio.run(collect(stream_bulk_matches(self.index, self.repository, top_k=3, batch_size=10)))
+        summary = records.pop()["summary"]
+        self.assertEqual((summary["resumes"], summary["jobs"]), (45, 100))
+        self.assertEqual([record["resume_id"] for record in records], [resume.id for resume in self.resumes])
+
+        matches, _ = self.index.top_matches(self.resumes[12], 3)
+        self.assertEqual([match["job_id"] for match in records[12]["matches"]], [match.job.id for match in matches])
+        for match, expected in zip(records[12]["matches"], matches):
+            self.assertAlmostEqual(match["match_score"], expected.match_score, places=4)
+
+
+if __name__ == '__main__':
+    unittest.main()
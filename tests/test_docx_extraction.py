@@ -0,0 +1,56 @@
+import io
+import unittest
+import zipfile
+
+from resume_document import ResumeDocument
+from resume_parser import ExtractionBudget, ResumeParseError, extract_docx_text, extract_text
+from tests.fixtures import make_docx
+
+
+class DocxExtractionTester(unittest.TestCase):
+    """Tests for the streaming DOCX extractor"""
+
+    def test_paragraphs_and_tables_become_lines(self):
+        content = make_docx(
+            ["Jane Doe", "SKILLS", "Python\tGo", "", "EXPERIENCE"],
+            table=[["Engineer", "2019-2023"]],
+        )
+        text, extraction = extract_docx_text(content)
+        self.assertEqual(text.split("\n"), ["Jane Doe", "SKILLS", "Python\tGo", "", "EXPERIENCE", "Engineer", "2019-2023"])
+        self.assertFalse(extraction.truncated)
+        self.assertEqual(extraction.characters, len("Jane DoeSKILLSPythonGoEXPERIENCEEngineer2019-2023"))
+
+        doc = ResumeDocument(text)
+        self.assertEqual([section.name for section in doc.sections], ["skills", "experience"])
+
+    def test_headers_are_optional(self):
+        content = make_docx(["SKILLS", "Python"], header="Jane Doe")
+        self.assertTrue(extract_docx_text(content)[0].startswith("Jane Doe\n"))
+        self.assertEqual(extract_docx_text(content, include_headers=False)[0], "SKILLS\nPython")
+
+    def test_character_budget_stops_parsing(self):
+        content = make_docx(["Python developer"] * 1000)
+        text, extraction = extract_docx_text(content, ExtractionBudget(max_chars=40))
+        self.assertEqual(extraction.characters, 40)
+        self.assertTrue(extraction.truncated)
+        self.assertEqual(extraction.truncation_reason, "chars")
+        self.assertEqual(text.replace("\n", ""), ("Python developer" * 3)[:40])
+
+    def test_media_parts_are_never_read(self):
+        content = bytearray(make_docx(["Jane Doe"], images=1, image_bytes=1024))
+        # Corrupt the stored image; reading it would fail its CRC check
+        start = content.index(b"word/media/image1.png") + len("word/media/image1.png")
+        content[start:start + 64] = bytes(64)
+        self.assertEqual(extract_docx_text(bytes(content))[0], "Jane Doe")
+
+    def test_broken_package_is_a_parse_error(self):
+        package = io.BytesIO()
+        with zipfile.ZipFile(package, "w") as zf:
+            zf.writestr("word/document.xml", "<w:document><w:body><w:p>")
+        content = package.getvalue()
+        with self.assertRaises(ResumeParseError):
+            extract_text("resume.docx", content)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,134 @@
+import tempfile
+import unittest
+
+import numpy as np
+
+from embeddings import EmbeddingStore, HashingEncoder
+from job_index import GREAT_FIT_SCORE, JobIndex, combine_scores, job_text, resume_text
+from models import ResumeData
+from skill_taxonomy import DEFAULT_SKILLS_FILE, SkillTaxonomy
+from tests.fixtures import make_jobs
+
+TAXONOMY = SkillTaxonomy.from_file(DEFAULT_SKILLS_FILE)
+
+
+class CountingEncoder(HashingEncoder):
+    """Stand-in encoder that records how many texts it encoded"""
+
+    def __init__(self, dim=64):
+        super().__init__(dim)
+        self.texts = 0
+
+    def encode(self, texts):
+        self.texts += len(texts)
+        return super().encode(texts)
+
+
+class EmbeddingStoreTester(unittest.TestCase):
+    """Tests for the memory-mapped job embedding store"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.jobs = make_jobs(60, TAXONOMY.names[:40], seed=1)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def store(self, encoder=None):
+        return EmbeddingStore(self.directory.name, encoder or CountingEncoder(), batch_size=16)
+
+    def test_rows_are_the_encoded_jobs(self):
+        store = self.store()
+        embeddings = store.sync(self.jobs)
+        self.assertIsInstance(embeddings.vectors, np.memmap)
+        self.assertEqual(embeddings.vectors.dtype, np.float32)
+        expected = store.encoder.encode([job_text(job) for job in self.jobs])
+        np.testing.assert_allclose(embeddings.vectors[embeddings.rows], expected, atol=1e-6)
+
+    def test_restart_does_not_encode_again(self):
+        self.store().sync(self.jobs)
+        encoder = CountingEncoder()
+        embeddings = self.store(encoder).sync(self.jobs)
+        self.assertEqual(encoder.texts, 0)
+        self.assertEqual(len(embeddings.rows), 60)
+
+    def test_only_new_and_changed_jobs_are_encoded(self):
+        self.store().sync(self.jobs)
+        changed = self.jobs[3].copy(update={"description": "Rewritten description"})
+        jobs = self.jobs[:3] + [changed] + self.jobs[4:] + make_jobs(65, TAXONOMY.names[:40], seed=2)[60:]
+        encoder = CountingEncoder()
+        embeddings = self.store(encoder).sync(jobs)
+        self.assertEqual(encoder.texts, 6)
+        np.testing.assert_allclose(embeddings.row(3), encoder.encode([job_text(changed)])[0], atol=1e-6)
+
+    def test_stale_rows_are_compacted(self):
+        store = self.store()
+        for round in range(40):
+            jobs = [job.copy(update={"description": f"{job.description} {round}"}) for job in self.jobs]
+            embeddings = store.sync(jobs)
+        self.assertLessEqual(len(embeddings.vectors), 2 * 1024)
+        expected = store.encoder.encode([job_text(job) for job in jobs])
+        np.testing.assert_allclose(embeddings.scores(expected[0]), expected @ expected[0], atol=1e-5)
+
+
+class EmbeddingJobIndexTester(unittest.TestCase):
+    """Tests for scoring with embeddings instead of TF-IDF"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = EmbeddingStore(self.directory.name, HashingEncoder(128))
+        jobs = make_jobs(200, TAXONOMY.names[:40], seed=3)
+        self.index = JobIndex(jobs, TAXONOMY, self.store.sync(jobs))
+        self.resume = ResumeData(
+            skills=TAXONOMY.names[:5], experience=[{"description": "Built data platform services"}]
+        )
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_semantic_scores_are_embedding_cosines(self):
+        encoder = self.store.encoder
+        expected = encoder.encode([job_text(job) for job in self.index.jobs]) @ encoder.encode(
+            [resume_text(self.resume)]
+        )[0]
+        scores, _ = self.index.score(self.resume)
+        np.testing.assert_allclose(scores.semantic, expected, atol=1e-5)
+        np.testing.assert_allclose(scores.match_score, combine_scores(expected, scores.skill_ratio), atol=1e-3)
+        job = self.index.jobs[5]
+        self.assertAlmostEqual(self.index.similarity(self.resume, job), expected[5], places=5)
+
+    def test_what_if_and_skill_gains_match_rescoring(self):
+        skill = TAXONOMY.names[20]
+        what_if = self.index.what_if(self.resume, [skill])
+        after, _ = self.index.score(ResumeData(skills=self.resume.skills + [skill], experience=self.resume.experience))
+        np.testing.assert_allclose(what_if.after.match_score, after.match_score, atol=1e-3)
+
+        before = what_if.before.match_score
+        gain = {gain.skill: gain for gain in self.index.skill_gains(self.resume)}[skill]
+        self.assertAlmostEqual(gain.average_gain, float(np.mean(after.match_score - before)), places=3)
+        self.assertEqual(
+            gain.great_fit_jobs,
+            int(np.count_nonzero((after.match_score > GREAT_FIT_SCORE) & (before <= GREAT_FIT_SCORE))),
+        )
+
+    def test_added_jobs_are_embedded(self):
+        added = make_jobs(210, TAXONOMY.names[:40], seed=4)[200:]
+        version = self.index.version
+        self.index.add_jobs(added)
+        self.assertNotEqual(self.index.version, version)
+        scores = self.index.semantic_scores(self.resume)
+        self.assertEqual(len(scores), 210)
+        self.assertAlmostEqual(scores[205], self.index.similarity(self.resume, added[5].copy(update={"id": "x"})), 5)
+
+    def test_versions_and_fingerprints_differ_from_tfidf(self):
+        tfidf = JobIndex(self.index.jobs, TAXONOMY)
+        self.assertNotEqual(tfidf.version, self.index.version)
+        reordered = ResumeData(skills=self.resume.skills, experience=[{"description": "services platform data Built"}])
+        self.assertEqual(tfidf.fingerprint(self.resume), tfidf.fingerprint(reordered))
+        self.assertNotEqual(self.index.fingerprint(self.resume), self.index.fingerprint(reordered))
+        with self.assertRaises(ValueError):
+            self.index.build_ann()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import io
+import time
+import unittest
+import zipfile
+
+import file_formats
+from file_formats import (
+    extract_text_from_html, extract_text_from_markdown, extract_text_from_rtf, sniff_format
+)
+from resume_parser import ExtractionBudget, ResumeParseError, extract_text, process_resume_file
+from tests.fixtures import SAMPLE_RESUME_PAGE, make_pdf
+
+
+def make_docx_package():
+    package = io.BytesIO()
+    with zipfile.ZipFile(package, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", "<Types/>")
+        zf.writestr("word/document.xml", "<w:document/>")
+    return package.getvalue()
+
+
+class FormatSniffingTester(unittest.TestCase):
+    """Tests for routing uploads on their content"""
+
+    def test_documents_are_recognised_by_content(self):
+        self.assertEqual(sniff_format("resume.pdf", make_pdf([SAMPLE_RESUME_PAGE])), file_formats.PDF)
+        self.assertEqual(sniff_format("resume.docx", make_docx_package()), file_formats.DOCX)
+        self.assertEqual(sniff_format("resume.txt", b"{\\rtf1\\ansi Jane}"), file_formats.RTF)
+        self.assertEqual(sniff_format("resume.txt", b"<!DOCTYPE html><p>Jane</p>"), file_formats.HTML)
+
+    def test_extension_separates_text_formats(self):
+        self.assertEqual(sniff_format("resume.md", b"# Jane"), file_formats.MARKDOWN)
+        self.assertEqual(sniff_format("resume.htm", b"<p>Jane</p>"), file_formats.HTML)
+        self.assertEqual(sniff_format("resume.txt", "Jane Doe – Engineer".encode()), file_formats.TEXT)
+
+    def test_text_with_a_pdf_name_is_text(self):
+        self.assertEqual(sniff_format("resume.pdf", SAMPLE_RESUME_PAGE.encode()), file_formats.TEXT)
+
+    def test_binary_content_is_rejected(self):
+        self.assertIsNone(sniff_format("resume.pdf", b"\x89PNG\r\n\x1a\n" + bytes(100)))
+        self.assertIsNone(sniff_format("resume.docx", b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + bytes(100)))
+        self.assertIsNone(sniff_format("resume.docx", b"PK\x03\x04 not a word package"))
+        self.assertIsNone(sniff_format("resume.pdf", bytes(range(256)) * 4))
+        self.assertIsNone(sniff_format("resume.txt", b""))
+
+    def test_unsupported_content_never_reaches_a_parser(self):
+        with self.assertRaises(ResumeParseError):
+            extract_text("resume.pdf", b"\x00\x01\x02\x03" * 100)
+
+    def test_broken_pdf_is_an_error_not_garbage_text(self):
+        with self.assertRaises(ResumeParseError):
+            extract_text("resume.pdf", b"%PDF-1.4\n\x00\x01 truncated")
+
+
+class LightweightExtractorTester(unittest.TestCase):
+    """Tests for the standard-library text extractors"""
+
+    def test_markdown(self):
+        text = extract_text_from_markdown(
+            b"# Jane Doe\n\n## Skills\n- **Python**, `Docker`\n- [Kubernetes](https://k8s.io)\n\n---\n"
+        )
+        self.assertEqual(text.splitlines(), ["Jane Doe", "", "Skills", "Python, Docker", "Kubernetes"])
+
+    def test_markdown_unclosed_markers_are_linear(self):
+        for marker in ("*a ", "[a", "](a", "`a "):
+            start = time.perf_counter()
+            text = extract_text_from_markdown((marker * 20000).encode())
+            self.assertLess(time.perf_counter() - start, 1.0, marker)
+            self.assertTrue(text.startswith(marker.strip()))
+        self.assertEqual(extract_text_from_markdown(b"*a* **b c** [d](e) ![f](g)"), "a b c d f")
+
+    def test_markdown_is_cut_to_the_budget_before_stripping(self):
+        text, extraction = extract_text("resume.md", b"# Jane\n" + b"**Go** " * 1000, ExtractionBudget(max_chars=700))
+        self.assertTrue(extraction.truncated)
+        self.assertLessEqual(len(text), 700)
+        self.assertTrue(text.startswith("Jane\nGo Go"))
+
+    def test_html(self):
+        text = extract_text_from_html(
+            b"<html><head><title>CV</title><style>p {}</style></head><body>"
+            b"<h1>Jane Doe</h1><h2>Skills</h2>\n<ul><li>Python &amp; Go</li><li>SQL</li></ul>"
+            b"<script>var x = 1;</script></body></html>"
+        )
+        self.assertEqual(text.splitlines(), ["Jane Doe", "Skills", "Python & Go", "SQL"])
+
+    def test_rtf(self):
+        text = extract_text_from_rtf(
+            b"{\\rtf1\\ansi{\\fonttbl{\\f0 Arial;}}{\\*\\generator Writer;}"
+            b"\\f0 Jane Doe\\par Skills: Python\\emdash Go\\par Caf\\'e9 \\u8364? owner}"
+        )
+        self.assertEqual(text.splitlines(), ["Jane Doe", "Skills: Python—Go", "Café € owner"])
+
+    def test_process_resume_file_routes_text_formats(self):
+        resume, extraction = process_resume_file("resume.md", b"# Jane Doe\n\n## Skills\nPython, Docker\n")
+        self.assertEqual(resume.name, "Jane Doe")
+        self.assertIn("Docker", resume.skills)
+        self.assertEqual(extraction.pages_read, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
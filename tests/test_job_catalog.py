@@ -0,0 +1,146 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from job_catalog import REFRESH_LOOKBACK, JobCatalog
+from job_index import JobIndex
+from models import ResumeData
+from skill_taxonomy import DEFAULT_SKILLS_FILE, SkillTaxonomy
+from tests.fixtures import MemoryCollection, make_jobs
+
+TAXONOMY = SkillTaxonomy.from_file(DEFAULT_SKILLS_FILE)
+
+
+async def put_jobs(catalog, jobs):
+    """Store jobs the way a catalog importer does"""
+    last = await catalog._next_seq(len(jobs))
+    for seq, job in enumerate(jobs, last - len(jobs) + 1):
+        await catalog.collection.replace_one({"id": job.id}, {**job.dict(), "seq": seq, "deleted": False}, upsert=True)
+
+
+async def delete_job(catalog, job_id):
+    seq = await catalog._next_seq()
+    result = await catalog.collection.update_one({"id": job_id, "deleted": False}, {"$set": {"deleted": True, "seq": seq}})
+    return result.modified_count > 0
+
+
+class JobCatalogTester(unittest.TestCase):
+    """Tests for the versioned job catalog snapshot"""
+
+    def setUp(self):
+        self.collection = MemoryCollection()
+        self.counters = MemoryCollection()
+        self.catalog = JobCatalog(self.collection, self.counters)
+        self.jobs = make_jobs(30, TAXONOMY.names[:40], seed=8)
+
+    def worker(self):
+        """Another worker's view of the same collections"""
+        return JobCatalog(self.collection, self.counters)
+
+    def test_seed_only_an_empty_catalog(self):
+        self.assertTrue(asyncio.run(self.catalog.seed(self.jobs[:5])))
+        self.assertFalse(asyncio.run(self.catalog.seed(self.jobs[5:])))
+        changes = asyncio.run(self.catalog.refresh())
+        self.assertEqual([job.id for job in changes.added], [job.id for job in self.jobs[:5]])
+        self.assertFalse(changes.rebuild)
+
+    def test_appends_are_incremental(self):
+        asyncio.run(put_jobs(self.catalog, self.jobs[:20]))
+        worker = self.worker()
+        asyncio.run(worker.refresh())
+        self.assertIsNone(asyncio.run(worker.refresh()))
+
+        asyncio.run(put_jobs(self.catalog, self.jobs[20:]))
+        changes = asyncio.run(worker.refresh())
+        self.assertEqual((len(changes.added), changes.rebuild), (10, False))
+        self.assertEqual(worker.jobs, self.jobs)
+        self.assertEqual(worker.version, 30)
+
+    def test_updates_and_deletes_need_a_rebuild(self):
+        asyncio.run(put_jobs(self.catalog, self.jobs))
+        worker = self.worker()
+        asyncio.run(worker.refresh())
+
+        updated = self.jobs[4].copy(update={"description": "Rewritten"})
+        asyncio.run(put_jobs(self.catalog, [updated]))
+        self.assertTrue(asyncio.run(delete_job(self.catalog, self.jobs[7].id)))
+        self.assertFalse(asyncio.run(delete_job(self.catalog, self.jobs[7].id)))
+        changes = asyncio.run(worker.refresh())
+        self.assertTrue(changes.rebuild)
+        self.assertEqual(len(worker), 29)
+        self.assertEqual(worker.jobs[4].description, "Rewritten")
+        self.assertNotIn(self.jobs[7].id, [job.id for job in worker.jobs])
+
+    def test_late_writes_below_the_version_are_applied(self):
+        asyncio.run(put_jobs(self.catalog, self.jobs[:10]))
+        # A write that reserved its sequence number before the last refresh but landed after it
+        reserved = asyncio.run(self.catalog._next_seq())
+        asyncio.run(put_jobs(self.catalog, self.jobs[10:12]))
+        asyncio.run(self.catalog.refresh())
+        asyncio.run(self.collection.replace_one(
+            {"id": self.jobs[12].id}, {**self.jobs[12].dict(), "seq": reserved, "deleted": False}, upsert=True
+        ))
+        self.assertGreater(REFRESH_LOOKBACK, 2)
+        asyncio.run(put_jobs(self.catalog, self.jobs[13:14]))
+        changes = asyncio.run(self.catalog.refresh())
+        self.assertEqual({job.id for job in changes.added}, {self.jobs[12].id, self.jobs[13].id})
+
+    def test_writes_later_than_the_look_back_reload_the_catalog(self):
+        jobs = make_jobs(REFRESH_LOOKBACK + 20, TAXONOMY.names[:40], seed=8)
+        asyncio.run(put_jobs(self.catalog, jobs[:10]))
+        asyncio.run(self.catalog.refresh())
+        reserved = asyncio.run(self.catalog._next_seq())
+        late_delete = asyncio.run(self.catalog._next_seq())
+        asyncio.run(put_jobs(self.catalog, jobs[11:11 + REFRESH_LOOKBACK + 1]))
+        asyncio.run(self.catalog.refresh())
+
+        # Both land once more than REFRESH_LOOKBACK later numbers were applied
+        asyncio.run(self.collection.replace_one(
+            {"id": jobs[10].id}, {**jobs[10].dict(), "seq": reserved, "deleted": False}, upsert=True
+        ))
+        asyncio.run(self.collection.update_one({"id": jobs[0].id}, {"$set": {"deleted": True, "seq": late_delete}}))
+        asyncio.run(put_jobs(self.catalog, jobs[-1:]))
+        changes = asyncio.run(self.catalog.refresh())
+        self.assertTrue(changes.rebuild)
+        ids = [job.id for job in self.catalog.jobs]
+        self.assertIn(jobs[10].id, ids)
+        self.assertNotIn(jobs[0].id, ids)
+        self.assertEqual(len(ids), len(set(ids)))
+        self.assertEqual(len(self.catalog), REFRESH_LOOKBACK + 12)
+
+    def test_snapshot_changes_keep_a_job_index_current(self):
+        asyncio.run(put_jobs(self.catalog, self.jobs[:20]))
+        asyncio.run(self.catalog.refresh())
+        index = JobIndex(self.catalog.jobs, TAXONOMY)
+        asyncio.run(put_jobs(self.catalog, self.jobs[20:]))
+        index.add_jobs(asyncio.run(self.catalog.refresh()).added)
+
+        resume = ResumeData(skills=TAXONOMY.names[:4])
+        fresh = JobIndex(self.jobs, TAXONOMY)
+        self.assertEqual([job.id for job in index.jobs], [job.id for job in fresh.jobs])
+        np.testing.assert_array_equal(index.score(resume)[0].matched, fresh.score(resume)[0].matched)
+
+    def test_query_filters_and_pages(self):
+        now = datetime.utcnow()
+        jobs = [
+            job.copy(update={
+                "location": ["Remote", "Austin, TX"][position % 2],
+                "created_at": now - timedelta(hours=position),
+            })
+            for position, job in enumerate(self.jobs)
+        ]
+        asyncio.run(put_jobs(self.catalog, jobs))
+        asyncio.run(delete_job(self.catalog, jobs[0].id))
+
+        page, total = asyncio.run(self.catalog.query({"location": "Remote"}, offset=2, limit=3))
+        self.assertEqual(total, 14)
+        self.assertEqual([job.id for job in page], [job.id for job in jobs[6:12:2]])
+
+        page, total = asyncio.run(self.catalog.query({}, 0, 100, created_after=now - timedelta(hours=4.5)))
+        self.assertEqual([job.id for job in page], [job.id for job in jobs[1:5]])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,222 @@
+import unittest
+
+import numpy as np
+from sklearn.metrics.pairwise import cosine_similarity
+
+from job_index import (
+    FALLBACK_SIMILARITY, GREAT_FIT_SCORE, JobIndex, combine_scores, job_text, resume_text, top_positions
+)
+from models import JobListing, ResumeData
+from skill_taxonomy import DEFAULT_SKILLS_FILE, SkillTaxonomy
+from tests.fixtures import make_jobs
+
+TAXONOMY = SkillTaxonomy.from_file(DEFAULT_SKILLS_FILE)
+
+
+def make_job(title, description, requirements):
+    return JobListing(title=title, company="Acme", description=description, requirements=requirements)
+
+
+class JobIndexTester(unittest.TestCase):
+    """Tests for the catalog-wide TF-IDF job index"""
+
+    def setUp(self):
+        self.jobs = [
+            make_job("Backend", "Build Python services and REST APIs", ["Python", "Django", "SQL"]),
+            make_job("Frontend", "Build React user interfaces", ["JavaScript", "React", "CSS"]),
+            make_job("Data", "Train machine learning models in Python", ["Python", "Pandas", "NumPy"]),
+        ]
+        self.index = JobIndex(self.jobs, TAXONOMY)
+        self.resume = ResumeData(
+            skills=["Python", "Pandas"],
+            experience=[{"description": "Trained machine learning models"}],
+        )
+
+    def test_scores_are_cosine_similarities_under_catalog_idf(self):
+        scores = self.index.semantic_scores(self.resume)
+        vectorizer = self.index.vectorizer
+        expected = cosine_similarity(
+            vectorizer.transform([resume_text(self.resume)]),
+            vectorizer.transform([job_text(job) for job in self.jobs]),
+        )[0]
+        np.testing.assert_allclose(scores, expected, rtol=1e-5)
+        self.assertEqual(int(np.argmax(scores)), 2)
+
+    def test_single_job_similarity(self):
+        scores = self.index.semantic_scores(self.resume)
+        self.assertAlmostEqual(self.index.similarity(self.resume, self.jobs[1]), float(scores[1]), places=5)
+
+        # A job outside the catalog is vectorized with the catalog's IDF
+        outsider = make_job("ML", "Train machine learning models in Python", ["Python"])
+        self.assertGreater(self.index.similarity(self.resume, outsider), float(scores[1]))
+
+    def test_empty_catalog_falls_back(self):
+        index = JobIndex([], TAXONOMY)
+        self.assertEqual(len(index.semantic_scores(self.resume)), 0)
+        self.assertEqual(index.similarity(self.resume, self.jobs[0]), FALLBACK_SIMILARITY)
+
+
+class SkillIncidenceTester(unittest.TestCase):
+    """Tests for vectorized skill overlap over canonical skill IDs"""
+
+    def setUp(self):
+        self.jobs = [
+            make_job("Frontend", "Build interfaces", ["JavaScript", "Vue", "Tailwind", "Accessibility audits"]),
+            make_job("Systems", "Low level work", ["C", "Rust"]),
+            make_job("Empty", "No explicit requirements", []),
+        ]
+        self.index = JobIndex(self.jobs, TAXONOMY)
+
+    def test_aliases_and_free_text_requirements(self):
+        resume = ResumeData(skills=["Vue.js", "Tailwind CSS", "accessibility audits", "Go"])
+        scores, profile = self.index.score(resume)
+        np.testing.assert_array_equal(scores.matched, [3, 0, 0])
+        np.testing.assert_allclose(scores.skill_ratio, [0.75, 0, 0])
+        self.assertEqual(
+            self.index.skill_details(0, profile),
+            (["Vue.js", "Tailwind CSS", "accessibility audits"], ["JavaScript"]),
+        )
+
+    def test_no_substring_false_hits(self):
+        # "C" and "R" used to match any requirement containing those letters
+        scores, profile = self.index.score(ResumeData(skills=["R", "C++", "Rust"]))
+        np.testing.assert_array_equal(scores.matched, [0, 1, 0])
+        self.assertEqual(self.index.skill_details(1, profile), (["Rust"], ["C"]))
+
+    def test_matches_combine_both_scores(self):
+        resume = ResumeData(skills=["JavaScript", "Vue"])
+        scores, _ = self.index.score(resume)
+        matches = self.index.matches(resume)
+        self.assertEqual([match.job.title for match in matches], ["Frontend", "Systems", "Empty"])
+        for position, match in enumerate(matches):
+            expected = combine_scores(scores.semantic[position], scores.skill_ratio[position])
+            self.assertAlmostEqual(match.match_score, float(expected), places=4)
+        self.assertEqual(matches[0].missing_skills, ["Tailwind", "Accessibility audits"])
+
+    def test_added_jobs_match_a_fresh_index(self):
+        index = JobIndex(self.jobs[:1], TAXONOMY)
+        index.add_jobs(self.jobs[1:] + [make_job("Design", "Figma work", ["Figma", "Vue.js"])])
+        resume = ResumeData(skills=["Vue.js", "Rust", "Figma"])
+        scores, profile = index.score(resume)
+        np.testing.assert_array_equal(scores.matched, [1, 1, 0, 2])
+        self.assertEqual(index.skill_details(3, profile), (["Vue.js", "Figma"], []))
+        self.assertEqual(index.position(self.jobs[2].id), 2)
+        with self.assertRaises(ValueError):
+            index.add_jobs(self.jobs[2:])
+
+
+class TopMatchesTester(unittest.TestCase):
+    """Tests for partial selection of the best matches"""
+
+    def test_top_positions_equals_a_stable_full_sort(self):
+        rng = np.random.default_rng(3)
+        scores = rng.integers(0, 20, size=500).astype(float)  # Plenty of ties
+        expected = sorted(range(len(scores)), key=lambda position: -scores[position])
+        for k in (0, 1, 7, 50, 499, 500, 600):
+            self.assertEqual(top_positions(scores, k).tolist(), expected[:k])
+
+        above = [position for position in expected if scores[position] >= 12]
+        self.assertEqual(top_positions(scores, 40, min_score=12).tolist(), above[:40])
+
+    def test_pages_and_threshold(self):
+        index = JobIndex(make_jobs(200, TAXONOMY.names), TAXONOMY)
+        resume = ResumeData(skills=["Python", "Docker", "React", "SQL"])
+        ranked = sorted(index.matches(resume), key=lambda match: match.match_score, reverse=True)
+
+        page, total = index.top_matches(resume, top_k=10, offset=20)
+        self.assertEqual(total, 200)
+        self.assertEqual([match.job.id for match in page], [match.job.id for match in ranked[20:30]])
+
+        threshold = ranked[14].match_score
+        page, total = index.top_matches(resume, top_k=10, offset=10, min_score=threshold)
+        self.assertEqual(total, sum(match.match_score >= threshold for match in ranked))
+        self.assertTrue(all(match.match_score >= threshold for match in page))
+        self.assertEqual(len(page), total - 10)
+
+
+class WhatIfTester(unittest.TestCase):
+    """Tests for delta scoring of added skills"""
+
+    def setUp(self):
+        self.index = JobIndex(make_jobs(300, TAXONOMY.names, seed=2), TAXONOMY)
+        self.resume = ResumeData(
+            skills=["Python", "Vue.js", "SQL"],
+            experience=[{"description": "Built Python services and SQL reports"}],
+        )
+
+    def assert_scores_equal(self, actual, expected):
+        np.testing.assert_allclose(actual.semantic, expected.semantic, atol=1e-6)
+        np.testing.assert_array_equal(actual.matched, expected.matched)
+        np.testing.assert_allclose(actual.match_score, expected.match_score, atol=1e-4)
+
+    def test_matches_rescoring_the_modified_resume(self):
+        added = ["Docker", "Kubernetes", "Vue", "Underwater basket weaving"]
+        what_if = self.index.what_if(self.resume, added)
+        before, _ = self.index.score(self.resume)
+        modified = ResumeData(skills=self.resume.skills + added, experience=self.resume.experience)
+        after, after_skills = self.index.score(modified)
+        self.assert_scores_equal(what_if.before, before)
+        self.assert_scores_equal(what_if.after, after)
+        self.assertEqual(what_if.after_skills.skills, after_skills.skills)
+
+    def test_resume_without_text(self):
+        what_if = self.index.what_if(ResumeData(), ["Go"])
+        after, _ = self.index.score(ResumeData(skills=["Go"]))
+        np.testing.assert_array_equal(what_if.before.semantic, np.zeros(300))
+        self.assert_scores_equal(what_if.after, after)
+
+    def test_sorted_matches(self):
+        what_if = self.index.what_if(self.resume, ["Docker"])
+        matches = self.index.sorted_matches(what_if.after, what_if.after_skills)
+        scores = [match.match_score for match in matches]
+        self.assertEqual(scores, sorted(scores, reverse=True))
+        self.assertEqual(len(matches), 300)
+        page = self.index.sorted_matches(what_if.after, what_if.after_skills, top_k=10, offset=5)
+        self.assertEqual(page, matches[5:15])
+
+    def test_empty_vocabulary(self):
+        index = JobIndex([], TAXONOMY)
+        what_if = index.what_if(self.resume, ["Docker"])
+        self.assertEqual(len(what_if.after.match_score), 0)
+
+
+class SkillGainsTester(unittest.TestCase):
+    """Tests for ranking every candidate skill in one batch"""
+
+    def setUp(self):
+        self.index = JobIndex(make_jobs(400, TAXONOMY.names[:40], seed=4), TAXONOMY)
+        self.resume = ResumeData(
+            skills=self.index.taxonomy.names[:6],
+            experience=[{"description": "Led delivery of data platform services"}],
+        )
+
+    def test_batch_agrees_with_single_what_ifs(self):
+        gains = {gain.skill: gain for gain in self.index.skill_gains(self.resume, include_taxonomy=True)}
+        self.assertNotIn(self.resume.skills[0], gains)
+        for skill in TAXONOMY.names[6:40:5] + [TAXONOMY.names[150]]:
+            what_if = self.index.what_if(self.resume, [skill])
+            before, after = what_if.before.match_score, what_if.after.match_score
+            gain = gains[skill]
+            self.assertAlmostEqual(gain.average_gain, float(np.mean(after - before)), places=4)
+            self.assertEqual(gain.jobs_improved, int(np.count_nonzero(after > before + 1e-9)))
+            self.assertEqual(
+                gain.great_fit_jobs, int(np.count_nonzero((after > GREAT_FIT_SCORE) & (before <= GREAT_FIT_SCORE)))
+            )
+
+    def test_taxonomy_candidates_are_optional(self):
+        required = {gain.skill for gain in self.index.skill_gains(self.resume)}
+        everything = {gain.skill for gain in self.index.skill_gains(self.resume, include_taxonomy=True)}
+        self.assertEqual(required, set(TAXONOMY.names[6:40]))
+        self.assertEqual(len(everything), len(TAXONOMY.names) - 6)
+
+    def test_empty_vocabulary(self):
+        # Single letters are not TF-IDF terms
+        index = JobIndex([make_job("Quiet", "", ["C", "R"])], TAXONOMY)
+        self.assertIsNone(index.matrix)
+        gains = {gain.skill: gain for gain in index.skill_gains(ResumeData(skills=["C"]))}
+        self.assertEqual(list(gains), ["R"])
+        self.assertAlmostEqual(gains["R"].average_gain, 20.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import asyncio
+import unittest
+
+from job_index import JobIndex
+from match_cache import CachedRanking, MatchCache, ranked_matches
+from models import ResumeData
+from skill_taxonomy import DEFAULT_SKILLS_FILE, SkillTaxonomy
+from tests.fixtures import MemoryCollection, make_jobs
+
+TAXONOMY = SkillTaxonomy.from_file(DEFAULT_SKILLS_FILE)
+
+
+def make_ranking(scores, scored):
+    return CachedRanking(
+        fingerprint="f", catalog_version="v", job_ids=[f"job-{n}" for n in range(len(scores))],
+        scores=scores, scored=scored, compute_seconds=0.01,
+    )
+
+
+class CachedRankingTester(unittest.TestCase):
+    """Tests for answering pages from a possibly cut-off ranking"""
+
+    def test_pages_within_the_cut_off(self):
+        ranking = make_ranking([90, 80, 70, 60], scored=100)
+        self.assertEqual(ranking.page(1, 2), (["job-1", "job-2"], [80, 70], 100))
+        self.assertIsNone(ranking.page(3, 2))
+
+    def test_threshold_counts(self):
+        ranking = make_ranking([90, 80, 70, 60], scored=100)
+        self.assertEqual(ranking.page(0, 10, min_score=75), (["job-0", "job-1"], [90, 80], 2))
+        # Every cached score qualifies, so the count is unknown
+        self.assertIsNone(ranking.page(0, 10, min_score=50))
+        complete = make_ranking([90, 80, 70, 60], scored=4)
+        self.assertEqual(complete.page(2, 10, min_score=50), (["job-2", "job-3"], [70, 60], 4))
+
+
+class MatchCacheTester(unittest.TestCase):
+    """Tests for the two-tier match cache"""
+
+    def setUp(self):
+        self.index = JobIndex(make_jobs(300, TAXONOMY.names), TAXONOMY)
+        self.collection = MemoryCollection()
+        self.cache = MatchCache(self.collection, max_entries=8, depth=50)
+        self.resume = ResumeData(
+            skills=["Python", "Docker", "SQL"], experience=[{"description": "Built Python data pipelines"}]
+        )
+
+    def test_identical_skills_share_a_ranking(self):
+        first = asyncio.run(self.cache.ranking(self.index, self.resume))
+        reordered = ResumeData(
+            skills=["SQL", "Python", "Docker"], experience=[{"description": "Python data pipelines Built"}]
+        )
+        second = asyncio.run(self.cache.ranking(self.index, reordered))
+        self.assertIs(second, first)
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertGreater(stats["saved_seconds"], 0)
+
+    def test_cached_page_equals_direct_scoring(self):
+        ranking = asyncio.run(self.cache.ranking(self.index, self.resume))
+        job_ids, scores, total = ranking.page(10, 20)
+        expected, expected_total = self.index.top_matches(self.resume, 20, offset=10)
+        matches = ranked_matches(self.index, self.resume, job_ids, scores)
+        self.assertEqual(total, expected_total)
+        self.assertEqual(matches, expected)
+
+    def test_persisted_tier_survives_a_restart(self):
+        asyncio.run(self.cache.ranking(self.index, self.resume))
+        restarted = MatchCache(self.collection, max_entries=8, depth=50)
+        asyncio.run(restarted.ranking(self.index, self.resume))
+        self.assertEqual((restarted.persisted_hits, restarted.misses), (1, 0))
+
+    def test_catalog_changes_invalidate(self):
+        asyncio.run(self.cache.ranking(self.index, self.resume))
+        version = self.index.version
+        self.index.add_jobs(make_jobs(301, TAXONOMY.names, seed=9)[300:])
+        self.assertNotEqual(self.index.version, version)
+
+        ranking = asyncio.run(self.cache.ranking(self.index, self.resume))
+        self.assertEqual(ranking.catalog_version, self.index.version)
+        self.assertEqual(self.cache.misses, 2)
+        # Another worker may still be on the old version; its entry is left to expire
+        self.assertEqual([doc["catalog_version"] for doc in self.collection.docs], [version, self.index.version])
+
+    def test_versions_are_shared_only_by_equal_scores(self):
+        jobs = make_jobs(310, TAXONOMY.names, seed=9)
+        appended = JobIndex(jobs[:300], TAXONOMY)
+        appended.add_jobs(jobs[300:305])
+        appended.add_jobs(jobs[305:])
+        # Same fit and jobs, appended in another order and grouping
+        regrouped = JobIndex(list(reversed(jobs[:300])), TAXONOMY).appended(reversed(jobs[300:]))
+        rebuilt = JobIndex(jobs, TAXONOMY)
+        reordered = JobIndex(list(reversed(jobs)), TAXONOMY)
+
+        def scores(index):
+            matches, _ = index.top_matches(self.resume, top_k=len(jobs))
+            return {match.job.id: round(match.match_score, 4) for match in matches}
+
+        self.assertEqual(appended.version, regrouped.version)
+        self.assertEqual(scores(appended), scores(regrouped))
+        self.assertEqual(rebuilt.version, reordered.version)
+        self.assertEqual(scores(rebuilt), scores(reordered))
+        # Appending keeps the old vocabulary and IDF, so scores differ from a refit
+        self.assertNotEqual(scores(appended), scores(rebuilt))
+        self.assertNotEqual(appended.version, rebuilt.version)
+        self.assertNotEqual(JobIndex(jobs[1:], TAXONOMY).version, rebuilt.version)
+
+    def test_deeper_requests_recompute(self):
+        asyncio.run(self.cache.ranking(self.index, self.resume))
+        ranking = asyncio.run(self.cache.ranking(self.index, self.resume, depth=len(self.index)))
+        self.assertTrue(ranking.complete)
+        self.assertEqual(len(ranking.job_ids), 300)
+        self.assertEqual(self.cache.misses, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+import asyncio
+import hashlib
+import io
+import unittest
+
+from fastapi import UploadFile
+
+from models import ResumeData, TextExtraction
+from parse_cache import CachedParse, LRUCache, ParseCache, read_upload
+from resume_parser import PARSER_VERSION
+from resume_text import decompress_text
+from tests.fixtures import MemoryCollection
+
+
+class LRUCacheTester(unittest.TestCase):
+    """Tests for the in-process LRU tier"""
+
+    def test_evicts_least_recently_used(self):
+        cache = LRUCache(2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        self.assertEqual(cache.get("a"), 1)
+        cache.put("c", 3)
+        self.assertIn("a", cache)
+        self.assertNotIn("b", cache)
+        self.assertEqual(len(cache), 2)
+
+    def test_stats(self):
+        cache = LRUCache(4)
+        cache.put("a", 1)
+        cache.get("a")
+        cache.get("missing")
+        stats = cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_ratio"], 0.5)
+
+    def test_zero_size_disables_cache(self):
+        cache = LRUCache(0)
+        cache.put("a", 1)
+        self.assertIsNone(cache.get("a"))
+
+
+class ReadUploadTester(unittest.TestCase):
+    """Tests for hashing uploads while they stream in"""
+
+    def test_hash_matches_content(self):
+        content = b"resume " * 100_000
+        upload = UploadFile(file=io.BytesIO(content), filename="resume.pdf")
+        data, digest = asyncio.run(read_upload(upload, chunk_size=4096))
+        self.assertEqual(data, content)
+        self.assertEqual(digest, hashlib.sha256(content).hexdigest())
+
+
+def make_entry(content_hash="hash-a", **fields):
+    resume = ResumeData(name="Jane Smith", skills=["Python", "Docker"], raw_text="Jane Smith\nPython, Docker")
+    return CachedParse(content_hash=content_hash, resume=resume, extraction=TextExtraction(characters=26), **fields)
+
+
+class ParseCacheTester(unittest.TestCase):
+    """Tests for the two-tier parse cache"""
+
+    def setUp(self):
+        self.collection = MemoryCollection()
+        self.cache = ParseCache(self.collection, max_entries=8)
+
+    def test_memory_and_persisted_hits(self):
+        entry = make_entry()
+        asyncio.run(self.cache.put(entry))
+        self.assertIs(asyncio.run(self.cache.get("hash-a")), entry)
+        self.assertIsNone(asyncio.run(self.cache.get("hash-b")))
+
+        # Another worker finds the entry in Mongo and keeps it in memory
+        other = ParseCache(self.collection, max_entries=8)
+        cached = asyncio.run(other.get("hash-a"))
+        self.assertEqual(cached, entry)
+        self.assertIn("hash-a", other.memory)
+
+    def test_raw_text_is_stored_compressed(self):
+        entry = make_entry()
+        asyncio.run(self.cache.put(entry))
+        doc = self.collection.docs[0]
+        self.assertNotIn("raw_text", doc["resume"])
+        self.assertEqual(decompress_text(doc["text"], doc["text_codec"]), entry.resume.raw_text)
+
+        # Entries stored with the text inline are still read
+        self.collection.docs[0] = make_entry("hash-b").dict()
+        self.assertEqual(asyncio.run(self.cache.get("hash-b")).resume.raw_text, entry.resume.raw_text)
+
+    def test_stale_entries_are_rejected(self):
+        self.collection.docs.append(make_entry("old-parser", parser_version=PARSER_VERSION - 1).dict())
+        self.collection.docs.append(make_entry("old-skills", skills_checksum="old").dict())
+        self.assertIsNone(asyncio.run(self.cache.get("old-parser")))
+        self.assertIsNone(asyncio.run(self.cache.get("old-skills")))
+
+        # An in-memory entry parsed with an older skills file is re-read from Mongo
+        self.cache.memory.put("hash-a", make_entry(skills_checksum="old"))
+        self.assertIsNone(asyncio.run(self.cache.get("hash-a")))
+        asyncio.run(self.cache.put(make_entry()))
+        self.assertEqual(asyncio.run(self.cache.get("hash-a")).skills_checksum, make_entry().skills_checksum)
+
+    def test_latest_resume_id_is_kept_for_deduplication(self):
+        asyncio.run(self.cache.put(make_entry(resume_id="resume-1")))
+        asyncio.run(self.cache.put(make_entry(resume_id="resume-2")))
+        self.assertEqual(len(self.collection.docs), 1)
+        other = ParseCache(self.collection, max_entries=8)
+        self.assertEqual(asyncio.run(other.get("hash-a")).resume_id, "resume-2")
+
+    def test_unreadable_collection_is_a_miss(self):
+        async def fail(*args, **kwargs):
+            raise ConnectionError("no database")
+
+        self.collection.find_one = fail
+        self.collection.replace_one = fail
+        asyncio.run(self.cache.put(make_entry()))
+        self.assertIsNotNone(asyncio.run(self.cache.get("hash-a")))
+        self.assertIsNone(asyncio.run(ParseCache(self.collection).get("hash-a")))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,117 @@
+import asyncio
+import time
+import unittest
+
+from parse_pool import ParsePool, ParsePoolBusy, ParsePoolTimeout
+from resume_parser import ResumeParseError, process_resume_file
+
+
+class ParsePoolTester(unittest.TestCase):
+    """Tests for the bounded parse pool"""
+
+    def test_process_pool_runs_pipeline(self):
+        pool = ParsePool(max_workers=1, max_pending=2, timeout=60)
+        content = b"Jane Smith\njane@example.com\n\nSKILLS\nPython, Docker, CI/CD\n"
+        try:
+            resume, _ = asyncio.run(pool.run(process_resume_file, "resume.pdf", content))
+        finally:
+            pool.shutdown()
+        self.assertEqual(resume.email, "jane@example.com")
+        self.assertIn("Docker", resume.skills)
+        self.assertEqual(pool.pending, 0)
+
+    def test_parse_errors_propagate(self):
+        pool = ParsePool(max_workers=0, max_pending=2, timeout=5)
+        with self.assertRaises(ResumeParseError):
+            asyncio.run(pool.run(process_resume_file, "resume.pdf", b"   "))
+
+    def test_queue_depth_is_bounded(self):
+        pool = ParsePool(max_workers=0, max_pending=1, timeout=5)
+
+        async def submit_two():
+            first = asyncio.ensure_future(pool.run(time.sleep, 0.2))
+            await asyncio.sleep(0)
+            with self.assertRaises(ParsePoolBusy):
+                await pool.run(time.sleep, 0)
+            await first
+
+        asyncio.run(submit_two())
+        self.assertEqual(pool.pending, 0)
+
+    def test_waiting_callers_leave_reserved_slots(self):
+        pool = ParsePool(max_workers=0, max_pending=3, timeout=5, reserved=1)
+
+        async def submit():
+            bulk = [asyncio.ensure_future(pool.run(time.sleep, 0.1, wait=True)) for _ in range(4)]
+            await asyncio.sleep(0.02)
+            # Two run, two wait; the reserved slot still takes a single upload
+            self.assertEqual(pool.pending, 2)
+            await pool.run(time.sleep, 0)
+            with self.assertRaises(ParsePoolBusy):
+                await asyncio.gather(pool.run(time.sleep, 0.1), pool.run(time.sleep, 0))
+            await asyncio.gather(*bulk)
+
+        asyncio.run(submit())
+        self.assertEqual(pool.pending, 0)
+        self.assertFalse(pool._waiters)
+
+    def test_timeout_keeps_slot_until_finished(self):
+        pool = ParsePool(max_workers=0, max_pending=1, timeout=0.05)
+
+        async def overrun():
+            with self.assertRaises(ParsePoolTimeout):
+                await pool.run(time.sleep, 0.3)
+            self.assertEqual(pool.pending, 1)
+            await asyncio.sleep(0.5)
+            self.assertEqual(pool.pending, 0)
+
+        asyncio.run(overrun())
+
+    def test_stuck_worker_is_replaced(self):
+        pool = ParsePool(max_workers=1, max_pending=2, timeout=2)
+
+        async def hang():
+            # Start the workers first, so that spawning them does not count against the timeout
+            await pool.run(time.sleep, 0)
+            stuck = pool._workers
+            with self.assertRaises(ParsePoolTimeout):
+                await pool.run(time.sleep, 600)
+            self.assertIsNot(pool._workers, stuck)
+            self.assertEqual(len(stuck.stuck), 1)
+            self.assertEqual(await pool.run(abs, -3), 3)
+            deadline = time.monotonic() + 10
+            while pool.pending and time.monotonic() < deadline:
+                await asyncio.sleep(0.1)
+            self.assertEqual(pool.pending, 0)
+
+        try:
+            asyncio.run(hang())
+        finally:
+            pool.shutdown()
+
+    def test_queued_timeout_keeps_the_workers(self):
+        pool = ParsePool(max_workers=1, max_pending=2, timeout=2)
+
+        async def queue_behind():
+            await pool.run(time.sleep, 0)
+            workers = pool._workers
+            # The second task waits behind the first and is picked up after
+            # its start deadline (timeout minus 0.5 s), so it never runs
+            first = asyncio.ensure_future(pool.run(time.sleep, 1.75))
+            await asyncio.sleep(0)
+            with self.assertRaises(ParsePoolTimeout):
+                await pool.run(time.sleep, 600)
+            await first
+            self.assertIs(pool._workers, workers)
+            self.assertFalse(workers.stuck)
+            self.assertEqual(await pool.run(abs, -3), 3)
+
+        try:
+            asyncio.run(queue_behind())
+        finally:
+            pool.shutdown()
+        self.assertEqual(pool.pending, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+import unittest
+
+from resume_parser import ExtractionBudget, extract_pdf_text, iter_pdf_pages, process_resume_file
+from tests.fixtures import make_pdf
+
+PAGE = "Jane Smith\njane@example.com\nSKILLS\nPython, Docker, Kubernetes"
+
+
+class PdfExtractionTester(unittest.TestCase):
+    """Tests for budgeted, page-streaming PDF extraction"""
+
+    def test_pages_are_streamed(self):
+        pages = list(iter_pdf_pages(make_pdf([f"Page {n}" for n in range(3)])))
+        self.assertEqual([text for _, text in pages], ["Page 0", "Page 1", "Page 2"])
+        self.assertEqual({count for count, _ in pages}, {3})
+
+    def test_within_budget_is_not_truncated(self):
+        text, extraction = extract_pdf_text(make_pdf([PAGE] * 2), ExtractionBudget())
+        self.assertEqual(text.count("Jane Smith"), 2)
+        self.assertFalse(extraction.truncated)
+        self.assertEqual((extraction.pages_read, extraction.total_pages), (2, 2))
+
+    def test_page_budget(self):
+        text, extraction = extract_pdf_text(make_pdf([PAGE] * 10), ExtractionBudget(max_pages=3))
+        self.assertEqual(text.count("Jane Smith"), 3)
+        self.assertTrue(extraction.truncated)
+        self.assertEqual(extraction.truncation_reason, "pages")
+        self.assertEqual((extraction.pages_read, extraction.total_pages), (3, 10))
+
+    def test_character_budget(self):
+        text, extraction = extract_pdf_text(make_pdf([PAGE] * 10), ExtractionBudget(max_chars=100))
+        self.assertLessEqual(len(text), 100)
+        self.assertEqual(extraction.truncation_reason, "chars")
+
+    def test_time_budget(self):
+        _, extraction = extract_pdf_text(make_pdf([PAGE] * 10), ExtractionBudget(max_seconds=0))
+        self.assertEqual(extraction.pages_read, 1)
+        self.assertEqual(extraction.truncation_reason, "time")
+
+    def test_pipeline_reports_extraction(self):
+        resume, extraction = process_resume_file("resume.pdf", make_pdf([PAGE]))
+        self.assertEqual(resume.email, "jane@example.com")
+        self.assertIn("Kubernetes", resume.skills)
+        self.assertEqual(extraction.pages_read, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
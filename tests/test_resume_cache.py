@@ -0,0 +1,89 @@
+import asyncio
+import unittest
+
+from models import ResumeData
+from resume_cache import ResumeCache
+from resume_repository import CACHED_FIELDS, ResumeRepository
+from tests.fixtures import MemoryCollection
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class ResumeCacheTester(unittest.TestCase):
+    """Tests for the read-through resume cache"""
+
+    def setUp(self):
+        self.clock = Clock()
+        self.cache = ResumeCache(max_entries=2, ttl=30, clock=self.clock)
+        self.resumes = {f"r{number}": ResumeData(id=f"r{number}", skills=["Go"]) for number in range(3)}
+        self.loads = []
+
+    async def load(self, resume_id, delay=0):
+        self.loads.append(resume_id)
+        await asyncio.sleep(delay)
+        return self.resumes.get(resume_id)
+
+    def get(self, resume_id):
+        return asyncio.run(self.cache.get(resume_id, lambda: self.load(resume_id)))
+
+    def test_hits_expiry_and_eviction(self):
+        self.assertIs(self.get("r0"), self.resumes["r0"])
+        self.assertIs(self.get("r0"), self.resumes["r0"])
+        self.assertEqual(self.loads, ["r0"])
+
+        self.clock.now = 31
+        self.get("r0")
+        self.get("r1")
+        self.get("r0")
+        # Evicts r1, the least recently used
+        self.get("r2")
+        self.get("r1")
+        self.assertEqual(self.loads, ["r0", "r0", "r1", "r2", "r1"])
+
+        stats = self.cache.stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["expired"], stats["entries"]), (2, 5, 1, 2))
+
+    def test_missing_resumes_and_errors_are_not_cached(self):
+        self.assertIsNone(self.get("missing"))
+        self.assertIsNone(self.get("missing"))
+
+        async def fail():
+            raise RuntimeError("database down")
+        with self.assertRaises(RuntimeError):
+            asyncio.run(self.cache.get("r0", fail))
+        self.get("r0")
+        self.assertEqual(self.loads, ["missing", "missing", "r0"])
+
+    def test_concurrent_misses_share_one_load(self):
+        async def requests():
+            return await asyncio.gather(*(self.cache.get("r0", lambda: self.load("r0", 0.01)) for _ in range(10)))
+
+        self.assertTrue(all(resume is self.resumes["r0"] for resume in asyncio.run(requests())))
+        self.assertEqual(self.loads, ["r0"])
+        self.assertEqual((self.cache.stats()["misses"], self.cache.stats()["coalesced"]), (1, 9))
+
+
+class CachedRepositoryTester(unittest.TestCase):
+    """Tests for cached resume reads through the repository"""
+
+    def test_reads_cached_fields(self):
+        collection = MemoryCollection()
+        repository = ResumeRepository(collection, cache=ResumeCache())
+        resume = ResumeData(name="Ada", phone="555", skills=["Go"], education=[{"degree": "BSc"}], raw_text="text")
+        asyncio.run(repository.insert(resume))
+
+        cached = asyncio.run(repository.get_cached(resume.id))
+        self.assertEqual(cached.dict(include=set(CACHED_FIELDS)), resume.dict(include=set(CACHED_FIELDS)))
+        self.assertEqual((cached.education, cached.raw_text), ([], ""))
+        collection.docs.clear()
+        self.assertIs(asyncio.run(repository.get_cached(resume.id)), cached)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from resume_document import ResumeDocument, normalize_lines
+from resume_parser import extract_experience, extract_skills, parse_resume_content
+from tests.fixtures import SAMPLE_RESUME_PAGE
+
+
+class ResumeDocumentTester(unittest.TestCase):
+    """Tests for the shared, pre-tokenized resume document"""
+
+    def test_whitespace_is_collapsed(self):
+        self.assertEqual(normalize_lines("  Jane \t  Smith  \r\n\r\nSKILLS"), ["Jane Smith", "", "SKILLS"])
+
+    def test_dehyphenation(self):
+        lines = normalize_lines("Led the develop-\nment of APIs\nFront-\nEnd")
+        self.assertEqual(lines, ["Led the development of APIs", "Front-", "End"])
+
+    def test_views_and_offsets_line_up(self):
+        doc = ResumeDocument("Jane Smith\n\nSKILLS\nPython")
+        self.assertEqual(doc.lower_lines[2], "skills")
+        for index, line in enumerate(doc.lines):
+            offset = doc.line_offsets[index]
+            self.assertEqual(doc.text[offset:offset + len(line)], line)
+            self.assertEqual(doc.lower[offset:offset + len(line)], line.lower())
+
+    def test_lowercasing_keeps_offsets(self):
+        # "İ".lower() is two characters; the lowercase views must not shift
+        name = "İ" * 40 + " Name"
+        doc = ResumeDocument(f"{name}\nSKILLS\nPostgreSQL, Golang, R, SQL")
+        self.assertEqual(len(doc.lower), len(doc.text))
+        self.assertTrue(doc.lower_lines[0].startswith("iii"))
+        self.assertEqual(
+            extract_skills(doc), extract_skills("Jane Name\nSKILLS\nPostgreSQL, Golang, R, SQL")
+        )
+
+    def test_sections(self):
+        doc = ResumeDocument(SAMPLE_RESUME_PAGE)
+        self.assertEqual([s.name for s in doc.sections], ["skills", "experience", "education"])
+        skills = doc.sections[0]
+        self.assertEqual(doc.lines[skills.start_line], "Python, JavaScript, React, Node.js, C++, CI/CD, Machine Learning, SQL, Git")
+        self.assertEqual(skills.end_line, doc.sections[1].heading_line)
+
+    def test_extractors_accept_text_or_document(self):
+        doc = ResumeDocument(SAMPLE_RESUME_PAGE)
+        self.assertEqual(extract_experience(doc), extract_experience(SAMPLE_RESUME_PAGE))
+
+    def test_parse_resume_content(self):
+        resume = parse_resume_content(SAMPLE_RESUME_PAGE)
+        self.assertEqual(resume.name, "John Doe")
+        self.assertEqual(resume.email, "john.doe@example.com")
+        self.assertEqual(resume.experience[0]["role"], "2019-2023")
+        self.assertTrue(resume.experience[0]["description"].startswith("Built microservices"))
+        self.assertEqual(resume.education[0]["institution"], "university of technology")
+        self.assertIn("C++", resume.skills)
+        self.assertEqual(resume.raw_text, SAMPLE_RESUME_PAGE)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,150 @@
+import asyncio
+import unittest
+from unittest import mock
+
+import numpy as np
+
+from job_index import JobIndex
+from models import ResumeData
+import resume_index
+from resume_index import ResumeIndex, resume_features
+from skill_taxonomy import DEFAULT_SKILLS_FILE, SkillTaxonomy
+from tests.fixtures import JOB_WORDS, MemoryCollection, make_jobs
+
+TAXONOMY = SkillTaxonomy.from_file(DEFAULT_SKILLS_FILE)
+
+
+def make_resumes(count, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        ResumeData(
+            name=f"Candidate {number}",
+            skills=rng.choice(TAXONOMY.names[:60], size=6, replace=False).tolist(),
+            experience=[{"description": " ".join(rng.choice(JOB_WORDS, size=20).tolist())}],
+        )
+        for number in range(count)
+    ]
+
+
+class ResumeIndexTester(unittest.TestCase):
+    """Tests for ranking stored resumes against a job"""
+
+    def setUp(self):
+        self.jobs = JobIndex(make_jobs(50, TAXONOMY.names[:60], seed=1), TAXONOMY)
+        self.resumes = make_resumes(120)
+        self.index = ResumeIndex()
+        self.index.add(resume_features(resume) for resume in self.resumes)
+
+    def test_scores_match_forward_matching(self):
+        position = 7
+        page, total = self.index.candidates(self.jobs, position, top_k=120)
+        self.assertEqual(total, 120)
+        scores = {match.resume_id: match for match in page}
+        for resume in self.resumes:
+            forward, profile = self.jobs.score(resume)
+            match = scores[resume.id]
+            self.assertAlmostEqual(match.match_score, forward.match_score[position], places=4)
+            self.assertEqual((match.matching_skills, match.missing_skills), self.jobs.skill_details(position, profile))
+        ranked = [match.match_score for match in page]
+        self.assertEqual(ranked, sorted(ranked, reverse=True))
+
+    def test_pages_and_threshold(self):
+        ranked, _ = self.index.candidates(self.jobs, 3, top_k=120)
+        page, _ = self.index.candidates(self.jobs, 3, top_k=5, offset=10)
+        self.assertEqual([match.resume_id for match in page], [match.resume_id for match in ranked[10:15]])
+
+        threshold = ranked[20].match_score
+        page, total = self.index.candidates(self.jobs, 3, top_k=100, min_score=threshold)
+        self.assertEqual(total, sum(match.match_score >= threshold for match in ranked))
+        self.assertEqual(len(page), total)
+
+    def test_incremental_add(self):
+        self.index.candidates(self.jobs, 0, top_k=1)
+        job = self.jobs.jobs[0]
+        newcomer = ResumeData(skills=job.requirements, experience=[{"description": job.description}])
+        self.index.add([resume_features(newcomer), resume_features(self.resumes[0])])
+        self.assertEqual(len(self.index), 121)
+        page, total = self.index.candidates(self.jobs, 0, top_k=1)
+        self.assertEqual((page[0].resume_id, total), (newcomer.id, 121))
+        self.assertEqual(page[0].missing_skills, [])
+
+    def test_rebuilds_for_a_new_vocabulary(self):
+        empty = JobIndex([], TAXONOMY)
+        empty.add_jobs(self.jobs.jobs)
+        page, _ = self.index.candidates(empty, 7, top_k=3)
+        expected, _ = self.index.candidates(self.jobs, 7, top_k=3)
+        self.assertEqual(page, expected)
+
+    def test_load_backfills_features(self):
+        resumes = MemoryCollection(resume.dict() for resume in self.resumes[:30])
+        features = MemoryCollection(resume_features(resume).dict() for resume in self.resumes[:10])
+        index = ResumeIndex(features, MemoryCollection())
+        asyncio.run(index.load(resumes, batch_size=7))
+        self.assertEqual(len(index), 30)
+        self.assertEqual(len(features.docs), 30)
+
+        asyncio.run(index.add_resumes(self.resumes[30:32]))
+        self.assertEqual((len(index), len(features.docs)), (32, 32))
+
+    def test_load_skips_resumes_when_every_feature_is_stored(self):
+        resumes = MemoryCollection(resume.dict() for resume in self.resumes[:30])
+        features = MemoryCollection(resume_features(resume).dict() for resume in self.resumes[:30])
+
+        async def unexpected(*args, **kwargs):
+            raise AssertionError("resumes were scanned")
+            yield
+
+        resumes.find = unexpected
+        index = ResumeIndex(features, MemoryCollection())
+        asyncio.run(index.load(resumes))
+        self.assertEqual(len(index), 30)
+
+    def test_refresh_picks_up_other_workers(self):
+        features, counters = MemoryCollection(), MemoryCollection()
+        first, second = ResumeIndex(features, counters), ResumeIndex(features, counters)
+        asyncio.run(first.load(MemoryCollection()))
+        asyncio.run(second.load(MemoryCollection()))
+        asyncio.run(first.add_resumes(self.resumes[:3]))
+        asyncio.run(second.add_resumes(self.resumes[3:5]))
+
+        self.assertEqual(asyncio.run(first.refresh()), 2)
+        self.assertEqual(asyncio.run(second.refresh()), 3)
+        self.assertEqual(asyncio.run(first.refresh()), 0)
+        self.assertEqual(len(first), len(second))
+        self.assertEqual(first.version, 5)
+
+    def test_writes_later_than_the_look_back_are_reconciled(self):
+        features, counters = MemoryCollection(), MemoryCollection()
+        first, second = ResumeIndex(features, counters), ResumeIndex(features, counters)
+        asyncio.run(first.load(MemoryCollection()))
+        asyncio.run(second.load(MemoryCollection()))
+        asyncio.run(first.add_resumes(self.resumes[:5]))
+        self.assertEqual(asyncio.run(second.refresh()), 5)
+        # A batch numbered before the others that lands only now
+        late = dict(resume_features(self.resumes[5]).dict(), seq=1)
+        asyncio.run(features.insert_one(late))
+        asyncio.run(first.add_resumes(self.resumes[6:8]))
+
+        with mock.patch.object(resume_index, "REFRESH_LOOKBACK", 2):
+            self.assertEqual(asyncio.run(second.refresh()), 3)
+            self.assertEqual(asyncio.run(second.refresh()), 0)
+        self.assertEqual(len(second), 8)
+        self.assertIn(self.resumes[5].id, second._positions)
+
+    def test_sync_keeps_resumes_added_meanwhile(self):
+        index = ResumeIndex()
+        index.add(resume_features(resume) for resume in self.resumes[:100])
+
+        async def sync_and_add():
+            syncing = asyncio.ensure_future(index.sync(self.jobs))
+            await asyncio.sleep(0)
+            index.add(resume_features(resume) for resume in self.resumes[100:])
+            await syncing
+
+        asyncio.run(sync_and_add())
+        self.assertEqual(index.matrix.shape[0], 120)
+        self.assertEqual(index.candidates(self.jobs, 7, top_k=120), self.index.candidates(self.jobs, 7, top_k=120))
+
+
+if __name__ == '__main__':
+    unittest.main()
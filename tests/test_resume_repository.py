@@ -0,0 +1,148 @@
+import asyncio
+import unittest
+from datetime import datetime, timedelta
+
+from models import ResumeData
+from resume_repository import MATCH_FIELDS, InvalidCursor, ResumeRepository, projection
+from resume_text import ResumeTextStore
+from tests.fixtures import SAMPLE_RESUME_PAGE, MemoryCollection
+
+
+class IndexRecorder(MemoryCollection):
+    def __init__(self, docs=()):
+        super().__init__(docs)
+        self.indexes = []
+
+    async def create_index(self, keys, unique=False):
+        self.indexes.append((keys, unique))
+
+
+class ResumeRepositoryTester(unittest.TestCase):
+    """Tests for projection-aware resume reads"""
+
+    def setUp(self):
+        self.resume = ResumeData(
+            name="Ada", email="ada@example.com", skills=["Python"], raw_text="x" * 10000, content_hash="abc"
+        )
+        self.collection = IndexRecorder()
+        self.repository = ResumeRepository(self.collection)
+        asyncio.run(self.repository.insert(self.resume))
+
+    def test_projection(self):
+        self.assertEqual(projection(), {"_id": 0})
+        self.assertEqual(projection(["id", "skills"]), {"_id": 0, "id": 1, "skills": 1})
+
+    def test_reads_only_the_declared_fields(self):
+        doc = asyncio.run(self.repository.get_doc(self.resume.id, MATCH_FIELDS))
+        self.assertEqual(set(doc), set(MATCH_FIELDS))
+        resume = asyncio.run(self.repository.get(self.resume.id, MATCH_FIELDS))
+        self.assertEqual((resume.id, resume.skills, resume.raw_text), (self.resume.id, ["Python"], ""))
+
+        self.assertEqual(asyncio.run(self.repository.get(self.resume.id)), self.resume)
+        self.assertIsNone(asyncio.run(self.repository.get("missing")))
+
+    def test_indexes(self):
+        asyncio.run(self.repository.ensure_indexes())
+        self.assertEqual(self.collection.indexes, [("id", True), ([("created_at", 1), ("id", 1)], False), ("content_hash", False)])
+
+
+class OutOfLineTextTester(unittest.TestCase):
+    """Tests for raw text kept in the resume text store"""
+
+    def setUp(self):
+        self.collection = MemoryCollection()
+        self.texts = MemoryCollection()
+        self.repository = ResumeRepository(self.collection, ResumeTextStore(self.texts))
+        self.resumes = [
+            ResumeData(name=f"Candidate {number}", skills=["Go"], raw_text=SAMPLE_RESUME_PAGE * (number + 1))
+            for number in range(3)
+        ]
+        asyncio.run(self.repository.insert(self.resumes[0]))
+        asyncio.run(self.repository.insert_many(self.resumes[1:]))
+
+    def test_text_is_read_only_when_asked_for(self):
+        self.assertTrue(all("raw_text" not in doc for doc in self.collection.docs))
+        self.assertEqual(asyncio.run(self.repository.get(self.resumes[1].id)), self.resumes[1])
+        doc = asyncio.run(self.repository.get_doc(self.resumes[2].id, ["id", "raw_text"]))
+        self.assertEqual(doc["raw_text"], self.resumes[2].raw_text)
+
+        self.texts.docs.clear()
+        resume = asyncio.run(self.repository.get(self.resumes[1].id, MATCH_FIELDS))
+        self.assertEqual((resume.skills, resume.raw_text), (["Go"], ""))
+        docs, _ = asyncio.run(self.repository.page(None, 10))
+        self.assertEqual([doc["id"] for doc in docs if "raw_text" not in doc], [resume.id for resume in self.resumes])
+
+    def test_moves_inline_text_of_older_resumes(self):
+        legacy = ResumeData(name="Legacy", raw_text="Old resume text")
+        self.collection.docs.append(legacy.dict())
+        docs, _ = asyncio.run(self.repository.page(None, 10))
+        self.assertNotIn("raw_text", docs[-1])
+        self.assertEqual(asyncio.run(self.repository.get(legacy.id)), legacy)
+
+        self.assertEqual(asyncio.run(self.repository.move_inline_text()), 1)
+        self.assertEqual(asyncio.run(self.repository.move_inline_text()), 0)
+        self.assertNotIn("raw_text", self.collection.docs[-1])
+        self.assertEqual(asyncio.run(self.repository.get(legacy.id)), legacy)
+
+    def test_recorded_text_migration_is_not_repeated(self):
+        migrations = MemoryCollection()
+        legacy = ResumeData(name="Legacy", raw_text="Old resume text")
+        self.collection.docs.append(legacy.dict())
+        self.assertEqual(asyncio.run(self.repository.move_inline_text(migrations)), 1)
+        self.assertEqual(migrations.docs[0]["moved"], 1)
+
+        self.collection.docs.append(ResumeData(name="Late", raw_text="Written by an old worker").dict())
+        self.assertEqual(asyncio.run(self.repository.move_inline_text(migrations)), 0)
+        self.assertIn("raw_text", self.collection.docs[-1])
+
+
+class ResumeListingTester(unittest.TestCase):
+    """Tests for keyset-paginated resume listings"""
+
+    def setUp(self):
+        start = datetime(2024, 1, 1)
+        # Pairs of resumes share an upload time, so ids have to break the ties
+        self.resumes = [
+            ResumeData(id=f"resume-{number:02d}", name=f"Candidate {number}", created_at=start + timedelta(minutes=number // 2))
+            for number in range(25)
+        ]
+        shuffled = self.resumes[::2] + self.resumes[1::2]
+        self.repository = ResumeRepository(MemoryCollection(resume.dict() for resume in shuffled))
+
+    def walk(self, limit, fields=None):
+        pages, cursor = [], None
+        while True:
+            docs, cursor = asyncio.run(self.repository.page(fields, limit, cursor))
+            pages.append(docs)
+            if cursor is None:
+                return pages
+
+    def test_pages_cover_every_resume_once_in_order(self):
+        pages = self.walk(10)
+        self.assertEqual([len(page) for page in pages], [10, 10, 5])
+        self.assertEqual([doc["id"] for page in pages for doc in page], [resume.id for resume in self.resumes])
+        self.assertEqual([len(page) for page in self.walk(25)], [25])
+
+    def test_selected_fields_keep_the_cursor_fields(self):
+        docs, cursor = asyncio.run(self.repository.page(["name"], 3))
+        self.assertEqual(set(docs[0]), {"id", "created_at", "name"})
+        docs, _ = asyncio.run(self.repository.page(["name"], 3, cursor))
+        self.assertEqual(docs[0]["id"], "resume-03")
+
+    def test_uploads_after_a_cursor_land_on_later_pages(self):
+        docs, cursor = asyncio.run(self.repository.page(None, 10))
+        late = ResumeData(id="resume-late")
+        asyncio.run(self.repository.insert(late))
+        rest = [doc["id"] for docs in self.walk(100) for doc in docs]
+        self.assertEqual(rest[-1], late.id)
+        docs, _ = asyncio.run(self.repository.page(None, 100, cursor))
+        self.assertEqual([doc["id"] for doc in docs], [resume.id for resume in self.resumes[10:]] + [late.id])
+
+    def test_invalid_cursor(self):
+        for cursor in ("not a cursor", "W10=", "WyJ4IiwgInkiXQ=="):
+            with self.assertRaises(InvalidCursor):
+                asyncio.run(self.repository.page(None, 10, cursor))
+
+
+if __name__ == '__main__':
+    unittest.main()
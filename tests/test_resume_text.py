@@ -0,0 +1,36 @@
+import asyncio
+import unittest
+
+from resume_text import ResumeTextStore, compress_text, decompress_text
+from tests.fixtures import SAMPLE_RESUME_PAGE, MemoryCollection
+
+
+class ResumeTextStoreTester(unittest.TestCase):
+    """Tests for compressed raw resume text"""
+
+    def setUp(self):
+        self.collection = MemoryCollection()
+        self.store = ResumeTextStore(self.collection)
+
+    def test_codec(self):
+        text = SAMPLE_RESUME_PAGE + "Résumé — naïve café"
+        data = compress_text(text)
+        self.assertLess(len(data), len(text.encode("utf-8")))
+        self.assertEqual(decompress_text(data), text)
+        with self.assertRaises(ValueError):
+            decompress_text(data, "lz4")
+
+    def test_put_get_and_replace(self):
+        asyncio.run(self.store.put_many([("a", SAMPLE_RESUME_PAGE), ("b", "")]))
+        self.assertEqual(asyncio.run(self.store.get("a")), SAMPLE_RESUME_PAGE)
+        self.assertEqual(asyncio.run(self.store.get("b")), "")
+        self.assertIsNone(asyncio.run(self.store.get("c")))
+
+        asyncio.run(self.store.put("a", "Rewritten"))
+        self.assertEqual(asyncio.run(self.store.get("a")), "Rewritten")
+        self.assertEqual(len(self.collection.docs), 2)
+        self.assertIsInstance(self.collection.docs[-1]["data"], bytes)
+
+
+if __name__ == '__main__':
+    unittest.main()
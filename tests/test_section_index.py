@@ -0,0 +1,58 @@
+import time
+import unittest
+
+from resume_document import ResumeDocument, is_heading_like
+from resume_parser import extract_skills
+
+
+def timed(func, arg):
+    start = time.perf_counter()
+    func(arg)
+    return time.perf_counter() - start
+
+
+class SectionIndexTester(unittest.TestCase):
+    """Tests for one-pass section heading detection"""
+
+    def test_heading_styles(self):
+        doc = ResumeDocument(
+            "Jane Smith\n\nTECHNICAL EXPERTISE\nAWS, Docker\n\nWork History\nAcme 2020-2023\n\n"
+            "Technical Skills: Rust, C++\nEducation:\nState University"
+        )
+        self.assertEqual([s.name for s in doc.sections], ["skills", "experience", "skills", "education"])
+        self.assertEqual([doc.text[start:end] for start, end in doc.section_blocks("skills")], ["AWS, Docker", "Rust, C++"])
+
+    def test_block_stops_at_blank_or_heading_like_line(self):
+        doc = ResumeDocument("SKILLS\nPython, Go\nDocker\nCERTIFICATIONS AND AWARDS\nCKA")
+        self.assertEqual([doc.text[start:end] for start, end in doc.section_blocks("skills")], ["Python, Go\nDocker"])
+
+    def test_heading_like(self):
+        self.assertTrue(is_heading_like("PROJECTS"))
+        self.assertTrue(is_heading_like("Volunteer Work:"))
+        self.assertFalse(is_heading_like("Python, Java"))
+        self.assertFalse(is_heading_like("Built APIs in Go"))
+
+    def test_section_substring_matches(self):
+        skills = extract_skills("Jane\n\nSKILLS\nGolang, PostgreSQL\n\nLikes gardening")
+        self.assertIn("Go", skills)
+        self.assertIn("SQL", skills)
+        self.assertNotIn("R", extract_skills("Jane\n\nHOBBIES\nGardening, reading"))
+
+    def test_adversarial_input_is_linear(self):
+        # Many skills headings over a long run of letter-only lines made the
+        # old lookahead regex rescan the rest of the text for every heading.
+        # At 680 KB that takes tens of seconds, and linear scanning well under
+        # a second, so the generous bound only fails on a quadratic scan.
+        self.assertLess(timed(extract_skills, "skills\nred green\n" * 40000), 5.0)
+
+    def test_many_skills_sections_and_unbounded_hits_are_linear(self):
+        # Thousands of skills blocks, then "r" in every word outside them:
+        # each such hit used to be checked against every block
+        def adversarial(repetitions):
+            return "skills: -\n" * repetitions + "\n\nHOBBIES\n" + "bread " * repetitions
+
+        self.assertLess(timed(extract_skills, adversarial(40000)), 5.0)
+        self.assertNotIn("R", extract_skills(adversarial(100)))
+
+if __name__ == '__main__':
+    unittest.main()
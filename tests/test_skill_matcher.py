@@ -0,0 +1,54 @@
+import unittest
+
+from skill_matcher import SkillMatcher
+
+
+class SkillMatcherTester(unittest.TestCase):
+    """Tests for the compiled multi-pattern skill matcher"""
+
+    def setUp(self):
+        self.matcher = SkillMatcher([
+            'Python', 'Java', 'JavaScript', 'C++', 'C#', 'C', 'R', 'Go',
+            'Node.js', 'CI/CD', 'Machine Learning', 'SQL', 'MySQL',
+        ])
+
+    def test_special_character_skills(self):
+        found = self.matcher.find("built ci/cd pipelines for node.js and c++ services")
+        self.assertIn('CI/CD', found)
+        self.assertIn('Node.js', found)
+        self.assertIn('C++', found)
+
+    def test_word_boundaries(self):
+        found = self.matcher.find("javascript developer who loves mysql and google")
+        self.assertEqual(found, {'JavaScript', 'MySQL'})
+
+    def test_overlapping_matches(self):
+        found = self.matcher.find("java, javascript and sql; also mysql")
+        self.assertEqual(found, {'Java', 'JavaScript', 'SQL', 'MySQL'})
+
+    def test_unbounded_spans_accept_substrings(self):
+        text = "skills: golang\nworked at google"
+        found = self.matcher.find(text, [(8, 14)])
+        self.assertIn('Go', found)
+        self.assertNotIn('R', found)
+
+    def test_multi_word_skill(self):
+        found = self.matcher.find("applied machine learning to fraud detection")
+        self.assertEqual(found, {'Machine Learning'})
+
+    def test_duplicates_collapse(self):
+        matcher = SkillMatcher(['Docker', 'Docker', 'docker'])
+        self.assertEqual(matcher.find("docker"), {'Docker', 'docker'})
+        self.assertEqual(matcher.skills, ['Docker', 'docker'])
+
+    def test_transition_table_stays_bounded(self):
+        # Characters outside every pattern, right after states deep in the trie
+        text = "".join(f"machine learnin{chr(code)}" for code in range(0x4E00, 0x5E00))
+        entries = sum(len(transitions) for transitions in self.matcher._delta)
+        self.matcher.find(text)
+        self.assertLess(sum(len(transitions) for transitions in self.matcher._delta), entries + 50)
+        self.assertEqual(self.matcher.find("\u3000python\u3001"), {'Python'})
+
+
+if __name__ == '__main__':
+    unittest.main()
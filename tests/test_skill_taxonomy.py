@@ -0,0 +1,119 @@
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from resume_parser import extract_skills
+from skill_taxonomy import (
+    DEFAULT_SKILLS_FILE, Skill, SkillTaxonomy, SkillTaxonomyError, TaxonomyRegistry
+)
+
+
+class SkillTaxonomyTester(unittest.TestCase):
+    """Tests for canonical skill IDs, aliases and taxonomy reloads"""
+
+    def setUp(self):
+        self.taxonomy = SkillTaxonomy([
+            Skill('python', 'Python'),
+            Skill('go', 'Go', aliases=('Golang',)),
+            Skill('vue-js', 'Vue.js', aliases=('Vue',)),
+            Skill('kubernetes', 'Kubernetes', aliases=('K8s',)),
+        ])
+
+    def test_aliases_resolve_to_canonical_ids(self):
+        self.assertEqual(self.taxonomy.canonical_id('golang'), 'go')
+        self.assertEqual(self.taxonomy.canonical_id(' VUE '), 'vue-js')
+        self.assertEqual(self.taxonomy.canonical_name('k8s'), 'Kubernetes')
+        self.assertIsNone(self.taxonomy.canonical_id('Cobol'))
+        self.assertEqual(self.taxonomy.skill_key('Cobol '), 'cobol')
+
+    def test_find_reports_canonical_skills_in_taxonomy_order(self):
+        found = self.taxonomy.find("deployed vue and golang services on k8s with python")
+        self.assertEqual([skill.id for skill in found], ['python', 'go', 'vue-js', 'kubernetes'])
+
+    def test_find_reports_each_skill_once(self):
+        found = self.taxonomy.find("vue.js, vue and more vue")
+        self.assertEqual([skill.id for skill in found], ['vue-js'])
+
+    def test_rejects_duplicate_ids_and_shared_aliases(self):
+        with self.assertRaises(SkillTaxonomyError):
+            SkillTaxonomy([Skill('go', 'Go'), Skill('go', 'Golang')])
+        with self.assertRaises(SkillTaxonomyError):
+            SkillTaxonomy([Skill('vue-js', 'Vue.js', aliases=('Vue',)), Skill('vue', 'Vue')])
+
+    def test_shipped_skills_file_loads(self):
+        taxonomy = SkillTaxonomy.from_file(DEFAULT_SKILLS_FILE)
+        self.assertEqual(taxonomy.canonical_name('Tailwind'), 'Tailwind CSS')
+        self.assertEqual(taxonomy.canonical_name('Express'), 'Express.js')
+        self.assertEqual(taxonomy.names.count('Microservices'), 1)
+
+    def test_extract_skills_uses_canonical_names(self):
+        skills = extract_skills("Built SPAs with Vue and Express, styled with Tailwind")
+        self.assertIn('Vue.js', skills)
+        self.assertIn('Express.js', skills)
+        self.assertIn('Tailwind CSS', skills)
+        self.assertNotIn('Vue', skills)
+
+
+class TaxonomyRegistryTester(unittest.TestCase):
+    """Tests for hot reloading the skills file"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name) / 'skills.json'
+        self.write({'version': 1, 'skills': [{'id': 'python', 'name': 'Python'}]})
+        self.registry = TaxonomyRegistry(self.path, check_interval=0)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write(self, data, mtime=None):
+        self.path.write_text(json.dumps(data) if not isinstance(data, str) else data)
+        if mtime is not None:
+            os.utime(self.path, (mtime, mtime))
+
+    def test_changed_file_is_picked_up(self):
+        old = self.registry.get()
+        self.write({'version': 2, 'skills': [
+            {'id': 'python', 'name': 'Python'},
+            {'id': 'rust', 'name': 'Rust'},
+        ]}, mtime=self.path.stat().st_mtime + 10)
+
+        # The new file is loaded in the background; get() never builds it
+        self.assertIs(self.registry.get(), old)
+        self.registry._loading.join()
+        taxonomy = self.registry.get()
+        self.assertIsNot(taxonomy, old)
+        self.assertEqual(taxonomy.version, '2')
+        self.assertEqual([skill.id for skill in taxonomy.find("python and rust")], ['python', 'rust'])
+        self.assertNotEqual(taxonomy.checksum, old.checksum)
+
+    def test_broken_file_keeps_current_taxonomy(self):
+        old = self.registry.get()
+        self.write('{"skills": [', mtime=self.path.stat().st_mtime + 10)
+
+        self.assertIs(self.registry.get(), old)
+        self.registry._loading.join()
+        self.assertIs(self.registry.get(), old)
+        with self.assertRaises(SkillTaxonomyError):
+            self.registry.reload()
+        self.assertIs(self.registry.get(), old)
+
+    def test_file_is_built_once_per_change(self):
+        self.write({'version': 2, 'skills': [{'id': 'rust', 'name': 'Rust'}]}, mtime=self.path.stat().st_mtime + 10)
+        with mock.patch.object(SkillTaxonomy, 'from_file', wraps=SkillTaxonomy.from_file) as from_file:
+            # A get() during an explicit reload neither waits nor builds again
+            with self.registry._lock:
+                self.registry.get()
+                self.assertIsNone(self.registry._loading)
+            self.registry.reload()
+            self.registry.get()
+            self.assertIsNone(self.registry._loading)
+        self.assertEqual(from_file.call_count, 1)
+        self.assertEqual(self.registry.get().version, '2')
+
+
+if __name__ == '__main__':
+    unittest.main()